@@ -0,0 +1,151 @@
+# benchmarks/__main__.py
+"""
+Benchmark suite for the robot engine, parser and renderers.
+
+Run from the repository root:
+
+    python -m benchmarks                       # print results
+    python -m benchmarks --save baseline.json  # record a baseline
+    python -m benchmarks --compare baseline.json [--tolerance 0.15]
+
+``--compare`` exits with status 1 if any benchmark got slower than the
+tolerance allows.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+from src.robot import Robot
+from src.engine import DEFAULT_TABLE, OPCODES
+from src.basic import print_table
+from src.web_grid import build_grid_html, build_title_bar_html
+from src.command_parser import Parser, parse
+
+from .harness import measure, save_baseline, load_baseline, compare
+
+COMMANDS = ["MOVE", "MOVE", "LEFT", "MOVE", "RIGHT", "RIGHT", "MOVE", "LEFT"] * 125
+LINES = ["PLACE 1,2,EAST", "MOVE", "left", "RIGHT ", "REPORT"] * 200
+
+
+def bench_robot_commands():
+    robot = Robot()
+    robot.place(2, 2, "NORTH")
+    calls = [getattr(robot, cmd.lower()) for cmd in COMMANDS]
+
+    def run():
+        for call in calls:
+            call()
+    return run
+
+
+def bench_table_commands():
+    ops = [OPCODES[cmd] for cmd in COMMANDS]
+    start = DEFAULT_TABLE.place(0, 2, 2, "NORTH")
+    return lambda: DEFAULT_TABLE.run(ops, start)
+
+
+def bench_parse_line():
+    # One line per feed(), as the interactive REPL parses its input
+    lines = [line.encode() + b"\n" for line in LINES]
+
+    def run():
+        feed = Parser().feed
+        for line in lines:
+            feed(line)
+    return run
+
+
+def bench_parse_buffer():
+    data = "\n".join(LINES).encode()
+    return lambda: parse(data)
+
+
+def bench_print_table():
+    robot = Robot()
+    robot.place(3, 1, "WEST")
+    sink = io.StringIO()
+
+    def run():
+        sink.seek(0)
+        sink.truncate()
+        with contextlib.redirect_stdout(sink):
+            print_table(robot)
+    return run
+
+
+def bench_grid_html():
+    robot = Robot()
+    robot.place(3, 1, "WEST")
+    return lambda: build_grid_html(robot, True)
+
+
+def bench_title_bar_html():
+    # What web_app.py paid on every rerun before the result was cached
+    logo_path = os.path.join(os.path.dirname(__file__), "..", "assets", "logo.png")
+    return lambda: build_title_bar_html(logo_path)
+
+
+# name -> (factory returning the timed callable, operations per call)
+BENCHMARKS = {
+    "robot.commands": (bench_robot_commands, len(COMMANDS)),
+    "engine.table_commands": (bench_table_commands, len(COMMANDS)),
+    "command_parser.feed_line": (bench_parse_line, len(LINES)),
+    "command_parser.parse": (bench_parse_buffer, len(LINES)),
+    "basic.print_table": (bench_print_table, 1),
+    "web_grid.build_grid_html": (bench_grid_html, 1),
+    "web_grid.build_title_bar_html": (bench_title_bar_html, 1),
+}
+
+
+def run_suite(names=None, repeat=7, min_time=0.2):
+    """
+    Run the selected benchmarks and return ``{name: stats}`` per operation.
+
+    :param min_time: Seconds per repetition (see ``harness.measure``)
+    """
+    results = {}
+    for name, (factory, ops) in BENCHMARKS.items():
+        if names and not any(pattern in name for pattern in names):
+            continue
+        stats = measure(factory(), repeat=repeat, min_time=min_time)
+        stats["best_ns"] /= ops
+        stats["median_ns"] /= ops
+        results[name] = stats
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Rover simulator benchmarks")
+    parser.add_argument("names", nargs="*", help="only run benchmarks containing these substrings")
+    parser.add_argument("--repeat", type=int, default=7, help="repetitions per benchmark")
+    parser.add_argument("--save", metavar="FILE", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed slowdown before --compare fails (default 0.15)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.names, args.repeat)
+    print(f"{'benchmark':<28}{'best ns/op':>14}{'median ns/op':>16}")
+    for name, stats in results.items():
+        print(f"{name:<28}{stats['best_ns']:>14,.1f}{stats['median_ns']:>16,.1f}")
+
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        rows, regressions = compare(results, load_baseline(args.compare), args.tolerance)
+        print(f"\n{'benchmark':<28}{'baseline':>12}{'current':>12}{'ratio':>9}")
+        for name, base_ns, cur_ns, ratio in rows:
+            flag = "  REGRESSION" if name in regressions else ""
+            print(f"{name:<28}{base_ns:>12,.1f}{cur_ns:>12,.1f}{ratio:>9.2f}{flag}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+# benchmarks/bench_engine.py
+"""
+Commands/sec of ``Robot`` versus the transition-table engine.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_engine
+"""
+import random
+import time
+
+from src.robot import Robot
+from src.engine import TableRobot, DEFAULT_TABLE, OPCODES
+
+N_COMMANDS = 200_000
+
+
+def make_commands(n, seed=42):
+    rng = random.Random(seed)
+    return [rng.choice(("MOVE", "MOVE", "LEFT", "RIGHT")) for _ in range(n)]
+
+
+def drive(robot, commands):
+    robot.place(0, 0, "NORTH")
+    calls = {"MOVE": robot.move, "LEFT": robot.left, "RIGHT": robot.right}
+    start = time.perf_counter()
+    for cmd in commands:
+        calls[cmd]()
+    return time.perf_counter() - start
+
+
+def drive_table(commands):
+    ops = [OPCODES[cmd] for cmd in commands]
+    state = DEFAULT_TABLE.place(0, 0, 0, "NORTH")
+    start = time.perf_counter()
+    DEFAULT_TABLE.run(ops, state)
+    return time.perf_counter() - start
+
+
+def main():
+    commands = make_commands(N_COMMANDS)
+    results = [
+        ("Robot", drive(Robot(), commands)),
+        ("TableRobot", drive(TableRobot(), commands)),
+        ("TransitionTable.run", drive_table(commands)),
+    ]
+    base = results[0][1]
+    for name, elapsed in results:
+        print(f"{name:<22}{N_COMMANDS / elapsed:>14,.0f} cmd/s   x{base / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# benchmarks/bench_memory.py
+"""
+Per-instance memory of placed robots, measured with ``tracemalloc``.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory
+"""
+import tracemalloc
+
+from src.robot import Robot
+from src.engine import TableRobot
+
+N_INSTANCES = 100_000
+
+
+def bytes_per_instance(factory, n=N_INSTANCES):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        robots = [factory() for _ in range(n)]
+        for robot in robots:
+            robot.place(1, 2, "NORTH")
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # The list holding the instances costs 8 bytes per slot; leave it out
+    return (after - before) / n - 8
+
+
+def main():
+    for name, factory in (("Robot", Robot), ("TableRobot", TableRobot)):
+        print(f"{name:<12}{bytes_per_instance(factory):>8.1f} bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
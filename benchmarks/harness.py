@@ -0,0 +1,78 @@
+# benchmarks/harness.py
+"""
+Minimal stdlib benchmark harness: timing, JSON baselines and comparison.
+"""
+import json
+import platform
+import statistics
+import sys
+import timeit
+
+
+def measure(func, repeat=7, min_time=0.2):
+    """
+    Time ``func()`` and return per-call statistics in nanoseconds.
+
+    The loop count is calibrated so one repetition takes at least
+    ``min_time`` seconds; the best repetition is the headline figure because
+    it is the least disturbed by other load on the machine. ``min_time=0``
+    skips calibration and runs one loop per repetition (smoke tests).
+
+    :return: Dict with ``best_ns``, ``median_ns``, ``loops`` and ``repeat``
+    """
+    timer = timeit.Timer(func)
+    loops = 1
+    if min_time > 0:
+        loops, elapsed = timer.autorange()
+        if elapsed < min_time:
+            loops = max(1, int(loops * min_time / max(elapsed, 1e-9)))
+    runs = [t / loops * 1e9 for t in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        "best_ns": min(runs),
+        "median_ns": statistics.median(runs),
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def environment():
+    """Describe the interpreter/machine a result set was measured on."""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def save_baseline(path, results):
+    """Write ``results`` plus the environment description as JSON."""
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"environment": environment(), "results": results}, fh,
+                  indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    """Read the ``results`` mapping from a baseline written by :func:`save_baseline`."""
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)["results"]
+
+
+def compare(results, baseline, tolerance=0.10):
+    """
+    Compare ``results`` against ``baseline`` on ``best_ns``.
+
+    :param tolerance: Allowed slowdown as a fraction (0.10 = 10 %)
+    :return: List of ``(name, baseline_ns, current_ns, ratio)`` for every
+             benchmark present in both, and the names that regressed
+    """
+    rows, regressions = [], []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        base_ns = baseline[name]["best_ns"]
+        ratio = current["best_ns"] / base_ns
+        rows.append((name, base_ns, current["best_ns"], ratio))
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+    return rows, regressions
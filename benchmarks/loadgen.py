@@ -0,0 +1,94 @@
+# benchmarks/loadgen.py
+"""
+Local load generator for ``src/server.py``.
+
+Opens many concurrent client connections, each sending pipelined batches of
+commands that end with ``REPORT`` and timing the round trip to the REPORT
+reply. Prints aggregate commands/sec and p50/p99 batch latency.
+
+Run from the repository root (``--spawn`` starts an in-process server):
+
+    python -m benchmarks.loadgen --spawn --clients 10000 --duration 10
+
+10k clients need ``ulimit -n`` above 20k when client and server share a box.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from src.server import RoverServer, DEFAULT_PORT
+
+COMMANDS = (b"MOVE\n", b"LEFT\n", b"RIGHT\n", b"MOVE\n")
+
+
+async def client(host, port, pipeline, deadline, latencies, counts, seed, connecting):
+    rng = random.Random(seed)
+    async with connecting:
+        reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(b"PLACE 2,2,NORTH\n")
+        while time.perf_counter() < deadline:
+            batch = b"".join(rng.choice(COMMANDS) for _ in range(pipeline - 1)) + b"REPORT\n"
+            start = time.perf_counter()
+            writer.write(batch)
+            await reader.readline()
+            latencies.append(time.perf_counter() - start)
+            counts[0] += pipeline
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return float("nan")
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+async def run(args):
+    server = None
+    host, port = args.host, args.port
+    if args.spawn:
+        server = RoverServer()
+        host, port = await server.start(host, 0)
+
+    latencies, counts = [], [0]
+    deadline = time.perf_counter() + args.duration
+    connecting = asyncio.Semaphore(args.connect_rate)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(client(host, port, args.pipeline, deadline, latencies, counts, i, connecting)
+          for i in range(args.clients)),
+        return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    failures = sum(1 for r in results if isinstance(r, Exception))
+    if server is not None:
+        await server.close()
+
+    latencies.sort()
+    print(f"clients            {args.clients} ({failures} failed)")
+    print(f"pipeline depth     {args.pipeline}")
+    print(f"commands/sec       {counts[0] / elapsed:,.0f}")
+    print(f"batch p50 latency  {percentile(latencies, 0.50) * 1e3:.2f} ms")
+    print(f"batch p99 latency  {percentile(latencies, 0.99) * 1e3:.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadgen",
+                                     description="Load generator for the rover server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--spawn", action="store_true",
+                        help="start a server in this process on a free port")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--pipeline", type=int, default=32,
+                        help="commands per batch, the last one is REPORT")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds")
+    parser.add_argument("--connect-rate", type=int, default=512,
+                        help="concurrent connection attempts")
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+# src/analytics.py
+"""
+Coverage statistics over many rover runs: where rovers stand, which way
+they face, and how often a MOVE is ignored because of an edge or obstacle.
+
+Runs come in as parsed command streams (``command_parser.Program``) or as
+recorded journals (``journal.py``). Either way the per-step states end up
+in a flat integer array that is folded into NumPy counters with
+``np.bincount``; no per-step Python objects are created. Journals are read
+straight from their ``mmap`` as a structured array, so they need no Python
+loop at all. Programs are stepped into an ``array('I')`` of state ids
+first: through the engine's transition table on boards small enough to
+build one, otherwise by computing each next state from ``DELTAS`` and
+``Board.is_open``.
+
+Every command is one step. After each step a placed rover adds one visit
+to its cell and one to its heading::
+
+    python analytics.py missions/*.txt session.rovj
+"""
+from array import array
+
+import numpy as np
+
+try:
+    from .robot import DIRECTIONS, DELTAS
+    from .board import Board
+    from .engine import TransitionTable, MOVE, LEFT, RIGHT, PLACE, EXIT, UNPLACED
+    from .journal import HEADER, RECORD, MAGIC, IGNORED, NO_HEADING, _read_header
+except ImportError:  # executed as a script from src/
+    from robot import DIRECTIONS, DELTAS
+    from board import Board
+    from engine import TransitionTable, MOVE, LEFT, RIGHT, PLACE, EXIT, UNPLACED
+    from journal import HEADER, RECORD, MAGIC, IGNORED, NO_HEADING, _read_header
+
+# Journal records as a NumPy structured type (same layout as RECORD, "<BBHH")
+RECORD_DTYPE = np.dtype([("op", "u1"), ("heading", "u1"), ("x", "<u2"), ("y", "<u2")])
+
+# Largest board, in engine states, stepped through a transition table;
+# building one costs ~20 µs per state, so bigger boards step arithmetically
+MAX_TABLE_STATES = 1 << 16
+
+# Records folded in per slice, to bound temporary arrays on huge journals
+JOURNAL_SLICE = 1 << 22
+
+# Heatmap shading: unvisited, then least to most visited
+SHADES = "·░▒▓█"
+
+# Largest number of heatmap cells per side; bigger boards are binned
+HEATMAP_CELLS = 15
+
+
+def trajectory(program, table, state=UNPLACED):
+    """
+    State id after each command of ``program``, up to (not including) EXIT.
+
+    :param table: ``TransitionTable`` for the board
+    :return: ``array('I')``, one state id per command
+    """
+    next_state = table.next_state
+    args = program.args
+    out = array('I')
+    append = out.append
+    i = 0
+    for op in program.ops:
+        if op == PLACE:
+            state = table.place(state, args[i], args[i + 1], args[i + 2])
+            i += 3
+        elif op == EXIT:
+            break
+        else:
+            state = next_state[op][state]
+        append(state)
+    return out
+
+
+def walk(program, board, state=UNPLACED):
+    """
+    Same as :func:`trajectory`, computing each state from ``DELTAS`` and
+    ``board.is_open`` instead of a transition table (any board size).
+
+    :param board: ``board.Board``
+    """
+    width, is_open = board.width, board.is_open
+    args = program.args
+    out = array('I')
+    append = out.append
+    i = 0
+    for op in program.ops:
+        if op == PLACE:
+            x, y, h = args[i], args[i + 1], args[i + 2]
+            i += 3
+            if h >= 0 and is_open(x, y):
+                state = 1 + ((y * width + x) << 2 | h)
+        elif op == EXIT:
+            break
+        elif state != UNPLACED:
+            h = (state - 1) & 3
+            if op == MOVE:
+                y, x = divmod((state - 1) >> 2, width)
+                dx, dy = DELTAS[h]
+                if is_open(x + dx, y + dy):
+                    state += (dy * width + dx) << 2
+            elif op == LEFT:
+                state += (h - 1) % 4 - h
+            elif op == RIGHT:
+                state += (h + 1) % 4 - h
+        append(state)
+    return out
+
+
+class Coverage:
+    """
+    Accumulated visit counts for one board.
+
+    :ivar visits: ``(height, width)`` int64 array of placed steps per cell,
+                  row 0 at the bottom
+    :ivar headings: int64 array of placed steps per heading, indexed like
+                    ``DIRECTIONS``
+    :ivar blocked_moves: MOVEs by a placed rover that were ignored (edge or
+                         blocked cell)
+    :ivar unplaced_steps: Steps that ended with the rover still unplaced
+    :ivar steps: All steps seen
+    :ivar runs: Programs and journals added
+    """
+
+    def __init__(self, board=None):
+        """:param board: ``board.Board`` (default: open 5x5)"""
+        self.board = board or Board()
+        self.width, self.height = self.board.width, self.board.height
+        self._table = None
+        self.visits = np.zeros((self.height, self.width), dtype=np.int64)
+        self.headings = np.zeros(4, dtype=np.int64)
+        self.blocked_moves = 0
+        self.unplaced_steps = 0
+        self.steps = 0
+        self.runs = 0
+
+    @property
+    def table(self):
+        """
+        Transition table for the board, built on first use; None for boards
+        over ``MAX_TABLE_STATES``.
+        """
+        if self._table is None and 1 + 4 * self.width * self.height <= MAX_TABLE_STATES:
+            self._table = TransitionTable(board=self.board)
+        return self._table
+
+    # -- accumulation --
+
+    def add_states(self, states, ops, start=UNPLACED):
+        """
+        Fold in one run given as state ids and the opcodes that produced them.
+
+        :param states: Buffer or array of state ids, one per step
+        :param ops: Buffer or array of opcodes, at least as long as ``states``
+        :param start: State before the first step
+        """
+        states = np.asarray(states, dtype=np.int64)
+        if not len(states):
+            return
+        ops = np.asarray(ops, dtype=np.uint8)[:len(states)]
+        before = np.empty_like(states)
+        before[0] = start
+        before[1:] = states[:-1]
+        placed = states[states != UNPLACED] - 1
+        self._fold(placed >> 2, placed & 3)
+        self.blocked_moves += int(np.count_nonzero((ops == MOVE) & (states == before)
+                                                   & (before != UNPLACED)))
+        self.unplaced_steps += len(states) - len(placed)
+        self.steps += len(states)
+
+    def add_program(self, program):
+        """Fold in one run of ``program`` by a fresh, unplaced rover."""
+        table = self.table
+        states = trajectory(program, table) if table is not None else walk(program, self.board)
+        self.add_states(np.frombuffer(states, dtype=np.uint32),
+                        np.frombuffer(program.ops, dtype=np.uint8))
+        self.runs += 1
+
+    def add_journal(self, source):
+        """
+        Fold in a recorded journal, read through ``mmap`` in slices.
+
+        :param source: Journal path, or the journal's bytes
+        :raises journal.JournalError: If it is not a journal
+        :raises ValueError: If it was recorded on a board of another size
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self._add_records(memoryview(source), "<bytes>")
+        else:
+            import mmap
+            with open(source, "rb") as fh, \
+                    mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                self._add_records(data, source)
+        self.runs += 1
+
+    def _add_records(self, data, name):
+        width, height = _read_header(bytes(data[:HEADER.size]), name)
+        if (width, height) != (self.width, self.height):
+            raise ValueError(f"{name}: recorded on {width}x{height}, "
+                             f"not {self.width}x{self.height}")
+        count = (len(data) - HEADER.size) // RECORD.size   # ignores a torn record
+        for start in range(0, count, JOURNAL_SLICE):
+            n = min(JOURNAL_SLICE, count - start)
+            records = np.frombuffer(data, dtype=RECORD_DTYPE, count=n,
+                                    offset=HEADER.size + start * RECORD.size)
+            heading = records["heading"]
+            placed = heading != NO_HEADING
+            cells = (records["y"][placed].astype(np.int64) * width
+                     + records["x"][placed])
+            self._fold(cells, heading[placed])
+            self.blocked_moves += int(np.count_nonzero((records["op"] == MOVE | IGNORED) & placed))
+            self.unplaced_steps += n - len(cells)
+            self.steps += n
+            del records, heading, placed, cells   # release the mmap export
+
+    def _fold(self, cells, headings):
+        self.visits += np.bincount(cells, minlength=self.width * self.height).reshape(
+            self.height, self.width)
+        self.headings += np.bincount(headings, minlength=4)
+
+    def merge(self, other):
+        """Add the counts of another ``Coverage`` on a board of the same size."""
+        if (other.width, other.height) != (self.width, self.height):
+            raise ValueError("coverage boards differ in size")
+        self.visits += other.visits
+        self.headings += other.headings
+        for name in ("blocked_moves", "unplaced_steps", "steps", "runs"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    # -- summaries --
+
+    def heading_share(self):
+        """``{direction: fraction of placed steps}``."""
+        total = int(self.headings.sum())
+        return {f: (int(n) / total if total else 0.0) for f, n in zip(DIRECTIONS, self.headings)}
+
+    def cells_visited(self):
+        """Number of cells the rover stood on at least once."""
+        return int(np.count_nonzero(self.visits))
+
+
+def heatmap(coverage, max_cells=HEATMAP_CELLS):
+    """
+    Render visit counts as an ASCII heatmap in the style of
+    ``basic.print_table``.
+
+    Boards wider or taller than ``max_cells`` are binned into blocks so the
+    whole board fits; each block shows the sum of its cells. Blocked cells
+    show as ``#`` when not binned.
+    """
+    visits = coverage.visits
+    height, width = visits.shape
+    bx, by = -(-width // max_cells), -(-height // max_cells)   # block size (ceil)
+    cols, rows = -(-width // bx), -(-height // by)
+    binned = np.add.reduceat(np.add.reduceat(visits, np.arange(0, height, by), axis=0),
+                             np.arange(0, width, bx), axis=1)
+    peak = int(binned.max())
+    levels = len(SHADES) - 1
+    board = coverage.board
+    blocked = board.is_blocked if board.blocked_count and bx == by == 1 else None
+    inner = 5 * cols + 1
+
+    lines = ["", "═" * (inner + 2),
+             "║" + " ROVER COVERAGE ".center(inner, "░") + "║",
+             "═" * (inner + 2)]
+    for row in range(rows - 1, -1, -1):   # top row first
+        cells = []
+        for col in range(cols):
+            n = int(binned[row, col])
+            if blocked and blocked(col, row):
+                glyph = "#"
+            elif not n:
+                glyph = SHADES[0]
+            else:
+                # Any visit shows at least the faintest shade
+                glyph = SHADES[max(1, -(-n * levels // peak))] * 2
+            cells.append(glyph)
+        lines.append("║ " + " ".join(cell.center(4) for cell in cells) + " ║")
+    lines.append("╘" + "═" * inner + "╛")
+
+    scale = f"{bx}x{by} cells per block, " if bx * by > 1 else ""
+    lines.append(f"{scale}peak {peak:,} visits, {coverage.cells_visited():,}/"
+                 f"{width * height:,} cells visited")
+    shares = coverage.heading_share()
+    lines.append("headings: " + "  ".join(f"{f[0]} {shares[f]:.1%}" for f in DIRECTIONS))
+    lines.append(f"{coverage.steps:,} steps in {coverage.runs:,} runs, "
+                 f"{coverage.blocked_moves:,} blocked MOVEs, "
+                 f"{coverage.unplaced_steps:,} steps unplaced")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    import argparse
+
+    try:
+        from .command_parser import parse_file
+    except ImportError:  # executed as a script from src/
+        from command_parser import parse_file
+
+    parser = argparse.ArgumentParser(description="Coverage heatmap over command files and journals")
+    parser.add_argument("files", nargs="+", help="command scripts and/or journals")
+    parser.add_argument("--size", metavar="WxH", default="5x5", help="board size (default 5x5)")
+    args = parser.parse_args(argv)
+
+    try:
+        width, _, height = args.size.lower().partition("x")
+        coverage = Coverage(Board(int(width), int(height)))
+    except ValueError as e:
+        parser.error(f"invalid board: {e}")
+    for path in args.files:
+        with open(path, "rb") as fh:
+            is_journal = fh.read(len(MAGIC)) == MAGIC
+        if is_journal:
+            coverage.add_journal(path)
+        else:
+            coverage.add_program(parse_file(path))
+    print(heatmap(coverage))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# src/animation.py
+"""
+One frame clock for every canvas animation in the Tk GUI.
+
+Animations register a ``step(elapsed_ms)`` callback with a
+:class:`FrameScheduler` and are all advanced from a single ``root.after``
+timer. Registering under a key replaces whatever was running under that key,
+so re-triggering an effect never stacks timer loops. A step that only
+changes now and then returns when it next needs a frame, and the timer
+sleeps until the earliest such deadline instead of ticking at the frame
+rate; when nothing is animating the scheduler stops its timer altogether.
+"""
+import itertools
+import math
+import time
+
+try:
+    from .robot import DIRECTIONS
+    from .engine import MOVE, LEFT, RIGHT, REPORT, PLACE, EXIT
+except ImportError:  # executed as a script from src/
+    from robot import DIRECTIONS
+    from engine import MOVE, LEFT, RIGHT, REPORT, PLACE, EXIT
+
+DEFAULT_FPS = 60
+
+# Commands a replay executes per frame before handing control back to Tk
+# (~5 ms of a 16 ms frame at roughly 4M commands/s)
+REPLAY_STEPS_PER_FRAME = 20000
+
+
+class FrameScheduler:
+    """
+    Drives registered animations from one ``after`` loop.
+
+    :ivar frames: Number of ticks run so far
+    """
+
+    def __init__(self, root, fps=DEFAULT_FPS, clock=time.perf_counter):
+        """
+        :param root: Any widget with ``after``/``after_cancel`` (usually Tk)
+        :param fps: Target frame rate; one tick every ``1000 / fps`` ms
+        :param clock: Seconds as a float, replaceable for tests
+        """
+        self.root = root
+        self.interval = max(1, round(1000 / fps))
+        self.clock = clock
+        self.frames = 0
+        self._animations = {}  # key -> [step, start time, next due time]
+        self._after_id = None
+        self._wake = None      # clock time the pending timer fires
+        self._next_key = 0
+
+    def __len__(self):
+        return len(self._animations)
+
+    def __contains__(self, key):
+        return key in self._animations
+
+    def add(self, step, key=None):
+        """
+        Start an animation on the next frame.
+
+        :param step: Called with the milliseconds since it was added. Return
+                     False to finish, a number of milliseconds (on the same
+                     scale) to skip frames until then, or anything else to
+                     run again next frame
+        :param key: Replace the animation already registered under ``key``
+        :return: The key, for :meth:`cancel`
+        """
+        if key is None:
+            key = self._next_key
+            self._next_key += 1
+        now = self.clock()
+        self._animations[key] = [step, now, now]
+        if self._after_id is None or self._wake > now + self.interval / 1000:
+            self._stop()
+            self._schedule(self.interval)
+        return key
+
+    def cancel(self, key):
+        """Stop an animation; unknown keys are ignored."""
+        self._animations.pop(key, None)
+        if not self._animations:
+            self._stop()
+
+    def close(self):
+        """Cancel every animation and the timer."""
+        self._animations.clear()
+        self._stop()
+
+    def _stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _schedule(self, ms):
+        self._wake = self.clock() + ms / 1000
+        self._after_id = self.root.after(ms, self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        start = self.clock()
+        self.frames += 1
+        for key, entry in list(self._animations.items()):
+            step, added, due = entry
+            if due > start:
+                continue
+            result = step((start - added) * 1000)
+            if self._animations.get(key) is not entry:
+                continue   # replaced or cancelled by the step itself
+            if result is False:
+                del self._animations[key]
+            elif result is True or not isinstance(result, (int, float)):
+                entry[2] = start
+            else:
+                entry[2] = added + result / 1000
+        if self._animations and self._after_id is None:
+            # Keep a steady frame rate: this tick's own cost comes out of the
+            # wait, unless nothing is due before a later deadline
+            now = self.clock()
+            due = min(entry[2] for entry in self._animations.values())
+            self._schedule(max(1, round(self.interval - (now - start) * 1000),
+                               math.ceil((due - now) * 1000)))
+
+
+class Bounce:
+    """
+    Lift a canvas item by ``height`` pixels for the first half of every
+    ``period`` ms and put it back for the second half.
+
+    Each call returns the time of the next change, so an idle bounce costs
+    the scheduler two frames per period.
+    """
+
+    def __init__(self, canvas, item, height=2, period=1200):
+        self.canvas = canvas
+        self.item = item
+        self.height = height
+        self.period = period
+        self.offset = 0
+
+    def __call__(self, elapsed):
+        half = self.period / 2
+        offset = -self.height if elapsed % self.period < half else 0
+        if offset != self.offset:
+            self.canvas.move(self.item, 0, offset - self.offset)
+            self.offset = offset
+        return (elapsed // half + 1) * half
+
+
+class Replay:
+    """
+    Play a parsed ``command_parser.Program`` on a robot, ``per_frame``
+    commands per scheduler frame, so the GUI stays responsive and redraws
+    once per frame rather than once per command.
+
+    :ivar done: Commands executed so far
+    :ivar last_report: Most recent successful REPORT, or None
+    """
+
+    def __init__(self, program, robot, per_frame=REPLAY_STEPS_PER_FRAME, on_frame=None):
+        """
+        :param on_frame: Called as ``on_frame(replay, finished)`` after each
+                         frame's batch, e.g. to redraw the canvas
+        """
+        self.robot = robot
+        self.total = len(program)
+        self.per_frame = per_frame
+        self.on_frame = on_frame
+        self.done = 0
+        self.last_report = None
+        self._ops = iter(program)
+
+    def __call__(self, elapsed):
+        robot = self.robot
+        count = 0
+        finished = False
+        for op, args in itertools.islice(self._ops, self.per_frame):
+            count += 1
+            if op == MOVE:
+                robot.move()
+            elif op == LEFT:
+                robot.left()
+            elif op == RIGHT:
+                robot.right()
+            elif op == REPORT:
+                self.last_report = robot.report() or self.last_report
+            elif op == PLACE:
+                x, y, h = args
+                robot.place(x, y, DIRECTIONS[h] if h >= 0 else None)
+            elif op == EXIT:
+                finished = True
+                break
+        self.done += count
+        finished = finished or count < self.per_frame or self.done == self.total
+        if self.on_frame is not None:
+            self.on_frame(self, finished)
+        return not finished
@@ -20,95 +20,342 @@
 # =========================== Copyright Header ===========================
 
 import sys
-import os
-from robot import Robot
+import time
+
+try:
+    from .robot import Robot, DIRECTIONS
+    from .board import Board, load_board, viewport
+    from .engine import OPCODES, MOVE, LEFT, RIGHT, REPORT, PLACE, EXIT
+    from .command_parser import Parser, run
+except ImportError:  # executed as a script from src/
+    from robot import Robot, DIRECTIONS
+    from board import Board, load_board, viewport
+    from engine import OPCODES, MOVE, LEFT, RIGHT, REPORT, PLACE, EXIT
+    from command_parser import Parser, run
+
+# Read/write buffer used by the batch runner (1 MiB)
+BATCH_BUFFER_SIZE = 1 << 20
+
+# Opcode -> lower-case command name, used to label REPL latency samples
+COMMAND_NAMES = {op: name.lower() for name, op in OPCODES.items()}
+
+USAGE = "PLACE X,Y,F | MOVE | LEFT | RIGHT | REPORT | EXIT"
+
+# Largest number of cells printed per side; bigger boards show a window
+# around the rover
+PRINT_VIEWPORT = 15
 
 # ----------------------------------------------------------------------
-# Helper: pretty-print the 5×5 table with the rover (or empty)
+# Helper: pretty-print the board with the rover (or empty)
 # ----------------------------------------------------------------------
 def print_table(robot: Robot):
+    board = robot.board
+    cols, rows = min(board.width, PRINT_VIEWPORT), min(board.height, PRINT_VIEWPORT)
+    placed = robot.x is not None and robot.y is not None
+    x0 = viewport(board.width, robot.x, cols) if placed else 0
+    y0 = viewport(board.height, robot.y, rows) if placed else 0
+    inner = 5 * cols + 1
+
     # Title – "cellular" style
-    print("\n" + "═" * 28)
-    print("║" + " CELLULAR ORIGINS ROVER ".center(26, "░") + "║")
-    print("═" * 28)
+    print("\n" + "═" * (inner + 2))
+    print("║" + " CELLULAR ORIGINS ROVER ".center(inner, "░") + "║")
+    print("═" * (inner + 2))
 
-    # Build grid
-    grid = [["·" for _ in range(5)] for _ in range(5)]
-    if robot.x is not None and robot.y is not None:
-        # y-axis is flipped for display (0,0 at top-left)
-        grid[4 - robot.y][robot.x] = robot.f[0]   # N,E,S,W
+    # Build grid, top row first; '#' marks a blocked cell
+    blocked = board.is_blocked if board.blocked_count else None
+    grid = [["#" if blocked and blocked(x, y) else "·" for x in range(x0, x0 + cols)]
+            for y in range(y0 + rows - 1, y0 - 1, -1)]
+    if placed:
+        # y-axis is flipped for display (0,0 at bottom-left)
+        grid[y0 + rows - 1 - robot.y][robot.x - x0] = robot.f[0]   # N,E,S,W
 
     # Print rows
     for row in grid:
         print("║ " + " ".join(cell.center(4) for cell in row) + " ║")
-    print("╘" + "═" * 26 + "╛\n")
+    print("╘" + "═" * inner + "╛\n")
+
+# ----------------------------------------------------------------------
+# Batch runner: stream commands, no table rendering
+# ----------------------------------------------------------------------
+def run_script(stream, out, sink=None, board=None, latency=None):
+    """
+    Execute every command line from ``stream`` against a fresh Robot.
+
+    The stream is read ``BATCH_BUFFER_SIZE`` bytes at a time and tokenized
+    by ``command_parser``. Nothing is rendered; only successful REPORTs are
+    written to ``out`` as ``X,Y,F`` lines. Invalid lines are counted and
+    skipped, ``EXIT`` stops the run.
+
+    :param stream: Binary file object
+    :param out: Binary file object receiving the REPORT lines
+    :param sink: Optional robot event sink (see ``events.py``)
+    :param board: Optional ``board.Board`` (default: open 5x5)
+    :param latency: Optional ``profiling.LatencyRecorder``; records the
+                    parse and run time of each chunk (not each command,
+                    which would cost more than the commands themselves)
+    :return: Tuple ``(lines_read, invalid_lines)``
+    """
+    robot = Robot(sink, board)
+    parser = Parser()
+    write = out.write
+
+    def on_report(rep):
+        write(rep.encode("ascii") + b"\n")
+
+    invalid = 0
+    while not parser.finished:
+        chunk = stream.read(BATCH_BUFFER_SIZE)
+        if latency is not None:
+            start = latency.clock()
+        program = parser.feed(chunk) if chunk else parser.close()
+        if latency is not None:
+            start = latency.lap("parse chunk", start)
+        invalid += len(program.errors)
+        run(program, robot, on_report)
+        if latency is not None:
+            latency.lap("run chunk", start)
+        if not chunk:
+            break
+
+    return parser.line, invalid
+
+
+def run_batch(path, sink=None, board=None, latency=None):
+    """
+    Run a command file (``-`` for stdin) through :func:`run_script` with
+    buffered I/O and print a throughput summary to stderr.
+
+    :raises SystemExit: With a one-line message if the file cannot be opened
+    """
+    if path == "-":
+        stream = open(sys.stdin.fileno(), "rb", buffering=BATCH_BUFFER_SIZE, closefd=False)
+    else:
+        try:
+            stream = open(path, "rb", buffering=BATCH_BUFFER_SIZE)
+        except OSError as e:
+            sys.exit(f"basic.py: error: cannot open script: {e}")
+    out = open(sys.stdout.fileno(), "wb", buffering=BATCH_BUFFER_SIZE, closefd=False)
+
+    start = time.perf_counter()
+    try:
+        lines, invalid = run_script(stream, out, sink, board, latency)
+    finally:
+        out.flush()
+        stream.close()
+    elapsed = time.perf_counter() - start
+
+    rate = lines / elapsed if elapsed > 0 else float("inf")
+    print(f"{lines} lines in {elapsed:.3f}s ({rate:,.0f} lines/sec), "
+          f"{invalid} invalid", file=sys.stderr)
 
 # ----------------------------------------------------------------------
 # Main REPL loop
 # ----------------------------------------------------------------------
-def main():
-    robot = Robot()
-    print("Mars Rover CLI – type commands (PLACE X,Y,F | MOVE | LEFT | RIGHT | REPORT | EXIT)")
+# Option values when a flag is not given; shared by both argument paths
+DEFAULT_OPTIONS = {"script": None, "verbose": False, "journal": None, "size": "5x5",
+                   "obstacles": None, "latency": False, "profile": None}
+
+
+class Options:
+    """Parsed command-line options (attribute access, like argparse's Namespace)."""
+
+    def __init__(self, **values):
+        self.__dict__.update(DEFAULT_OPTIONS, **values)
+
+
+def quick_args(argv):
+    """
+    Options for the argument lists batch jobs launch the CLI with, without
+    importing ``argparse`` (which, with ``re``, is most of the CLI's import
+    time): no arguments, or ``--script FILE``.
+
+    :return: ``Options`` with an open 5x5 ``board``, or None for anything
+             else (including ``--help`` and mistakes), which goes through
+             :func:`parse_args`
+    """
+    if not argv:
+        return Options(board=Board())
+    if len(argv) == 2 and argv[0] == "--script" and not argv[1].startswith("--"):
+        return Options(script=argv[1], board=Board())
+    return None
 
+
+def parse_args(argv):
+    """
+    Full argument parsing; also builds ``options.board`` from ``--size`` or
+    ``--obstacles`` (exiting with a usage error if that fails).
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Cellular Origins Rover CLI")
+    parser.add_argument("--script", metavar="FILE",
+                        help="run commands from FILE ('-' for stdin) without rendering")
+    parser.add_argument("--verbose", action="store_true",
+                        help="log every robot command to stderr")
+    parser.add_argument("--journal", metavar="FILE",
+                        help="append every command and resulting state to a binary journal")
+    parser.add_argument("--size", metavar="WxH", default=DEFAULT_OPTIONS["size"],
+                        help="board size (default 5x5)")
+    parser.add_argument("--obstacles", metavar="FILE",
+                        help="board map: one line per row, top row first, '#' = blocked "
+                             "(sets the size)")
+    parser.add_argument("--latency", action="store_true",
+                        help="print per-command latency percentiles to stderr on exit")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="run under cProfile and write pstats data to FILE")
+    args = parser.parse_args(argv, Options())
+
+    try:
+        args.board = load_board(args.size, args.obstacles)
+    except (OSError, ValueError) as e:
+        parser.error(f"invalid board: {e}")
+    return args
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    args = quick_args(argv) or parse_args(argv)
+
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(session, args)
+        finally:
+            profiler.dump_stats(args.profile)
+            print(f"profile written to {args.profile} "
+                  f"(python -m pstats {args.profile})", file=sys.stderr)
+    else:
+        session(args)
+
+
+def session(args):
+    """Run the CLI session described by parsed options ``args``."""
+    board = args.board
+
+    sink = None
+    if args.verbose:
+        import logging
+        try:
+            from .events import LoggingSink
+        except ImportError:  # executed as a script from src/
+            from events import LoggingSink
+        logging.basicConfig(level=logging.INFO,
+                            format='%(asctime)s - %(levelname)s - %(message)s')
+        sink = LoggingSink()
+
+    latency = None
+    if args.latency:
+        try:
+            from .profiling import LatencyRecorder, TimingSink
+        except ImportError:  # executed as a script from src/
+            from profiling import LatencyRecorder, TimingSink
+        latency = LatencyRecorder()
+        if sink is not None:
+            sink = TimingSink(sink, latency, "logging")
+
+    journal = None
+    if args.journal:
+        try:
+            from .journal import JournalWriter
+        except ImportError:  # executed as a script from src/
+            from journal import JournalWriter
+        journal = JournalWriter(args.journal, board.width, board.height)
+
+    robot = Robot(sink, board)
+    if journal is not None:
+        journal.attach(robot)
+    try:
+        if args.script:
+            run_batch(args.script, robot.sink, board, latency)
+        else:
+            repl(robot, latency)
+    finally:
+        if journal is not None:
+            journal.close()
+        if latency is not None:
+            latency.dump()
+
+
+def repl(robot, latency=None):
+    """
+    Interactive prompt driving ``robot`` until EXIT or end of input.
+
+    :param latency: Optional ``profiling.LatencyRecorder`` timing the parse,
+                    each command type and the table rendering separately
+    """
+    print(f"Mars Rover CLI – type commands ({USAGE})")
+
+    # Lines go through the same parser as --script, so both modes accept
+    # and reject exactly the same input
+    parser = Parser()
     while True:
         try:
-            cmd = input("> ").strip().upper()
+            cmd = input("> ")
         except (EOFError, KeyboardInterrupt):
             print("\nGoodbye!")
             break
 
-        if not cmd:
+        if latency is not None:
+            start = latency.clock()
+        program = parser.feed(cmd.encode("utf-8", "replace") + b"\n")
+
+        if not program.ops and not program.errors:
+            continue
+        if latency is not None:
+            start = latency.lap("parse", start)
+
+        # ------------------- INVALID -------------------
+        if program.errors:
+            print(f"Invalid command: {program.errors[0].message}. Valid: {USAGE}")
+            if latency is not None:
+                latency.lap("invalid", start)
             continue
 
-        parts = cmd.split()
-        action = parts[0]
+        op = program.ops[0]
 
         # ------------------- EXIT -------------------
-        if action == "EXIT":
+        if op == EXIT:
             print("Shutting down rover control...")
             break
 
         # ------------------- PLACE -------------------
-        elif action == "PLACE" and len(parts) == 2:
-            try:
-                coords = parts[1].split(",")
-                if len(coords) != 3:
-                    raise ValueError
-                x, y, f = int(coords[0]), int(coords[1]), coords[2]
-                if robot.place(x, y, f):
-                    print(f"Placed at {x},{y},{f}")
-                else:
-                    print("Invalid placement – ignored.")
-            except Exception:
-                print("Invalid PLACE format. Use: PLACE X,Y,F (e.g., PLACE 0,0,NORTH)")
+        elif op == PLACE:
+            x, y, h = program.args
+            f = DIRECTIONS[h] if h >= 0 else None
+            if robot.place(x, y, f):
+                print(f"Placed at {x},{y},{f}")
+            else:
+                print("Invalid placement – ignored.")
 
         # ------------------- MOVE -------------------
-        elif action == "MOVE":
+        elif op == MOVE:
             robot.move()
 
         # ------------------- LEFT -------------------
-        elif action == "LEFT":
+        elif op == LEFT:
             robot.left()
 
         # ------------------- RIGHT -------------------
-        elif action == "RIGHT":
+        elif op == RIGHT:
             robot.right()
 
         # ------------------- REPORT -------------------
-        elif action == "REPORT":
+        elif op == REPORT:
             rep = robot.report()
             if rep:
                 print(f"Output: {rep}")
             else:
                 print("Robot not placed yet.")
 
-        # ------------------- UNKNOWN -------------------
-        else:
-            print("Unknown command. Valid: PLACE X,Y,F | MOVE | LEFT | RIGHT | REPORT | EXIT")
+        if latency is not None:
+            start = latency.lap(COMMAND_NAMES[op], start)
 
         # Always show the table after any valid action
-        if action in {"PLACE", "MOVE", "LEFT", "RIGHT", "REPORT"}:
-            print_table(robot)
+        print_table(robot)
+        if latency is not None:
+            latency.lap("print_table", start)
 
 # ----------------------------------------------------------------------
 if __name__ == "__main__":
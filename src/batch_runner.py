@@ -0,0 +1,121 @@
+# src/batch_runner.py
+"""
+Run many independent command scripts across a process pool.
+
+Scripts are grouped into batches so each round trip to a worker process
+carries hundreds of scripts; workers parse with ``command_parser`` and step
+the transition-table engine, and send back compact tuples. Results come back
+in input order.
+
+    python batch_runner.py missions/*.txt --workers 8
+"""
+import itertools
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .engine import DEFAULT_TABLE
+    from .command_parser import parse, parse_file, run_table
+except ImportError:  # executed as a script from src/
+    from engine import DEFAULT_TABLE
+    from command_parser import parse, parse_file, run_table
+
+DEFAULT_BATCH_SIZE = 256
+
+ScriptResult = namedtuple("ScriptResult", "final reports errors")
+ScriptResult.__doc__ = """
+Outcome of one script.
+
+:ivar final: ``"X,Y,F"`` of the final state, or None if never placed
+:ivar reports: Tuple of every REPORT output, in order
+:ivar errors: Number of malformed lines that were skipped
+"""
+
+
+def run_script(program):
+    """Execute one parsed program and summarise it as a ``ScriptResult``."""
+    reports = []
+    state = run_table(program, DEFAULT_TABLE, on_report=reports.append)
+    return ScriptResult(DEFAULT_TABLE.report(state), tuple(reports), len(program.errors))
+
+
+def _run_sources(sources):
+    """Worker entry point: run a batch of script buffers."""
+    return [tuple(run_script(parse(source))) for source in sources]
+
+
+def _run_paths(paths):
+    """Worker entry point: run a batch of script files."""
+    return [tuple(run_script(parse_file(path))) for path in paths]
+
+
+def _batches(items, size):
+    it = iter(items)
+    while True:
+        batch = list(itertools.islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _run_sharded(worker, items, max_workers, batch_size):
+    if max_workers is None:
+        # A pool on a single core only adds pickling overhead
+        max_workers = 0 if (os.cpu_count() or 1) == 1 else None
+    if max_workers == 0:
+        batches = map(worker, _batches(items, batch_size))
+        return [ScriptResult(*row) for batch in batches for row in batch]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        batches = pool.map(worker, _batches(items, batch_size))
+        return [ScriptResult(*row) for batch in batches for row in batch]
+
+
+def run_scripts(scripts, max_workers=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Run command scripts given as ``bytes``/``str`` buffers.
+
+    :param scripts: Iterable of script contents
+    :param max_workers: Worker processes (default: CPU count, inline on a
+                        single core; 0 always runs inline)
+    :param batch_size: Scripts sent to a worker per round trip
+    :return: List of ``ScriptResult`` in input order
+    """
+    return _run_sharded(_run_sources, scripts, max_workers, batch_size)
+
+
+def run_files(paths, max_workers=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Run command script files; only the paths cross the process boundary.
+
+    :return: List of ``ScriptResult`` in input order
+    """
+    return _run_sharded(_run_paths, [os.fspath(p) for p in paths], max_workers, batch_size)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run rover mission scripts in parallel")
+    parser.add_argument("paths", nargs="+", metavar="FILE", help="command script files")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CPU count, 0 = inline)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"scripts per worker round trip (default {DEFAULT_BATCH_SIZE})")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_files(args.paths, args.workers, args.batch_size)
+    elapsed = time.perf_counter() - start
+
+    out = sys.stdout
+    for path, result in zip(args.paths, results):
+        out.write(f"{path}: {result.final or 'NOT PLACED'} ({result.errors} errors)\n")
+    failed = sum(1 for r in results if r.errors)
+    print(f"{len(results)} scripts in {elapsed:.3f}s, {failed} with errors", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# src/board.py
+"""
+The surface a rover drives on: its size and which cells are blocked.
+
+Blocked cells are kept in a flat bitset (``bytearray``, one bit per cell,
+row-major from the bottom-left), so a 10,000 x 10,000 survey area costs
+12.5 MB and every "can I go there?" check is one index and one shift.
+"""
+
+
+class Board:
+    """
+    A ``width`` x ``height`` grid of cells, some of which may be blocked.
+
+    :ivar bits: Blocked-cell bitset; cell ``i = y * width + x`` is bit
+                ``i & 7`` of byte ``i >> 3``
+    :ivar blocked_count: Number of blocked cells
+    :ivar version: Bumped whenever a cell is blocked or unblocked, so
+                   caches keyed on the board can tell it changed
+    """
+
+    __slots__ = ('width', 'height', 'bits', 'blocked_count', 'version')
+
+    def __init__(self, width=5, height=5, blocked=()):
+        """
+        :param blocked: Iterable of ``(x, y)`` cells to block
+        :raises ValueError: If a dimension is not a positive integer
+        """
+        if not (isinstance(width, int) and isinstance(height, int)
+                and width > 0 and height > 0):
+            raise ValueError(f"board size must be positive integers, got {width}x{height}")
+        self.width = width
+        self.height = height
+        self.bits = bytearray((width * height + 7) >> 3)
+        self.blocked_count = 0
+        self.version = 0
+        for x, y in blocked:
+            self.block(x, y)
+
+    @classmethod
+    def from_text(cls, text):
+        """
+        Build a board from a picture: one line per row, top row first,
+        ``#`` for a blocked cell and any other character for a free one.
+
+        :raises ValueError: If the rows differ in length
+        """
+        rows = [line.rstrip("\r") for line in text.strip("\n").split("\n")]
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("all board rows must have the same length")
+        board = cls(width, len(rows))
+        for top, row in enumerate(rows):
+            y = board.height - 1 - top
+            for x, ch in enumerate(row):
+                if ch == "#":
+                    board.block(x, y)
+        return board
+
+    def __repr__(self):
+        return f"Board({self.width}, {self.height}, blocked={self.blocked_count})"
+
+    @property
+    def nbytes(self):
+        """Size of the obstacle bitset."""
+        return len(self.bits)
+
+    def contains(self, x, y):
+        """True if ``x, y`` is on the board."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_blocked(self, x, y):
+        """True if the on-board cell ``x, y`` is blocked."""
+        i = y * self.width + x
+        return self.bits[i >> 3] >> (i & 7) & 1 == 1
+
+    def is_open(self, x, y):
+        """True if a rover may stand on ``x, y``: on the board and not blocked."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        i = y * self.width + x
+        return not self.bits[i >> 3] >> (i & 7) & 1
+
+    def _check(self, x, y):
+        if not self.contains(x, y):
+            raise ValueError(f"cell {x},{y} is off the {self.width}x{self.height} board")
+        return y * self.width + x
+
+    def block(self, x, y):
+        """
+        Mark ``x, y`` as blocked.
+
+        :raises ValueError: If the cell is off the board
+        """
+        i = self._check(x, y)
+        if not self.bits[i >> 3] >> (i & 7) & 1:
+            self.bits[i >> 3] |= 1 << (i & 7)
+            self.blocked_count += 1
+            self.version += 1
+
+    def unblock(self, x, y):
+        """
+        Clear ``x, y``.
+
+        :raises ValueError: If the cell is off the board
+        """
+        i = self._check(x, y)
+        if self.bits[i >> 3] >> (i & 7) & 1:
+            self.bits[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+            self.blocked_count -= 1
+            self.version += 1
+
+    def blocked_cells(self):
+        """Yield every blocked ``(x, y)``, row by row from the bottom."""
+        import re   # only needed here; keeps it off the CLI's import path
+        width = self.width
+        # The regex engine skips runs of empty bytes at C speed
+        for match in re.finditer(rb"[^\x00]", self.bits):
+            pos = match.start()
+            byte = self.bits[pos]
+            for bit in range(8):
+                if byte >> bit & 1:
+                    y, x = divmod(pos * 8 + bit, width)
+                    yield x, y
+
+
+def load_board(size="5x5", obstacles=None):
+    """
+    Board from the front-ends' ``--size`` / ``--obstacles`` options.
+
+    :param size: ``"WxH"``, used when there is no obstacle map
+    :param obstacles: Path to a :meth:`Board.from_text` map (sets the size)
+    :raises OSError: If the map cannot be read
+    :raises ValueError: If the size or map is invalid
+    """
+    if obstacles:
+        with open(obstacles) as fh:
+            return Board.from_text(fh.read())
+    width, _, height = size.lower().partition("x")
+    return Board(int(width), int(height))
+
+
+def viewport(size, pos, span):
+    """
+    First index of a ``span``-long window over ``size`` cells that keeps
+    ``pos`` as central as the edges allow.
+    """
+    return max(0, min(pos - span // 2, size - span))
+
+
+# The open 5x5 table every robot gets unless told otherwise; shared, so
+# give a robot its own Board before blocking cells
+DEFAULT_BOARD = Board()
@@ -0,0 +1,117 @@
+# src/checkpoints.py
+"""
+Random access to the rover state at any step of a long command history.
+
+A :class:`CheckpointIndex` keeps the parsed command stream (one byte per
+command) and, every ``interval`` steps, the engine state reached so far.
+``state_at(k)`` binary-searches for the last checkpoint at or before step
+``k`` and replays at most ``interval - 1`` commands from there with the
+transition table, instead of re-running the whole history.
+
+The interval trades memory for query time: each checkpoint costs 20 bytes,
+each query replays ``interval / 2`` commands on average.
+"""
+from array import array
+from bisect import bisect_right
+
+try:
+    from .engine import DEFAULT_TABLE, PLACE, EXIT, UNPLACED
+except ImportError:  # executed as a script from src/
+    from engine import DEFAULT_TABLE, PLACE, EXIT, UNPLACED
+
+DEFAULT_INTERVAL = 1024
+
+# Bytes per checkpoint: step ('q') + state ('I') + PLACE argument offset ('q')
+CHECKPOINT_BYTES = 20
+
+
+class CheckpointIndex:
+    """
+    A command stream plus periodic state checkpoints.
+
+    Step ``k`` means "after the first ``k`` commands"; step 0 is the
+    unplaced start. ``EXIT`` counts as a step that changes nothing.
+    """
+
+    def __init__(self, program=None, table=DEFAULT_TABLE, interval=DEFAULT_INTERVAL):
+        """
+        :param program: Optional ``command_parser.Program`` to index
+        :param table: ``TransitionTable`` for the board size
+        :param interval: Steps between checkpoints
+        :raises ValueError: If ``interval`` is not positive
+        """
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        self.table = table
+        self.interval = interval
+        self.ops = array('B')
+        self.args = array('i')
+        self.steps = array('q', [0])
+        self.states = array('I', [UNPLACED])
+        self.arg_pos = array('q', [0])
+        self.state = UNPLACED  # after the last indexed command
+        if program is not None:
+            self.extend(program)
+
+    def __len__(self):
+        """Number of indexed commands (the last valid step)."""
+        return len(self.ops)
+
+    @property
+    def checkpoint_bytes(self):
+        """Memory held by the checkpoints themselves."""
+        return len(self.steps) * CHECKPOINT_BYTES
+
+    def extend(self, program):
+        """Append the next part of a growing command stream."""
+        next_state = self.table.next_state
+        place = self.table.place
+        steps, states, arg_pos = self.steps, self.states, self.arg_pos
+        interval = self.interval
+
+        step = len(self.ops)
+        next_checkpoint = steps[-1] + interval
+        a = len(self.args)
+        self.ops.extend(program.ops)
+        self.args.extend(program.args)
+        args = self.args
+        state = self.state
+
+        for op in program.ops:
+            if op == PLACE:
+                state = place(state, args[a], args[a + 1], args[a + 2])
+                a += 3
+            elif op != EXIT:
+                state = next_state[op][state]
+            step += 1
+            if step == next_checkpoint:
+                steps.append(step)
+                states.append(state)
+                arg_pos.append(a)
+                next_checkpoint += interval
+        self.state = state
+
+    def state_at(self, step):
+        """
+        Engine state after the first ``step`` commands.
+
+        :raises IndexError: If ``step`` is outside ``0..len(self)``
+        """
+        if not 0 <= step <= len(self.ops):
+            raise IndexError(f"step {step} out of range 0..{len(self.ops)}")
+        i = bisect_right(self.steps, step) - 1
+        state = self.states[i]
+        a = self.arg_pos[i]
+        next_state = self.table.next_state
+        args = self.args
+        for op in self.ops[self.steps[i]:step]:
+            if op == PLACE:
+                state = self.table.place(state, args[a], args[a + 1], args[a + 2])
+                a += 3
+            elif op != EXIT:
+                state = next_state[op][state]
+        return state
+
+    def report_at(self, step):
+        """``"X,Y,F"`` after the first ``step`` commands, or None if unplaced."""
+        return self.table.report(self.state_at(step))
@@ -0,0 +1,350 @@
+# src/command_parser.py
+"""
+Fast command parser shared by all front-ends and engines.
+
+Turns a bytes-like buffer (``bytes``, ``bytearray``, ``memoryview`` or an
+``mmap`` of a huge log) into a :class:`Program`: an ``array('B')`` of
+opcodes from ``engine.py`` plus the PLACE arguments packed as ``x, y,
+heading`` triples in an ``array('i')``. A program is tokenized once and can
+then be executed any number of times by :func:`run` (on a ``Robot``-like
+object) or :func:`run_table` (on a ``TransitionTable``).
+
+PLACE with an unknown direction or off-table coordinates is *not* a syntax
+error; it is encoded with heading/coordinate ``-1`` and ignored at run time,
+exactly like ``Robot.place`` ignores it.
+"""
+import mmap
+from array import array
+
+try:
+    from .robot import DIRECTIONS, HEADINGS
+    from .engine import OPCODES, MOVE, LEFT, RIGHT, REPORT, PLACE, EXIT, UNPLACED
+except ImportError:  # executed as a script from src/
+    from robot import DIRECTIONS, HEADINGS
+    from engine import OPCODES, MOVE, LEFT, RIGHT, REPORT, PLACE, EXIT, UNPLACED
+
+CHUNK_SIZE = 1 << 20
+
+_INT32_MIN, _INT32_MAX = -(1 << 31), (1 << 31) - 1
+
+# Commands that take no arguments, keyed by their exact bytes
+_SIMPLE = {name.encode(): op for name, op in OPCODES.items() if op != PLACE}
+_BYTE_HEADINGS = {name.encode(): code for name, code in HEADINGS.items()}
+
+# Internal line markers: "needs a closer look" and "emits nothing"
+_SLOW, _SKIP = 255, 254
+
+# Distinct PLACE lines remembered per parser (logs repeat the same few)
+_PLACE_CACHE_SIZE = 4096
+
+
+class ParseError(ValueError):
+    """
+    A malformed command line.
+
+    :ivar line: 1-based line number
+    :ivar column: 1-based column of the offending token
+    :ivar offset: 0-based byte offset of the offending token in the input
+    :ivar op_index: Number of opcodes in the program before the bad line,
+                    so errors can be reported in line order with the ops
+    """
+
+    def __init__(self, message, line, column, offset, op_index=0):
+        super().__init__(f"line {line}, column {column}: {message}")
+        self.message = message
+        self.line = line
+        self.column = column
+        self.offset = offset
+        self.op_index = op_index
+
+
+class Program:
+    """
+    A pre-parsed command stream.
+
+    :ivar ops: ``array('B')`` of opcodes
+    :ivar args: ``array('i')`` of ``x, y, heading`` triples, one per PLACE
+    :ivar errors: ``ParseError`` for every skipped line (lenient parsing)
+    """
+
+    __slots__ = ('ops', 'args', 'errors')
+
+    def __init__(self):
+        self.ops = array('B')
+        self.args = array('i')
+        self.errors = []
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __iter__(self):
+        """Yield ``(opcode, (x, y, heading) or None)`` pairs."""
+        args = self.args
+        i = 0
+        for op in self.ops:
+            if op == PLACE:
+                yield op, (args[i], args[i + 1], args[i + 2])
+                i += 3
+            else:
+                yield op, None
+
+    def extend(self, other):
+        """Append another program (e.g. the next parsed chunk)."""
+        for err in other.errors:
+            err.op_index += len(self.ops)
+        self.ops.extend(other.ops)
+        self.args.extend(other.args)
+        self.errors.extend(other.errors)
+
+
+class Parser:
+    """
+    Incremental parser: :meth:`feed` arbitrary byte chunks, :meth:`close`
+    at the end. Line numbers and byte offsets carry across chunks.
+
+    ``EXIT`` ends the program: it is emitted as an opcode and everything
+    after it is ignored.
+    """
+
+    def __init__(self, strict=False, max_line=None):
+        """
+        :param strict: Raise the first ``ParseError`` instead of collecting it
+        :param max_line: Longest unterminated line buffered, in bytes (default
+                         unbounded). A longer line is an error that ends the
+                         program, like EXIT, so a peer cannot grow the buffer
+                         forever.
+        """
+        self.strict = strict
+        self.max_line = max_line
+        self.line = 0
+        self.offset = 0
+        self.finished = False
+        self._tail = b""
+        self._places = {}
+
+    def feed(self, data):
+        """
+        Parse every complete line in ``data``.
+
+        :return: :class:`Program` for the lines completed by this chunk
+        """
+        if self.finished:
+            return Program()
+        data = self._tail + bytes(data)
+        end = data.rfind(b"\n") + 1
+        self._tail = data[end:]
+        program = self._parse(data[:end].split(b"\n")[:-1])
+        if self.max_line is not None and len(self._tail) > self.max_line \
+                and not self.finished:
+            self._tail = b""
+            self.finished = True
+            exc = ParseError(f"line longer than {self.max_line} bytes", self.line + 1,
+                             self.max_line + 1, self.offset + self.max_line, len(program))
+            if self.strict:
+                raise exc
+            program.errors.append(exc)
+        return program
+
+    def close(self):
+        """Parse a final line without a trailing newline."""
+        tail, self._tail = self._tail, b""
+        if self.finished or not tail:
+            return Program()
+        return self._parse([tail])
+
+    def _parse(self, lines):
+        """
+        Map every line through ``_SIMPLE`` in one pass, then revisit only the
+        lines that were not an exact simple command (PLACE, odd spacing or
+        case, blanks and errors).
+        """
+        program = Program()
+        codes = [_SIMPLE.get(raw, _SLOW) for raw in lines]
+        end = codes.index(EXIT) + 1 if EXIT in codes else len(codes)
+
+        if _SLOW in codes:
+            places = self._places
+            base, done, pos, skipped = self.offset, 0, -1, 0
+            while True:
+                try:
+                    i = codes.index(_SLOW, pos + 1, end)
+                except ValueError:
+                    break
+                pos = i
+                raw = lines[i]
+
+                values = places.get(raw)
+                if values is not None:
+                    codes[i] = PLACE
+                    program.args.extend(values)
+                    continue
+                text = raw.strip().upper()
+                op = _SIMPLE.get(text)
+                if op is not None:
+                    codes[i] = op
+                    if op == EXIT:
+                        end = i + 1
+                        break
+                    continue
+                if not text:
+                    codes[i] = _SKIP
+                    skipped += 1
+                    continue
+
+                try:
+                    values = self._parse_place(raw)
+                except ParseError as exc:
+                    # Resolve the absolute position only for lines in error
+                    base += sum(map(len, lines[done:i])) + (i - done)
+                    done = i
+                    exc.line = self.line + i + 1
+                    exc.offset += base
+                    exc.op_index = i - skipped
+                    exc.args = (f"line {exc.line}, column {exc.column}: {exc.message}",)
+                    if self.strict:
+                        raise
+                    program.errors.append(exc)
+                    codes[i] = _SKIP
+                    skipped += 1
+                    continue
+                if len(places) >= _PLACE_CACHE_SIZE:
+                    places.clear()
+                places[raw] = values
+                codes[i] = PLACE
+                program.args.extend(values)
+
+        if end < len(codes):
+            del codes[end:]
+        self.line += end
+        self.offset += sum(map(len, lines[:end])) + end
+        if codes and codes[-1] == EXIT:
+            self.finished = True
+        if _SKIP in codes:
+            codes = [c for c in codes if c != _SKIP]
+        program.ops.frombytes(bytes(codes))
+        return program
+
+    @staticmethod
+    def _parse_place(raw):
+        """
+        Parse a ``PLACE X,Y,F`` line into an ``(x, y, heading)`` tuple.
+
+        Raised errors carry a position relative to the start of the line;
+        ``_parse`` fills in the line number and absolute offset.
+        """
+        tokens = raw.split()
+        parts = raw.upper().split()
+        name = parts[0].decode("ascii", "replace")
+        col = raw.index(tokens[0])
+        if parts[0] in _SIMPLE:
+            arg_col = raw.index(tokens[1], col + len(tokens[0]))
+            raise ParseError(f"{name} takes no arguments", 0, arg_col + 1, arg_col)
+        if parts[0] != b"PLACE":
+            raise ParseError(f"unknown command {name!r}", 0, col + 1, col)
+        if len(parts) != 2:
+            raise ParseError("PLACE expects X,Y,F", 0, col + 1, col)
+
+        arg_col = raw.index(tokens[1], col + len(tokens[0]))
+        coords = parts[1].split(b",")
+        if len(coords) != 3:
+            raise ParseError("PLACE expects X,Y,F", 0, arg_col + 1, arg_col)
+
+        values = []
+        pos = arg_col
+        for token in tokens[1].split(b",")[:2]:
+            try:
+                value = int(token)
+            except ValueError:
+                name = token.decode("ascii", "replace")
+                raise ParseError(f"invalid coordinate {name!r}", 0, pos + 1, pos) from None
+            values.append(value if _INT32_MIN <= value <= _INT32_MAX else -1)
+            pos += len(token) + 1
+        values.append(_BYTE_HEADINGS.get(coords[2], -1))
+        return tuple(values)
+
+
+def parse(data, strict=False, chunk_size=CHUNK_SIZE):
+    """
+    Parse a whole bytes-like buffer (including an ``mmap``).
+
+    The buffer is sliced ``chunk_size`` bytes at a time, so only the opcode
+    stream grows with the input.
+
+    :raises ParseError: On the first malformed line if ``strict``
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    parser = Parser(strict)
+    program = Program()
+    for pos in range(0, len(data), chunk_size):
+        if parser.finished:
+            break
+        program.extend(parser.feed(data[pos:pos + chunk_size]))
+    program.extend(parser.close())
+    return program
+
+
+def parse_file(path, strict=False):
+    """Parse a command file through a read-only ``mmap``."""
+    with open(path, "rb") as fh:
+        try:
+            view = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return Program()
+        with view:
+            return parse(view, strict)
+
+
+def run(program, robot, on_report=None):
+    """
+    Execute a program on a ``Robot``-like object.
+
+    :param on_report: Called with each successful REPORT string
+    :return: Number of opcodes executed (stops after EXIT)
+    """
+    place, move, left, right, report = (
+        robot.place, robot.move, robot.left, robot.right, robot.report
+    )
+    args = program.args
+    i = count = 0
+    for op in program.ops:
+        count += 1
+        if op == MOVE:
+            move()
+        elif op == LEFT:
+            left()
+        elif op == RIGHT:
+            right()
+        elif op == REPORT:
+            rep = report()
+            if rep and on_report is not None:
+                on_report(rep)
+        elif op == PLACE:
+            h = args[i + 2]
+            place(args[i], args[i + 1], DIRECTIONS[h] if h >= 0 else None)
+            i += 3
+        elif op == EXIT:
+            break
+    return count
+
+
+def run_table(program, table, state=UNPLACED, on_report=None):
+    """
+    Execute a program on a ``TransitionTable``.
+
+    :return: Final state
+    """
+    next_state = table.next_state
+    args = program.args
+    i = 0
+    for op in program.ops:
+        if op == PLACE:
+            state = table.place(state, args[i], args[i + 1], args[i + 2])
+            i += 3
+        elif op == EXIT:
+            break
+        else:
+            state = next_state[op][state]
+            if op == REPORT and on_report is not None and state != UNPLACED:
+                on_report(table.report(state))
+    return state
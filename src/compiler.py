@@ -0,0 +1,83 @@
+# src/compiler.py
+"""
+Compile command programs into state-mapping tables.
+
+A program is a function from the ``table.size`` robot states (101 on the 5x5
+table) to states, stored as a tuple ``mapping[state] -> state``. Mappings
+compose associatively, so repeating a block ``n`` times takes O(log n)
+compositions by repeated doubling instead of ``n`` passes through the block.
+"""
+try:
+    from .engine import DEFAULT_TABLE, OPCODES, MOVE, LEFT, RIGHT, REPORT, PLACE, EXIT
+except ImportError:  # executed as a script from src/
+    from engine import DEFAULT_TABLE, OPCODES, MOVE, LEFT, RIGHT, REPORT, PLACE, EXIT
+
+
+def identity(table=DEFAULT_TABLE):
+    """Mapping that leaves every state unchanged."""
+    return tuple(range(table.size))
+
+
+def compose(first, second):
+    """Mapping equivalent to running ``first`` and then ``second``."""
+    return tuple([second[s] for s in first])
+
+
+def repeat(mapping, n):
+    """
+    Mapping equivalent to running ``mapping`` ``n`` times.
+
+    Uses repeated doubling: O(log n) compositions.
+    """
+    if n < 0:
+        raise ValueError("repeat count must be non-negative")
+    result = tuple(range(len(mapping)))
+    power = mapping
+    while n:
+        if n & 1:
+            result = compose(result, power)
+        n >>= 1
+        if n:
+            power = compose(power, power)
+    return result
+
+
+def compile_program(commands, table=DEFAULT_TABLE):
+    """
+    Compile ``basic.py``-style command lines into a state mapping.
+
+    ``PLACE X,Y,F`` becomes a constant mapping (or the identity if the
+    placement is invalid), ``REPORT`` is the identity and ``EXIT`` ends the
+    program.
+
+    :param commands: Iterable of command strings, e.g. ``["MOVE", "LEFT"]``
+    :param table: ``TransitionTable`` the program runs on
+    :return: Tuple mapping each state to the state after the program
+    :raises ValueError: On an unknown command or malformed PLACE
+    """
+    mapping = identity(table)
+    for lineno, line in enumerate(commands, 1):
+        parts = line.strip().upper().split()
+        if not parts:
+            continue
+        op = OPCODES.get(parts[0])
+
+        if op in (MOVE, LEFT, RIGHT, REPORT) and len(parts) == 1:
+            step = table.next_state[op]
+            mapping = tuple([step[s] for s in mapping])
+        elif op == PLACE and len(parts) == 2:
+            coords = parts[1].split(",")
+            try:
+                if len(coords) != 3:
+                    raise ValueError
+                x, y = int(coords[0]), int(coords[1])
+            except ValueError:
+                raise ValueError(f"line {lineno}: invalid PLACE format: {line.strip()!r}") from None
+            target = table.place(-1, x, y, coords[2])
+            if target != -1:
+                mapping = (target,) * table.size
+        elif op == EXIT and len(parts) == 1:
+            break
+        else:
+            raise ValueError(f"line {lineno}: unknown command: {line.strip()!r}")
+    return mapping
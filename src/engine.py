@@ -0,0 +1,165 @@
+# src/engine.py
+"""
+Compiled transition-table engine for the toy robot.
+
+The whole robot state is one small integer: ``UNPLACED`` (0) or
+``1 + ((y * width + x) << 2 | heading)`` where ``heading`` indexes
+``DIRECTIONS``. On the 5x5 table that is 101 states, so every MOVE/LEFT/RIGHT
+can be precomputed once into ``next_state[opcode][state]`` and each command
+costs a single tuple index.
+"""
+
+try:
+    from .robot import DIRECTIONS, HEADINGS, DELTAS
+except ImportError:  # executed as a script from src/
+    from robot import DIRECTIONS, HEADINGS, DELTAS
+
+# Command opcodes shared by the engine and everything that feeds it
+MOVE, LEFT, RIGHT, REPORT, PLACE, EXIT = range(6)
+OPCODES = {'MOVE': MOVE, 'LEFT': LEFT, 'RIGHT': RIGHT,
+           'REPORT': REPORT, 'PLACE': PLACE, 'EXIT': EXIT}
+
+UNPLACED = 0
+
+
+def encode(x, y, heading, width=5):
+    """Pack a placed position into a state integer."""
+    return 1 + ((y * width + x) << 2 | heading)
+
+
+def decode(state, width=5):
+    """
+    Unpack a state integer.
+
+    :return: ``(x, y, heading)`` or None if the state is ``UNPLACED``
+    """
+    if state == UNPLACED:
+        return None
+    cell, heading = divmod(state - 1, 4)
+    y, x = divmod(cell, width)
+    return x, y, heading
+
+
+class TransitionTable:
+    """
+    Precomputed ``next_state`` tables for one table size.
+
+    ``next_state[MOVE]``, ``next_state[LEFT]``, ``next_state[RIGHT]`` and
+    ``next_state[REPORT]`` (identity) are tuples indexed by state.
+    """
+
+    def __init__(self, width=5, height=5, board=None):
+        """
+        :param board: Optional ``board.Board``; its size overrides
+                      ``width``/``height`` and its blocked cells cannot be
+                      entered or placed on
+        """
+        if board is not None:
+            width, height = board.width, board.height
+        self.width = width
+        self.height = height
+        self.board = board
+        self.size = 1 + width * height * 4
+        blocked = board.is_blocked if board is not None and board.blocked_count else None
+
+        move = [UNPLACED] * self.size
+        left = [UNPLACED] * self.size
+        right = [UNPLACED] * self.size
+        for state in range(1, self.size):
+            x, y, h = decode(state, width)
+            dx, dy = DELTAS[h]
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and not (blocked and blocked(nx, ny)):
+                move[state] = encode(nx, ny, h, width)
+            else:
+                move[state] = state
+            left[state] = encode(x, y, (h - 1) % 4, width)
+            right[state] = encode(x, y, (h + 1) % 4, width)
+
+        self.next_state = (tuple(move), tuple(left), tuple(right),
+                           tuple(range(self.size)))
+
+    def place(self, state, x, y, f):
+        """
+        State after ``PLACE x,y,f``; invalid placements leave ``state`` as is.
+
+        :param f: Direction string or heading code
+        """
+        heading = HEADINGS.get(f, f) if isinstance(f, str) else f
+        if (isinstance(x, int) and isinstance(y, int) and heading in (0, 1, 2, 3)
+                and 0 <= x < self.width and 0 <= y < self.height
+                and not (self.board is not None and self.board.is_blocked(x, y))):
+            return encode(x, y, heading, self.width)
+        return state
+
+    def run(self, ops, state=UNPLACED):
+        """
+        Apply a sequence of MOVE/LEFT/RIGHT/REPORT opcodes.
+
+        :return: Final state
+        """
+        table = self.next_state
+        for op in ops:
+            state = table[op][state]
+        return state
+
+    def report(self, state):
+        """Get ``"X,Y,F"`` for a state, or None if unplaced."""
+        pos = decode(state, self.width)
+        if pos is None:
+            return None
+        x, y, h = pos
+        return f"{x},{y},{DIRECTIONS[h]}"
+
+
+DEFAULT_TABLE = TransitionTable()
+
+
+class TableRobot:
+    """
+    Drop-in, table-driven counterpart of :class:`robot.Robot`.
+
+    Exposes the same ``place/move/left/right/report`` methods and read-only
+    ``x``, ``y``, ``f`` attributes, but keeps only one integer of state.
+    """
+
+    __slots__ = ('table', 'state', '_move', '_left', '_right')
+
+    def __init__(self, table=DEFAULT_TABLE):
+        self.table = table
+        self.state = UNPLACED
+        self._move, self._left, self._right, _ = table.next_state
+
+    @property
+    def x(self):
+        pos = decode(self.state, self.table.width)
+        return None if pos is None else pos[0]
+
+    @property
+    def y(self):
+        pos = decode(self.state, self.table.width)
+        return None if pos is None else pos[1]
+
+    @property
+    def f(self):
+        pos = decode(self.state, self.table.width)
+        return None if pos is None else DIRECTIONS[pos[2]]
+
+    def place(self, x, y, f):
+        new = self.table.place(UNPLACED, x, y, f)
+        if new == UNPLACED:
+            return False
+        self.state = new
+        return True
+
+    def move(self):
+        self.state = self._move[self.state]
+
+    def left(self):
+        self.state = self._left[self.state]
+
+    def right(self):
+        self.state = self._right[self.state]
+
+    def report(self):
+        return self.table.report(self.state)
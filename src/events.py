@@ -0,0 +1,81 @@
+# src/events.py
+"""
+Event sinks for :class:`robot.Robot`.
+
+A robot reports every command to its ``sink`` as
+``sink.emit(command, robot, reason)`` where ``command`` is one of
+``"place"``, ``"move"``, ``"left"``, ``"right"``, ``"report"`` and ``reason``
+is None when the command was applied, or a short text when it was ignored.
+The robot's state has already been updated when ``emit`` is called.
+
+Robots default to ``sink=None`` and skip the call entirely, so nothing is
+formatted or logged unless a sink is attached.
+"""
+import logging
+from collections import Counter
+
+
+class EventSink:
+    """Base class for robot event sinks. Does nothing."""
+
+    def emit(self, command, robot, reason=None):
+        """
+        Receive one command event.
+
+        :param command: Command name (``"place"``, ``"move"``, ...)
+        :param robot: The robot, already in its post-command state
+        :param reason: None if applied, otherwise why it was ignored
+        """
+
+
+NULL_SINK = EventSink()
+
+
+class LoggingSink(EventSink):
+    """Write events to a :mod:`logging` logger (the old default behaviour)."""
+
+    def __init__(self, logger=None):
+        self.logger = logger or logging.getLogger("rover")
+
+    def emit(self, command, robot, reason=None):
+        if reason is not None:
+            self.logger.warning("%s ignored: %s", command.capitalize(), reason)
+        elif command == "place":
+            self.logger.info("Placed at %s,%s,%s", robot.x, robot.y, robot.f)
+        elif command == "move":
+            self.logger.info("Moved to %s,%s", robot.x, robot.y)
+        elif command == "report":
+            self.logger.info("Report: %s,%s,%s", robot.x, robot.y, robot.f)
+        else:
+            self.logger.info("Turned %s to %s", command, robot.f)
+
+
+class CountingSink(EventSink):
+    """Count events as ``(command, applied)`` pairs."""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def emit(self, command, robot, reason=None):
+        self.counts[command, reason is None] += 1
+
+
+class TracingSink(EventSink):
+    """Record ``(command, x, y, f, reason)`` tuples in ``events``."""
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, command, robot, reason=None):
+        self.events.append((command, robot.x, robot.y, robot.f, reason))
+
+
+class MultiSink(EventSink):
+    """Fan each event out to several sinks."""
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def emit(self, command, robot, reason=None):
+        for sink in self.sinks:
+            sink.emit(command, robot, reason)
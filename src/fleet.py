@@ -0,0 +1,163 @@
+# src/fleet.py
+import numpy as np
+
+try:
+    from .robot import DIRECTIONS
+except ImportError:  # executed as a script from src/
+    from robot import DIRECTIONS
+
+UNPLACED = -1
+
+# Step per heading code, indexed like DIRECTIONS
+_DX = np.array([0, 1, 0, -1], dtype=np.int32)
+_DY = np.array([1, 0, -1, 0], dtype=np.int32)
+
+
+class RobotFleet:
+    """
+    Many toy robots on independent copies of one board (5x5 by default),
+    stepped in lock-step.
+
+    State lives in three NumPy arrays: ``x``, ``y`` and ``heading`` where the
+    heading is an index into ``DIRECTIONS`` (``UNPLACED`` = -1). Every command
+    applies to the whole fleet, or to the robots selected by a boolean
+    ``mask``, with the same rules as :class:`robot.Robot`: invalid placements
+    and moves off the table are ignored, and unplaced robots ignore
+    MOVE/LEFT/RIGHT. Blocked cells of a ``board`` can be neither entered nor
+    placed on.
+    """
+
+    def __init__(self, size, width=5, height=5, board=None):
+        """
+        Create ``size`` unplaced robots.
+
+        :param size: Number of robots in the fleet
+        :param width: Table width (default 5)
+        :param height: Table height (default 5)
+        :param board: Optional ``board.Board``; overrides ``width``/``height``
+        """
+        if board is not None:
+            width, height = board.width, board.height
+        self.width = width
+        self.height = height
+        self.board = board
+        self.x = np.zeros(size, dtype=np.int32)
+        self.y = np.zeros(size, dtype=np.int32)
+        self.heading = np.full(size, UNPLACED, dtype=np.int8)
+
+    def __len__(self):
+        return len(self.heading)
+
+    def _select(self, mask):
+        """Boolean selection of placed robots, optionally narrowed by ``mask``."""
+        selected = self.heading != UNPLACED
+        if mask is not None:
+            selected &= np.asarray(mask, dtype=bool)
+        return selected
+
+    def _open(self, x, y, inside):
+        """Narrow the ``inside`` selection to cells that are not blocked."""
+        board = self.board
+        if board is None or not board.blocked_count:
+            return inside
+        bits = np.frombuffer(board.bits, dtype=np.uint8)
+        idx = y[inside].astype(np.int64) * self.width + x[inside]
+        free = (bits[idx >> 3] >> (idx & 7).astype(np.uint8)) & 1 == 0
+        result = inside.copy()
+        result[np.flatnonzero(inside)[~free]] = False
+        return result
+
+    def place(self, x, y, f, mask=None):
+        """
+        Place robots at ``x, y`` facing ``f``.
+
+        Arguments broadcast against the fleet: each may be a scalar or an
+        array of length ``len(self)``. ``f`` is a direction string or heading
+        codes (0-3). Robots whose target is invalid keep their old state.
+
+        :param mask: Optional boolean array restricting which robots are placed
+        :return: Boolean array, True where the placement was applied
+        """
+        n = len(self)
+        if isinstance(f, str):
+            f = DIRECTIONS.index(f) if f in DIRECTIONS else UNPLACED
+        x = np.broadcast_to(np.asarray(x), (n,))
+        y = np.broadcast_to(np.asarray(y), (n,))
+        f = np.broadcast_to(np.asarray(f), (n,))
+
+        ok = ((x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+              & (f >= 0) & (f < 4))
+        ok = self._open(x, y, ok)
+        if mask is not None:
+            ok &= np.asarray(mask, dtype=bool)
+
+        self.x[ok] = x[ok]
+        self.y[ok] = y[ok]
+        self.heading[ok] = f[ok]
+        return ok
+
+    def move(self, mask=None):
+        """
+        Move selected robots one unit forward unless they would fall off or
+        enter a blocked cell.
+
+        :return: Boolean array, True where a robot actually moved
+        """
+        selected = self._select(mask)
+        h = self.heading[selected]
+        nx = self.x[selected] + _DX[h]
+        ny = self.y[selected] + _DY[h]
+        inside = (nx >= 0) & (nx < self.width) & (ny >= 0) & (ny < self.height)
+        inside = self._open(nx, ny, inside)
+
+        moved = np.zeros(len(self), dtype=bool)
+        moved[np.flatnonzero(selected)[inside]] = True
+        self.x[moved] = nx[inside]
+        self.y[moved] = ny[inside]
+        return moved
+
+    def left(self, mask=None):
+        """Rotate selected robots 90 degrees left."""
+        selected = self._select(mask)
+        self.heading[selected] = (self.heading[selected] - 1) % 4
+
+    def right(self, mask=None):
+        """Rotate selected robots 90 degrees right."""
+        selected = self._select(mask)
+        self.heading[selected] = (self.heading[selected] + 1) % 4
+
+    def report(self):
+        """
+        Get the state of every robot as an ``(n, 3)`` integer array.
+
+        Columns are ``x, y, heading``; rows of unplaced robots are all -1.
+        """
+        out = np.stack([self.x, self.y, self.heading.astype(np.int32)], axis=1)
+        out[self.heading == UNPLACED] = UNPLACED
+        return out
+
+    def write_csv(self, stream, chunk=65536):
+        """
+        Stream ``index,X,Y,F`` lines for every placed robot to a text stream.
+
+        Rows are formatted ``chunk`` robots at a time so memory stays bounded
+        for very large fleets.
+
+        :return: Number of rows written
+        """
+        names = np.array(DIRECTIONS)
+        stream.write("robot,x,y,f\n")
+        rows = 0
+        for start in range(0, len(self), chunk):
+            stop = start + chunk
+            idx = np.flatnonzero(self.heading[start:stop] != UNPLACED) + start
+            if not len(idx):
+                continue
+            cols = (idx.astype(str), self.x[idx].astype(str),
+                    self.y[idx].astype(str), names[self.heading[idx]])
+            lines = cols[0]
+            for col in cols[1:]:
+                lines = np.char.add(np.char.add(lines, ","), col)
+            stream.write("\n".join(lines.tolist()) + "\n")
+            rows += len(idx)
+        return rows
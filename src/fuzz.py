@@ -0,0 +1,371 @@
+# src/fuzz.py
+"""
+Differential fuzzing of the fast engines against :class:`robot.Robot`.
+
+Random programs (``command_parser.Program``) are run through ``Robot`` and
+through an engine under test. Both must produce the same observations: every
+REPORT output while placed, then the final pose. Programs start unplaced and
+mix valid and invalid PLACEs, MOVE/LEFT/RIGHT/REPORT before any PLACE, and
+runs of MOVEs that walk into the edges (and blocked cells, if the board has
+any). A diverging program is shrunk with delta debugging to a minimal one
+that still diverges.
+
+Engines take a list of programs and the board, and return one observation
+list per program, so batch engines such as ``RobotFleet`` run a whole batch
+in lock-step. Engines in ``TABLE_ENGINES`` also take a ``TransitionTable``;
+:func:`fuzz` builds one per run and passes it in. A new ``Robot``-like class is wrapped with
+:func:`robot_engine` and added to ``ENGINES``::
+
+    python fuzz.py --engine table --programs 100000 --length 100
+"""
+import functools
+import random
+import time
+from collections import namedtuple
+
+try:
+    from .robot import Robot, DIRECTIONS
+    from .board import Board
+    from .engine import TransitionTable, TableRobot, MOVE, LEFT, RIGHT, REPORT, PLACE, EXIT
+    from .command_parser import Program, run, run_table
+    from .compiler import compile_program
+except ImportError:  # executed as a script from src/
+    from robot import Robot, DIRECTIONS
+    from board import Board
+    from engine import TransitionTable, TableRobot, MOVE, LEFT, RIGHT, REPORT, PLACE, EXIT
+    from command_parser import Program, run, run_table
+    from compiler import compile_program
+
+DEFAULT_LENGTH = 64
+DEFAULT_BATCH = 1000
+
+# Relative weight of each opcode in generated programs
+WEIGHTS = {MOVE: 40, LEFT: 12, RIGHT: 12, REPORT: 15, PLACE: 20, EXIT: 1}
+# Share of PLACEs with an off-board coordinate or bad heading
+INVALID_PLACE = 0.3
+# Chance that a command starts a run of MOVEs towards an edge
+EDGE_WALK = 0.02
+
+# Each opcode repeated by its weight: unweighted choices() is much cheaper
+_POOL = [op for op, weight in WEIGHTS.items() for _ in range(weight)]
+_NAMES = {MOVE: "MOVE", LEFT: "LEFT", RIGHT: "RIGHT", REPORT: "REPORT", EXIT: "EXIT"}
+
+Divergence = namedtuple("Divergence", "seed index program expected actual")
+Divergence.__doc__ = """
+A program on which an engine disagreed with ``Robot``.
+
+``seed`` and ``index`` regenerate the original program; ``program`` is the
+shrunk one, as command lines.
+"""
+
+
+# -- programs --
+
+def make_program(commands):
+    """Build a ``Program`` from ``(opcode, (x, y, heading) or None)`` pairs."""
+    program = Program()
+    for op, args in commands:
+        program.ops.append(op)
+        if op == PLACE:
+            program.args.extend(args)
+    return program
+
+
+def program_lines(program):
+    """Command lines for a program; invalid headings are written as ``UP``."""
+    lines = []
+    for op, args in program:
+        if op == PLACE:
+            x, y, h = args
+            lines.append(f"PLACE {x},{y},{DIRECTIONS[h] if h >= 0 else 'UP'}")
+        else:
+            lines.append(_NAMES[op])
+    return lines
+
+
+def generate(rng, length=DEFAULT_LENGTH, board=None):
+    """
+    Random program of ``length`` commands.
+
+    :param rng: ``random.Random`` instance
+    :param board: Board that sets the PLACE coordinate ranges (default 5x5)
+    """
+    board = board or Board()
+    width, height = board.width, board.height
+    ops = rng.choices(_POOL, k=length)
+    # Edge walks: a turn, then enough MOVEs to reach and push past an edge
+    pos = int(rng.expovariate(EDGE_WALK))
+    while pos < length:
+        walk = rng.randint(1, max(width, height) + 2)
+        ops[pos] = rng.choice((LEFT, RIGHT))
+        ops[pos + 1:pos + 1 + walk] = [MOVE] * len(ops[pos + 1:pos + 1 + walk])
+        pos += 1 + walk + int(rng.expovariate(EDGE_WALK))
+
+    program = Program()
+    program.ops.extend(ops)
+    args = program.args
+    random_ = rng.random
+    for _ in range(ops.count(PLACE)):
+        x, y, h = int(random_() * width), int(random_() * height), int(random_() * 4)
+        if random_() < INVALID_PLACE:
+            bad = int(random_() * 3)
+            if bad == 0:
+                x = rng.choice((-1, width, -2**31, 2**31 - 1))
+            elif bad == 1:
+                y = rng.choice((-1, height, -2**31, 2**31 - 1))
+            else:
+                h = -1
+        args.extend((x, y, h))
+    return program
+
+
+def _until_exit(program):
+    """Commands up to (not including) the first EXIT."""
+    for op, args in program:
+        if op == EXIT:
+            return
+        yield op, args
+
+
+# -- engines --
+
+def robot_engine(factory):
+    """
+    Engine for any ``Robot``-like class: ``factory(board)`` returns a fresh
+    object with ``place/move/left/right/report``, driven by ``run``.
+    """
+    def engine(programs, board):
+        results = []
+        for program in programs:
+            robot = factory(board)
+            out = []
+            run(program, robot, on_report=out.append)
+            out.append(robot.report())
+            results.append(out)
+        return results
+    return engine
+
+
+# Observations from ``Robot``, the engine everything is checked against
+reference = robot_engine(lambda board: Robot(board=board))
+
+
+def table_engine(programs, board, table=None):
+    """
+    ``run_table`` on a ``TransitionTable``.
+
+    :param table: Table for ``board`` (default: built for this call)
+    """
+    table = table or TransitionTable(board=board)
+    results = []
+    for program in programs:
+        out = []
+        state = run_table(program, table, on_report=out.append)
+        out.append(table.report(state))
+        results.append(out)
+    return results
+
+
+def table_robot_engine(programs, board, table=None):
+    """``TableRobot`` driven through the same ``run`` loop as ``Robot``."""
+    table = table or TransitionTable(board=board)
+    return robot_engine(lambda board: TableRobot(table))(programs, board)
+
+
+def compiler_engine(programs, board, table=None):
+    """``compile_program`` mappings, one per stretch between REPORTs."""
+    table = table or TransitionTable(board=board)
+    results = []
+    for program in programs:
+        out = []
+        state = 0
+        segment = []
+        for op, args in _until_exit(program):
+            if op == REPORT:
+                state = compile_program(program_lines(make_program(segment)), table)[state]
+                segment = []
+                if state:
+                    out.append(table.report(state))
+            else:
+                segment.append((op, args))
+        state = compile_program(program_lines(make_program(segment)), table)[state]
+        out.append(table.report(state))
+        results.append(out)
+    return results
+
+
+def fleet_engine(programs, board):
+    """
+    ``RobotFleet`` with one robot per program, all stepped in lock-step:
+    each step is one masked fleet call per opcode.
+    """
+    import numpy as np
+    try:
+        from .fleet import RobotFleet
+    except ImportError:  # executed as a script from src/
+        from fleet import RobotFleet
+
+    n = len(programs)
+    length = max((len(p) for p in programs), default=0)
+    ops = np.full((n, length), EXIT, dtype=np.uint8)
+    px = np.zeros((n, length), dtype=np.int64)
+    py = np.zeros((n, length), dtype=np.int64)
+    ph = np.full((n, length), -1, dtype=np.int64)
+    for i, program in enumerate(programs):
+        row = np.frombuffer(program.ops, dtype=np.uint8)
+        ops[i, :len(row)] = row
+        places = np.flatnonzero(row == PLACE)
+        args = np.asarray(program.args, dtype=np.int64).reshape(-1, 3)
+        px[i, places], py[i, places], ph[i, places] = args.T
+
+    fleet = RobotFleet(n, board=board)
+    active = np.ones(n, dtype=bool)
+    results = [[] for _ in range(n)]
+    for step in range(length):
+        col = ops[:, step]
+        active &= col != EXIT
+        fleet.move(active & (col == MOVE))
+        fleet.left(active & (col == LEFT))
+        fleet.right(active & (col == RIGHT))
+        fleet.place(px[:, step], py[:, step], ph[:, step], mask=active & (col == PLACE))
+        reporting = np.flatnonzero(active & (col == REPORT) & (fleet.heading >= 0))
+        for i in reporting:
+            results[i].append(_fleet_report(fleet, i))
+    for i in range(n):
+        results[i].append(_fleet_report(fleet, i) if fleet.heading[i] >= 0 else None)
+    return results
+
+
+def _fleet_report(fleet, i):
+    return f"{fleet.x[i]},{fleet.y[i]},{DIRECTIONS[fleet.heading[i]]}"
+
+
+ENGINES = {
+    "table": table_engine,
+    "table-robot": table_robot_engine,
+    "compiler": compiler_engine,
+    "fleet": fleet_engine,
+}
+
+# Engines that take a ``table`` argument
+TABLE_ENGINES = {table_engine, table_robot_engine, compiler_engine}
+
+
+# -- shrinking --
+
+def shrink(commands, diverges):
+    """
+    Delta-debug a failing command list down to a 1-minimal one.
+
+    :param commands: List of ``(opcode, args)`` pairs for which
+                     ``diverges(commands)`` is True
+    :param diverges: Predicate on a command list
+    :return: A sublist that still diverges, from which no single command
+             can be removed
+    """
+    n = 2
+    while len(commands) >= 2:
+        chunk = len(commands) // n
+        reduced = False
+        for start in range(0, len(commands), chunk):
+            complement = commands[:start] + commands[start + chunk:]
+            if diverges(complement):
+                commands = complement
+                n = max(n - 1, 2)
+                reduced = True
+                break
+        if not reduced:
+            if chunk == 1:
+                break
+            n = min(n * 2, len(commands))
+    return commands
+
+
+# -- driver --
+
+def fuzz(engine, seed=0, programs=10000, length=DEFAULT_LENGTH,
+         board=None, batch=DEFAULT_BATCH):
+    """
+    Run ``programs`` random programs through ``engine`` and ``Robot``.
+
+    :param engine: Engine function (see ``ENGINES``)
+    :param board: Board to run on (default: open 5x5)
+    :param batch: Programs handed to the engine per call
+    :return: The first ``Divergence`` (shrunk), or None if all agreed
+    """
+    board = board or Board()
+    if engine in TABLE_ENGINES:
+        # One table per run, released with it
+        engine = functools.partial(engine, table=TransitionTable(board=board))
+    rng = random.Random(seed)
+    done = 0
+    while done < programs:
+        chunk = [generate(rng, length, board) for _ in range(min(batch, programs - done))]
+        expected = reference(chunk, board)
+        actual = engine(chunk, board)
+        for offset, (want, got) in enumerate(zip(expected, actual)):
+            if want != got:
+                return _diverged(engine, board, seed, done + offset, chunk[offset])
+        done += len(chunk)
+    return None
+
+
+def _diverged(engine, board, seed, index, program):
+    def diverges(commands):
+        candidate = make_program(commands)
+        return reference([candidate], board) != engine([candidate], board)
+
+    minimal = make_program(shrink(list(program), diverges))
+    return Divergence(seed, index, program_lines(minimal),
+                      reference([minimal], board)[0], engine([minimal], board)[0])
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Differential fuzzing of rover engines against Robot")
+    parser.add_argument("--engine", choices=sorted(ENGINES), action="append",
+                        help="engine to test (repeatable; default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--programs", type=int, default=10000)
+    parser.add_argument("--length", type=int, default=DEFAULT_LENGTH, help="commands per program")
+    parser.add_argument("--size", metavar="WxH", default="5x5", help="board size (default 5x5)")
+    parser.add_argument("--blocked", type=float, default=0.0, metavar="FRACTION",
+                        help="share of cells blocked at random (default 0)")
+    args = parser.parse_args(argv)
+
+    try:
+        width, _, height = args.size.lower().partition("x")
+        board = Board(int(width), int(height))
+    except ValueError as e:
+        parser.error(f"invalid board: {e}")
+    layout = random.Random(args.seed)
+    for y in range(board.height):
+        for x in range(board.width):
+            if layout.random() < args.blocked:
+                board.block(x, y)
+
+    failed = False
+    for name in args.engine or sorted(ENGINES):
+        start = time.perf_counter()
+        try:
+            found = fuzz(ENGINES[name], args.seed, args.programs, args.length, board)
+        except ImportError as e:
+            print(f"{name:<12} skipped ({e})")
+            continue
+        elapsed = time.perf_counter() - start
+        steps = args.programs * args.length
+        if found is None:
+            print(f"{name:<12} ok    {steps:,} steps in {elapsed:.1f} s ({steps / elapsed:,.0f} steps/s)")
+            continue
+        failed = True
+        print(f"{name:<12} DIVERGED on program {found.index} (seed {found.seed}); minimal program:")
+        for line in found.program:
+            print(f"    {line}")
+        print(f"  Robot:  {found.expected}")
+        print(f"  {name}: {found.actual}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
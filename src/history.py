@@ -0,0 +1,203 @@
+# src/history.py
+"""
+Bounded undo/redo history for interactive front-ends.
+
+The robot state is packed into one integer with ``engine.encode`` (0 means
+not placed). Each command that changes the state is stored as the XOR of the
+states before and after it, so undo and redo are a single XOR against the
+current state, O(1) and four bytes per command. The deltas live in a
+fixed-size ring buffer: once ``capacity`` commands are held, the oldest is
+dropped, so a long session never grows memory.
+
+Every ``snapshot_every`` commands the full state is also kept, which lets
+:meth:`History.seek` jump to any retained step by replaying at most
+``snapshot_every / 2`` deltas instead of walking the whole history.
+"""
+from array import array
+from collections import deque
+
+try:
+    from .engine import encode, decode, UNPLACED
+    from .robot import DIRECTIONS
+except ImportError:  # executed as a script from src/
+    from engine import encode, decode, UNPLACED
+    from robot import DIRECTIONS
+
+DEFAULT_CAPACITY = 10000
+DEFAULT_SNAPSHOT_EVERY = 256
+
+
+class History:
+    """
+    Undo/redo stack for one robot.
+
+    Steps are numbered from the start of the session: step ``n`` is the
+    state after the ``n``-th state-changing command. Only the last
+    ``capacity`` steps can be revisited.
+    """
+
+    def __init__(self, robot, capacity=DEFAULT_CAPACITY,
+                 snapshot_every=DEFAULT_SNAPSHOT_EVERY, width=None):
+        """
+        :param robot: ``Robot``-like object with ``x``, ``y`` and settable ``f``
+        :param capacity: Maximum number of commands kept
+        :param snapshot_every: Steps between full-state snapshots
+        :param width: Board width used to pack positions (default: the
+                      robot's board, else 5)
+        :raises ValueError: If ``capacity`` or ``snapshot_every`` is not positive
+        """
+        if capacity < 1 or snapshot_every < 1:
+            raise ValueError("capacity and snapshot_every must be positive")
+        self.robot = robot
+        self.capacity = capacity
+        self.snapshot_every = snapshot_every
+        if width is None:
+            board = getattr(robot, "board", None)
+            width = board.width if board is not None else 5
+        self.width = width
+        self._deltas = array('I', bytes(4 * capacity))
+        self._head = 0       # ring index of the delta leading to step `oldest + 1`
+        self._count = 0      # deltas held, including undone ones
+        self._undone = 0     # deltas beyond the current position (redo stack)
+        self.oldest = 0      # earliest step that can still be reached
+        self.current = self.capture()
+        self._snapshots = deque([(0, self.current)])
+
+    # -- state packing --
+
+    def capture(self):
+        """The robot's state as a packed integer."""
+        robot = self.robot
+        if robot.x is None:
+            return UNPLACED
+        return encode(robot.x, robot.y, DIRECTIONS.index(robot.f), self.width)
+
+    def restore(self, state):
+        """Put the robot in a packed state."""
+        robot = self.robot
+        pos = decode(state, self.width)
+        if pos is None:
+            robot.x = robot.y = robot.f = None
+        else:
+            robot.x, robot.y, h = pos
+            robot.f = DIRECTIONS[h]
+        self.current = state
+
+    # -- positions --
+
+    @property
+    def position(self):
+        """Step the robot is at now."""
+        return self.oldest + self._count - self._undone
+
+    @property
+    def newest(self):
+        """Latest step that can be redone to."""
+        return self.oldest + self._count
+
+    def can_undo(self):
+        return self._count > self._undone
+
+    def can_redo(self):
+        return self._undone > 0
+
+    @property
+    def nbytes(self):
+        """Memory used by deltas and snapshots (fixed by the two limits)."""
+        return self._deltas.itemsize * self.capacity + 16 * len(self._snapshots)
+
+    # -- recording --
+
+    def run(self, command, *args):
+        """
+        Call ``command(*args)`` (e.g. ``robot.move``) and record it if the
+        state changed. Anything that changed the robot behind the
+        history's back since the last call is recorded as its own step.
+
+        :return: Whatever the command returned
+        """
+        self.sync()
+        result = command(*args)
+        after = self.capture()
+        if after != self.current:
+            self.record(after)
+        return result
+
+    def sync(self):
+        """Record any change made to the robot outside :meth:`run` as one step."""
+        actual = self.capture()
+        if actual != self.current:
+            self.record(actual)
+
+    def record(self, after):
+        """Record a move from the current state to packed state ``after``."""
+        if self._undone:
+            self._count -= self._undone
+            self._undone = 0
+            step = self.position
+            while self._snapshots and self._snapshots[-1][0] > step:
+                self._snapshots.pop()
+        if self._count == self.capacity:
+            self._head = (self._head + 1) % self.capacity
+            self._count -= 1
+            self.oldest += 1
+            if self._snapshots and self._snapshots[0][0] < self.oldest:
+                self._snapshots.popleft()
+        self._deltas[(self._head + self._count) % self.capacity] = self.current ^ after
+        self._count += 1
+        self.current = after
+        if self.position % self.snapshot_every == 0:
+            self._snapshots.append((self.position, after))
+
+    # -- navigation --
+
+    def undo(self):
+        """
+        Step back one command.
+
+        :return: True if the robot changed, False if there is nothing to undo
+        """
+        if not self.can_undo():
+            return False
+        self._undone += 1
+        self.restore(self.current ^ self._delta(self.position))
+        return True
+
+    def redo(self):
+        """
+        Re-apply the last undone command.
+
+        :return: True if the robot changed, False if there is nothing to redo
+        """
+        if not self._undone:
+            return False
+        delta = self._delta(self.position)
+        self._undone -= 1
+        self.restore(self.current ^ delta)
+        return True
+
+    def seek(self, step):
+        """
+        Move to any retained step in one go (undo or redo many at once).
+
+        :raises IndexError: If ``step`` is outside ``oldest..newest``
+        """
+        if not self.oldest <= step <= self.newest:
+            raise IndexError(f"step {step} out of range {self.oldest}..{self.newest}")
+        # Start from whichever known state is closest: here, or a snapshot
+        at, state = self.position, self.current
+        for snap_step, snap_state in self._snapshots:
+            if abs(snap_step - step) < abs(at - step):
+                at, state = snap_step, snap_state
+        while at < step:
+            state ^= self._delta(at)
+            at += 1
+        while at > step:
+            at -= 1
+            state ^= self._delta(at)
+        self._undone = self.newest - step
+        self.restore(state)
+
+    def _delta(self, step):
+        """Delta taking step ``step`` to ``step + 1``."""
+        return self._deltas[(self._head + step - self.oldest) % self.capacity]
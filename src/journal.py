@@ -0,0 +1,225 @@
+# src/journal.py
+"""
+Append-only binary journal of robot commands and the states they produced.
+
+A journal is a 10-byte header (magic ``ROVJ``, format version, board width
+and height) followed by fixed-width 6-byte records packed as ``<BBHH``:
+
+* ``op``      engine opcode (``MOVE`` ... ``PLACE``); bit 7 set if ignored
+* ``heading`` index into ``DIRECTIONS``, 255 when not placed
+* ``x, y``    position after the command, 65535 when not placed
+
+:class:`JournalWriter` is an event sink (see ``events.py``), so recording a
+session is just attaching it to a robot. :class:`Journal` reads through a
+read-only ``mmap``: records are unpacked on demand, so a multi-GB journal is
+never loaded into memory. A torn final record (e.g. after a crash) is
+ignored by readers and cut off before a writer appends.
+"""
+import mmap
+import os
+import struct
+from collections import namedtuple
+
+try:
+    from .robot import DIRECTIONS, HEADINGS
+    from .engine import OPCODES, MOVE, LEFT, RIGHT, PLACE
+    from .events import EventSink, MultiSink
+except ImportError:  # executed as a script from src/
+    from robot import DIRECTIONS, HEADINGS
+    from engine import OPCODES, MOVE, LEFT, RIGHT, PLACE
+    from events import EventSink, MultiSink
+
+MAGIC = b"ROVJ"
+VERSION = 1
+HEADER = struct.Struct("<4sHHH")
+RECORD = struct.Struct("<BBHH")
+
+IGNORED = 0x80
+NO_HEADING = 0xFF
+NO_COORD = 0xFFFF
+
+# Records unpacked per mmap slice while iterating
+_SCAN_RECORDS = 1 << 16
+
+_OP_NAMES = {op: name.lower() for name, op in OPCODES.items()}
+_COMMAND_OPS = {name: op for op, name in _OP_NAMES.items()}
+_pack = RECORD.pack
+_UNPLACED_STATE = (NO_HEADING, NO_COORD, NO_COORD)
+
+Event = namedtuple("Event", "command applied x y f")
+Event.__doc__ = """
+One journaled command.
+
+:ivar command: ``"place"``, ``"move"``, ``"left"``, ``"right"`` or ``"report"``
+:ivar applied: False if the robot ignored the command
+:ivar x, y, f: State after the command (None when not placed)
+"""
+
+
+class JournalError(ValueError):
+    """The file is not a journal this version can read."""
+
+
+class JournalWriter(EventSink):
+    """
+    Event sink that appends one record per command to a journal file.
+
+    Records are buffered and written ``buffer_events`` at a time; call
+    :meth:`close` (or use ``with``) to flush the rest.
+    """
+
+    def __init__(self, path, width=5, height=5, buffer_events=4096):
+        """
+        :param path: Journal file; appended to if it already exists
+        :raises JournalError: If an existing file has another header, or the
+                              board is too large for 16-bit coordinates
+        """
+        if not (0 < width <= NO_COORD and 0 < height <= NO_COORD):
+            raise JournalError(f"{path}: journals hold boards up to "
+                               f"{NO_COORD}x{NO_COORD}, not {width}x{height}")
+        self._file = open(path, "ab")
+        try:
+            size = self._file.tell()
+            if size == 0:
+                self._file.write(HEADER.pack(MAGIC, VERSION, width, height))
+            else:
+                with open(path, "rb") as fh:
+                    header = _read_header(fh.read(HEADER.size), path)
+                if header != (width, height):
+                    raise JournalError(f"{path}: journal is for a {header[0]}x{header[1]} board")
+                # Drop a torn final record so new records stay aligned
+                torn = (size - HEADER.size) % RECORD.size
+                if torn:
+                    self._file.truncate(size - torn)
+        except BaseException:
+            self._file.close()
+            raise
+        self._buffer = bytearray()
+        self._limit = buffer_events * RECORD.size
+        self.events = 0
+
+    def attach(self, robot):
+        """Record ``robot``'s commands, alongside any sink it already has."""
+        robot.sink = self if robot.sink is None else MultiSink(robot.sink, self)
+        return robot
+
+    def emit(self, command, robot, reason=None):
+        op = _COMMAND_OPS[command] if reason is None else _COMMAND_OPS[command] | IGNORED
+        x = robot.x
+        buffer = self._buffer
+        if x is None:
+            buffer += _pack(op, *_UNPLACED_STATE)
+        else:
+            buffer += _pack(op, HEADINGS[robot.f], x, robot.y)
+        self.events += 1
+        if len(buffer) >= self._limit:
+            self.flush()
+
+    def flush(self):
+        self._file.write(self._buffer)
+        self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _read_header(data, path):
+    if len(data) < HEADER.size:
+        raise JournalError(f"{path}: truncated journal header")
+    magic, version, width, height = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise JournalError(f"{path}: not a rover journal")
+    if version != VERSION:
+        raise JournalError(f"{path}: unsupported journal version {version}")
+    return width, height
+
+
+def _event(op, heading, x, y):
+    if heading == NO_HEADING:
+        return Event(_OP_NAMES[op & ~IGNORED], not op & IGNORED, None, None, None)
+    return Event(_OP_NAMES[op & ~IGNORED], not op & IGNORED, x, y, DIRECTIONS[heading])
+
+
+class Journal:
+    """
+    Lazy, random-access view of a journal file.
+
+    ``len(journal)`` and ``journal[i]`` are O(1); iterating unpacks the
+    mapping a slice at a time.
+    """
+
+    def __init__(self, path):
+        """:raises JournalError: If the file is not a journal"""
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as fh:
+            self.width, self.height = _read_header(fh.read(HEADER.size), self.path)
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._count = (len(self._map) - HEADER.size) // RECORD.size
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("journal index out of range")
+        return _event(*RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size))
+
+    def __iter__(self):
+        for record in self.records():
+            yield _event(*record)
+
+    def records(self, start=0, stop=None):
+        """
+        Yield raw ``(op, heading, x, y)`` tuples, the fastest way to scan.
+
+        :param start: First record index
+        :param stop: End index (default: all records)
+        """
+        stop = self._count if stop is None else min(stop, self._count)
+        step = _SCAN_RECORDS * RECORD.size
+        begin = HEADER.size + start * RECORD.size
+        end = HEADER.size + stop * RECORD.size
+        for pos in range(begin, end, step):
+            yield from RECORD.iter_unpack(self._map[pos:min(pos + step, end)])
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def replay(journal, robot, start=0, stop=None):
+    """
+    Re-run the applied commands of a journal on ``robot``.
+
+    Ignored commands changed nothing and are skipped; a PLACE is replayed
+    from the state it produced.
+
+    :return: ``robot``
+    """
+    place, move, left, right = robot.place, robot.move, robot.left, robot.right
+    for op, heading, x, y in journal.records(start, stop):
+        if op == MOVE:
+            move()
+        elif op == LEFT:
+            left()
+        elif op == RIGHT:
+            right()
+        elif op == PLACE:
+            place(x, y, DIRECTIONS[heading])
+    return robot
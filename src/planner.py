@@ -0,0 +1,209 @@
+# src/planner.py
+"""
+Shortest MOVE/LEFT/RIGHT sequences between two rover poses.
+
+On small open boards every answer is precomputed: one breadth-first search
+per start state over the engine's ``next_state`` tables fills a next-hop
+table (``array('B')``, one byte per start/goal pair, 10 KB on 5x5). A query
+then just follows the table, O(path length).
+
+Boards too large for an all-pairs table, or with blocked cells, are searched
+on demand with A* (Manhattan distance is admissible: a MOVE changes it by at
+most one, a turn not at all). Each planner keeps its results in an LRU
+cache, emptied whenever the board's ``version`` changes.
+"""
+import heapq
+from array import array
+from collections import deque
+from functools import lru_cache
+
+try:
+    from .robot import HEADINGS, DELTAS
+    from .engine import TransitionTable, MOVE, LEFT, RIGHT, encode
+    from .board import Board
+except ImportError:  # executed as a script from src/
+    from robot import HEADINGS, DELTAS
+    from engine import TransitionTable, MOVE, LEFT, RIGHT, encode
+    from board import Board
+
+# Largest state count that gets an all-pairs table (table size is its square)
+MAX_TABLE_STATES = 1024
+
+ASTAR_CACHE_SIZE = 4096
+
+_NO_HOP = 255
+_STEPS = (MOVE, LEFT, RIGHT)
+_NAMES = {MOVE: "MOVE", LEFT: "LEFT", RIGHT: "RIGHT"}
+
+
+def build_next_hop(table):
+    """
+    All-pairs first-step table for a ``TransitionTable``.
+
+    :return: ``array('B')`` where entry ``src * table.size + dst`` is the
+             opcode of the first command on a shortest path (255 if
+             ``src == dst`` or unreachable)
+    """
+    size = table.size
+    next_state = table.next_state
+    hops = array('B', bytes([_NO_HOP]) * (size * size))
+    for src in range(1, size):
+        row = src * size
+        seen = {src}
+        queue = deque()
+        for op in _STEPS:
+            nxt = next_state[op][src]
+            if nxt not in seen:
+                seen.add(nxt)
+                hops[row + nxt] = op
+                queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            first = hops[row + state]
+            for op in _STEPS:
+                nxt = next_state[op][state]
+                if nxt not in seen:
+                    seen.add(nxt)
+                    hops[row + nxt] = first
+                    queue.append(nxt)
+    return hops
+
+
+def _astar(board, start, goal):
+    """
+    A* over ``(x, y, heading)`` poses on ``board``.
+
+    :return: Tuple of opcodes, or None if ``goal`` cannot be reached
+    """
+    is_open = board.is_open
+    gx, gy, _ = goal
+    frontier = [(abs(start[0] - gx) + abs(start[1] - gy), 0, start)]
+    came_from = {start: None}
+    cost = {start: 0}
+    while frontier:
+        _, g, pose = heapq.heappop(frontier)
+        if pose == goal:
+            ops = []
+            while came_from[pose] is not None:
+                pose, op = came_from[pose]
+                ops.append(op)
+            return tuple(reversed(ops))
+        if g > cost[pose]:
+            continue
+        x, y, h = pose
+        dx, dy = DELTAS[h]
+        nx, ny = x + dx, y + dy
+        steps = [(LEFT, (x, y, (h - 1) % 4)), (RIGHT, (x, y, (h + 1) % 4))]
+        if is_open(nx, ny):
+            steps.append((MOVE, (nx, ny, h)))
+        for op, nxt in steps:
+            if g + 1 < cost.get(nxt, g + 2):
+                cost[nxt] = g + 1
+                came_from[nxt] = (pose, op)
+                f = g + 1 + abs(nxt[0] - gx) + abs(nxt[1] - gy)
+                heapq.heappush(frontier, (f, g + 1, nxt))
+    return None
+
+
+class Planner:
+    """Shortest command sequences on one board."""
+
+    def __init__(self, width=5, height=5, blocked=(), max_table_states=MAX_TABLE_STATES,
+                 board=None):
+        """
+        :param blocked: Cells ``(x, y)`` the rover may not enter
+        :param max_table_states: Use the all-pairs table only up to this
+                                 many states; larger boards use A*
+        :param board: Plan on this ``board.Board`` instead (it overrides
+                      ``width``, ``height`` and ``blocked``)
+        """
+        self.board = board if board is not None else Board(width, height, blocked)
+        self.table = None
+        self._hops = None
+        # Per planner, so the cache never outlives (or pins) its board
+        self._search = lru_cache(maxsize=ASTAR_CACHE_SIZE)(
+            lambda start, goal: _astar(self.board, start, goal))
+        self._version = self.board.version
+        if 1 + self.board.width * self.board.height * 4 <= max_table_states:
+            self.table = TransitionTable(self.board.width, self.board.height)
+
+    def _pose(self, pose):
+        x, y, f = pose
+        heading = HEADINGS.get(f) if isinstance(f, str) else None
+        if (heading is None or not isinstance(x, int) or not isinstance(y, int)
+                or not self.board.contains(x, y)):
+            raise ValueError(f"invalid pose {x},{y},{f}")
+        if self.board.is_blocked(x, y):
+            raise ValueError(f"cell {x},{y} is blocked")
+        return x, y, heading
+
+    def plan(self, start, goal):
+        """
+        Shortest sequence of commands taking the rover from ``start`` to
+        ``goal``.
+
+        :param start: ``(x, y, f)`` such as ``(0, 0, "NORTH")``
+        :param goal: ``(x, y, f)``
+        :return: List of ``"MOVE"``/``"LEFT"``/``"RIGHT"``, or None if the
+                 goal cannot be reached
+        :raises ValueError: If either pose is off the board or blocked
+        """
+        start, goal = self._pose(start), self._pose(goal)
+        board = self.board
+        if self.table is None or board.blocked_count:
+            if board.version != self._version:
+                self._search.cache_clear()
+                self._version = board.version
+            ops = self._search(start, goal)
+            return None if ops is None else [_NAMES[op] for op in ops]
+
+        if self._hops is None:
+            self._hops = build_next_hop(self.table)
+        hops, size, next_state = self._hops, self.table.size, self.table.next_state
+        state = encode(*start, board.width)
+        target = encode(*goal, board.width)
+        path = []
+        while state != target:
+            op = hops[state * size + target]
+            if op == _NO_HOP:
+                return None
+            path.append(_NAMES[op])
+            state = next_state[op][state]
+        return path
+
+
+DEFAULT_PLANNER = Planner()
+
+
+def plan(start, goal):
+    """Shortest commands on the default 5x5 board (see :meth:`Planner.plan`)."""
+    return DEFAULT_PLANNER.plan(start, goal)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Shortest rover command sequence")
+    parser.add_argument("start", help="start pose X,Y,F")
+    parser.add_argument("goal", help="goal pose X,Y,F")
+    args = parser.parse_args(argv)
+
+    def pose(text):
+        try:
+            x, y, f = text.split(",")
+            return int(x), int(y), f.strip().upper()
+        except ValueError:
+            raise ValueError(f"invalid pose {text!r}, expected X,Y,F") from None
+
+    try:
+        path = plan(pose(args.start), pose(args.goal))
+    except ValueError as e:
+        parser.error(str(e))
+    if path is None:
+        print("unreachable")
+    else:
+        print("\n".join(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# src/profiling.py
+"""
+Per-command latency histograms for the front-ends.
+
+A :class:`LatencyRecorder` keeps one :class:`LatencyHistogram` per name
+("parse", "move", "print_table", ...). Histograms have a fixed set of
+log-spaced buckets, four per power of two, so recording is an integer
+bit-length and an array increment, memory never grows, and percentiles are
+within 25% of the true value.
+
+Instrumentation is opt-in. Front-ends hold ``None`` instead of a recorder
+when it is off, so the disabled cost is one ``is not None`` check per
+command, the same pattern as robot event sinks::
+
+    ROVER_LATENCY=1 python tk_app.py      # summary on stderr at exit
+    python basic.py --latency             # CLI flag, same thing
+"""
+import os
+import sys
+import time
+from array import array
+
+# Environment variable that switches latency recording on in the GUIs
+LATENCY_ENV = "ROVER_LATENCY"
+
+# Buckets per power of two is 1 << SUB_BITS
+SUB_BITS = 2
+_SUB = 1 << SUB_BITS
+N_BUCKETS = 64 << SUB_BITS
+
+PERCENTILES = (50, 95, 99)
+
+
+def bucket_index(ns):
+    """Histogram bucket for a duration in nanoseconds."""
+    if ns < _SUB:
+        return max(ns, 0)
+    exp = ns.bit_length() - 1
+    return (exp - SUB_BITS + 1) << SUB_BITS | (ns >> (exp - SUB_BITS)) & (_SUB - 1)
+
+
+def bucket_bounds(index):
+    """``(low, high)`` nanoseconds covered by a bucket, ``high`` exclusive."""
+    if index < _SUB:
+        return index, index + 1
+    exp = (index >> SUB_BITS) + SUB_BITS - 1
+    width = 1 << (exp - SUB_BITS)
+    low = (_SUB | index & (_SUB - 1)) * width
+    return low, low + width
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in nanoseconds."""
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = array('Q', bytes(8 * N_BUCKETS))
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, ns):
+        # bucket_index(), inlined: this runs once per timed command
+        if ns < _SUB:
+            self.counts[max(ns, 0)] += 1
+        else:
+            exp = ns.bit_length() - 1
+            self.counts[(exp - SUB_BITS + 1) << SUB_BITS | (ns >> (exp - SUB_BITS)) & (_SUB - 1)] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def merge(self, other):
+        """Add another histogram's samples to this one."""
+        for i, n in enumerate(other.counts):
+            if n:
+                self.counts[i] += n
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p):
+        """
+        Upper edge of the bucket holding the ``p``-th percentile (capped at
+        the largest sample).
+
+        :return: Nanoseconds, or None if the histogram is empty
+        """
+        if not self.count:
+            return None
+        rank = max(1, -(-self.count * p // 100))   # ceil
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bucket_bounds(i)[1] - 1, self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+
+class LatencyRecorder:
+    """Named latency histograms plus the clock used to fill them."""
+
+    def __init__(self, clock=time.perf_counter_ns):
+        """:param clock: Integer nanosecond clock"""
+        self.clock = clock
+        self.histograms = {}
+
+    def record(self, name, ns):
+        """Add one ``ns`` sample under ``name``."""
+        try:
+            self.histograms[name].add(ns)
+        except KeyError:
+            hist = self.histograms[name] = LatencyHistogram()
+            hist.add(ns)
+
+    def lap(self, name, start):
+        """
+        Record the time since ``start`` (a ``clock()`` reading) under
+        ``name``.
+
+        :return: The current clock reading, to start the next lap
+        """
+        now = self.clock()
+        try:
+            self.histograms[name].add(now - start)
+        except KeyError:
+            self.record(name, now - start)
+        return now
+
+    def timed(self, name, func):
+        """Wrap ``func`` so every call is recorded under ``name``."""
+        clock = self.clock
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, clock() - start)
+        wrapper.__wrapped__ = func
+        return wrapper
+
+    def summary(self):
+        """
+        One row per name, in first-recorded order.
+
+        :return: List of ``(name, count, p50, p95, p99, max)``, durations in ns
+        """
+        return [(name, h.count, *(h.percentile(p) for p in PERCENTILES), h.max)
+                for name, h in self.histograms.items()]
+
+    def format(self):
+        """Summary table as text, durations in microseconds."""
+        lines = [f"{'latency (µs)':<16}{'count':>9}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"]
+        for name, count, *durations in self.summary():
+            cells = "".join(f"{ns / 1000:>10.1f}" for ns in durations)
+            lines.append(f"{name:<16}{count:>9}{cells}")
+        return "\n".join(lines)
+
+    def dump(self, stream=None):
+        """Write :meth:`format` to ``stream`` (default stderr)."""
+        print(self.format(), file=stream or sys.stderr)
+
+
+class TimingSink:
+    """
+    Event sink wrapper that records how long the wrapped sink takes, so
+    logging cost shows up separately from the command itself.
+    """
+
+    def __init__(self, inner, recorder, name="sink"):
+        self.inner = inner
+        self.recorder = recorder
+        self.name = name
+
+    def emit(self, command, robot, reason=None):
+        clock = self.recorder.clock
+        start = clock()
+        self.inner.emit(command, robot, reason)
+        self.recorder.record(self.name, clock() - start)
+
+
+def from_env(environ=os.environ):
+    """A new recorder if ``ROVER_LATENCY`` is set to a non-empty, non-"0" value, else None."""
+    return LatencyRecorder() if environ.get(LATENCY_ENV, "0") not in ("", "0") else None
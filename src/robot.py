@@ -1,85 +1,141 @@
 # src/robot.py
-import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+try:
+    from .board import DEFAULT_BOARD
+except ImportError:  # executed as a script from src/
+    from board import DEFAULT_BOARD
+
+# Shared by every robot: heading codes index these tables
+DIRECTIONS = ('NORTH', 'EAST', 'SOUTH', 'WEST')
+HEADINGS = {name: code for code, name in enumerate(DIRECTIONS)}
+DELTAS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
 
 class Robot:
     """
-    A class representing a toy robot on a 5x5 tabletop.
+    A class representing a toy robot on a board (5x5 by default).
+
+    The heading is stored as an integer code into ``DIRECTIONS`` and the
+    instance uses ``__slots__``; ``f`` is a property that produces the
+    direction name on demand.
     """
 
-    def __init__(self):
+    __slots__ = ('x', 'y', '_heading', 'sink', 'board')
+
+    directions = DIRECTIONS
+
+    def __init__(self, sink=None, board=None):
         """
         Initialize the robot with no position or direction.
+
+        :param sink: Optional event sink (see ``events.py``); None is a no-op
+        :param board: ``board.Board`` to drive on (default: open 5x5)
         """
-        self.x = None  # X coordinate (0-4)
-        self.y = None  # Y coordinate (0-4)
-        self.f = None  # Facing direction
-        self.directions = ['NORTH', 'EAST', 'SOUTH', 'WEST']
+        self.x = None  # X coordinate (0 to board.width - 1)
+        self.y = None  # Y coordinate (0 to board.height - 1)
+        self._heading = None  # Index into DIRECTIONS
+        self.sink = sink
+        self.board = DEFAULT_BOARD if board is None else board
+
+    @property
+    def f(self):
+        """Facing direction name, or None if not placed."""
+        h = self._heading
+        return None if h is None else DIRECTIONS[h]
+
+    @f.setter
+    def f(self, name):
+        self._heading = None if name is None else HEADINGS[name]
 
     def place(self, x, y, f):
         """
         Place the robot on the table if the position is valid.
 
-        :param x: Integer X position (0-4)
-        :param y: Integer Y position (0-4)
+        :param x: Integer X position on the board
+        :param y: Integer Y position on the board
         :param f: Direction string (NORTH, SOUTH, EAST, WEST)
         :return: True if placed successfully, False otherwise
         """
         if not (isinstance(x, int) and isinstance(y, int)):
-            logging.warning("Invalid place: x and y must be integers")
+            if self.sink is not None:
+                self.sink.emit("place", self, "x and y must be integers")
             return False
-        if 0 <= x < 5 and 0 <= y < 5 and f in self.directions:
+        heading = HEADINGS.get(f) if isinstance(f, str) else None
+        board = self.board
+        if 0 <= x < board.width and 0 <= y < board.height and heading is not None:
+            if board.blocked_count and board.is_blocked(x, y):
+                if self.sink is not None:
+                    self.sink.emit("place", self, "cell blocked")
+                return False
             self.x = x
             self.y = y
-            self.f = f
-            logging.info(f"Placed at {x},{y},{f}")
+            self._heading = heading
+            if self.sink is not None:
+                self.sink.emit("place", self)
             return True
-        logging.warning(f"Invalid place: {x},{y},{f}")
+        if self.sink is not None:
+            self.sink.emit("place", self, f"invalid position {x},{y},{f}")
         return False
 
+    def ahead(self):
+        """
+        Get the cell one unit forward, ignoring the table edges.
+
+        :return: ``(x, y)`` or None if not placed
+        """
+        if self._heading is None:
+            return None
+        dx, dy = DELTAS[self._heading]
+        return self.x + dx, self.y + dy
+
     def move(self):
         """
-        Move the robot one unit forward if possible without falling off.
+        Move the robot one unit forward unless it would fall off the board
+        or enter a blocked cell.
         """
         if self.x is None:
-            logging.warning("Move ignored: Robot not placed")
+            if self.sink is not None:
+                self.sink.emit("move", self, "robot not placed")
             return
-        deltas = {
-            'NORTH': (0, 1),
-            'SOUTH': (0, -1),
-            'EAST': (1, 0),
-            'WEST': (-1, 0)
-        }
-        dx, dy = deltas[self.f]
+        dx, dy = DELTAS[self._heading]
         nx, ny = self.x + dx, self.y + dy
-        if 0 <= nx < 5 and 0 <= ny < 5:
+        board = self.board
+        if 0 <= nx < board.width and 0 <= ny < board.height:
+            if board.blocked_count:
+                i = ny * board.width + nx
+                if board.bits[i >> 3] >> (i & 7) & 1:
+                    if self.sink is not None:
+                        self.sink.emit("move", self, "cell blocked")
+                    return
             self.x, self.y = nx, ny
-            logging.info(f"Moved to {self.x},{self.y}")
-        else:
-            logging.warning("Move ignored: Would fall off table")
+            if self.sink is not None:
+                self.sink.emit("move", self)
+        elif self.sink is not None:
+            self.sink.emit("move", self, "would fall off table")
 
     def left(self):
         """
         Rotate the robot 90 degrees left.
         """
-        if self.f is None:
-            logging.warning("Left ignored: Robot not placed")
+        if self._heading is None:
+            if self.sink is not None:
+                self.sink.emit("left", self, "robot not placed")
             return
-        idx = self.directions.index(self.f)
-        self.f = self.directions[(idx - 1) % 4]
-        logging.info(f"Turned left to {self.f}")
+        self._heading = (self._heading - 1) % 4
+        if self.sink is not None:
+            self.sink.emit("left", self)
 
     def right(self):
         """
         Rotate the robot 90 degrees right.
         """
-        if self.f is None:
-            logging.warning("Right ignored: Robot not placed")
+        if self._heading is None:
+            if self.sink is not None:
+                self.sink.emit("right", self, "robot not placed")
             return
-        idx = self.directions.index(self.f)
-        self.f = self.directions[(idx + 1) % 4]
-        logging.info(f"Turned right to {self.f}")
+        self._heading = (self._heading + 1) % 4
+        if self.sink is not None:
+            self.sink.emit("right", self)
 
     def report(self):
         """
@@ -87,9 +143,10 @@ class Robot:
 
         :return: "X,Y,F" or None if not placed
         """
-        if self.f is None:
-            logging.warning("Report ignored: Robot not placed")
+        if self._heading is None:
+            if self.sink is not None:
+                self.sink.emit("report", self, "robot not placed")
             return None
-        report_str = f"{self.x},{self.y},{self.f}"
-        logging.info(f"Report: {report_str}")
-        return report_str
\ No newline at end of file
+        if self.sink is not None:
+            self.sink.emit("report", self)
+        return f"{self.x},{self.y},{DIRECTIONS[self._heading]}"
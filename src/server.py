@@ -0,0 +1,167 @@
+# src/server.py
+"""
+Headless asyncio control server: one rover session per TCP connection.
+
+Clients send the same line grammar as ``basic.py`` (``PLACE X,Y,F``,
+``MOVE``, ``LEFT``, ``RIGHT``, ``REPORT``, ``EXIT``) and may pipeline as many
+commands as they like. Replies are one line each:
+
+* ``REPORT``  -> ``X,Y,F`` or ``NOT PLACED``
+* bad line    -> ``ERROR line N, column C: message`` (session line numbers)
+* ``EXIT``    -> ``BYE`` and the connection is closed
+
+Everything else is silent. Replies come in command order, so a pipelining
+client can match them up one by one. A line longer than ``MAX_LINE`` bytes
+gets an ERROR and ends the session like EXIT. Each received chunk is tokenized in one go by
+``command_parser.Parser`` and all of its replies are written with a single
+``transport.write``. Reading pauses while the peer is not draining replies.
+
+    python server.py --port 7777
+"""
+import asyncio
+
+try:
+    from .robot import Robot, DIRECTIONS
+    from .engine import MOVE, LEFT, RIGHT, REPORT, PLACE
+    from .command_parser import Parser
+except ImportError:  # executed as a script from src/
+    from robot import Robot, DIRECTIONS
+    from engine import MOVE, LEFT, RIGHT, REPORT, PLACE
+    from command_parser import Parser
+
+DEFAULT_PORT = 7777
+
+# Longest command line a client may send; PLACE lines need a few dozen bytes
+MAX_LINE = 1024
+
+# Replies are written as ASCII bytes
+_NOT_PLACED = b"NOT PLACED\n"
+_BYE = b"BYE\n"
+
+
+class RoverSession(asyncio.Protocol):
+    """A single client connection driving its own Robot."""
+
+    def __init__(self, server):
+        self.server = server
+        self.robot = Robot()
+        self.parser = Parser(max_line=MAX_LINE)
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.server.sessions += 1
+
+    def connection_lost(self, exc):
+        self.server.sessions -= 1
+
+    def pause_writing(self):
+        self.transport.pause_reading()
+
+    def resume_writing(self):
+        self.transport.resume_reading()
+
+    def data_received(self, data):
+        if not self.parser.finished:
+            self._execute(self.parser.feed(data))
+
+    def eof_received(self):
+        if not self.parser.finished:
+            self._execute(self.parser.close())
+        return False
+
+    def _execute(self, program):
+        out = []
+        pos = i = 0
+        for err in program.errors:
+            # Ops before the bad line first, so replies stay in line order
+            i = self._run(program, pos, err.op_index, i, out)
+            pos = err.op_index
+            out.append(f"ERROR {err}\n".encode("ascii", "replace"))
+        self._run(program, pos, len(program), i, out)
+
+        self.server.commands += len(program)
+        if self.parser.finished:
+            out.append(_BYE)
+        if out:
+            self.transport.write(b"".join(out))
+        if self.parser.finished:
+            self.transport.close()
+
+    def _run(self, program, start, stop, i, out):
+        """
+        Execute ``program.ops[start:stop]``, appending REPORT replies to
+        ``out``.
+
+        :param i: Index into ``program.args`` of the next PLACE
+        :return: ``i`` after the executed ops
+        """
+        robot = self.robot
+        args = program.args
+        ops = program.ops if start == 0 and stop == len(program) else program.ops[start:stop]
+        for op in ops:
+            if op == MOVE:
+                robot.move()
+            elif op == LEFT:
+                robot.left()
+            elif op == RIGHT:
+                robot.right()
+            elif op == REPORT:
+                rep = robot.report()
+                out.append(rep.encode("ascii") + b"\n" if rep else _NOT_PLACED)
+            elif op == PLACE:
+                h = args[i + 2]
+                robot.place(args[i], args[i + 1], DIRECTIONS[h] if h >= 0 else None)
+                i += 3
+        return i
+
+
+class RoverServer:
+    """Owns the listening socket and simple counters for all sessions."""
+
+    def __init__(self):
+        self.sessions = 0
+        self.commands = 0
+        self._server = None
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT, backlog=4096):
+        """
+        Start listening.
+
+        :return: The bound ``(host, port)``; pass ``port=0`` for any free port
+        """
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            lambda: RoverSession(self), host, port, backlog=backlog)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rover line-protocol server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+
+    async def serve():
+        server = RoverServer()
+        host, port = await server.start(args.host, args.port)
+        print(f"Rover server listening on {host}:{port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
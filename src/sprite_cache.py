@@ -0,0 +1,115 @@
+# src/sprite_cache.py
+"""
+Content-hashed on-disk cache for rasterized GUI images.
+
+Rendering the rover SVGs (cairosvg) and resizing the logo (PIL) dominate the
+Tk app's start-up. Both results depend only on their inputs, so the PNG bytes
+are stored under the SHA-256 of those inputs and reused on the next launch.
+cairosvg and PIL are imported only on a cache miss.
+
+The cache lives in ``$XDG_CACHE_HOME/rover-simulator/sprites`` (default
+``~/.cache/...``); deleting the directory is always safe.
+"""
+import hashlib
+import os
+import tempfile
+
+# Bump to invalidate every cached image after a rendering change
+CACHE_VERSION = 1
+
+
+def default_cache_dir():
+    """Per-user cache directory for rendered sprites."""
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "rover-simulator", "sprites")
+
+
+def _svg_to_png(svg, width, height):
+    from cairosvg import svg2png
+    return svg2png(bytestring=svg, output_width=width, output_height=height)
+
+
+def _resize_png(data, height):
+    import io
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(data))
+    width = max(1, round(img.width * height / img.height))
+    out = io.BytesIO()
+    img.resize((width, height), Image.LANCZOS).save(out, format="PNG")
+    return out.getvalue()
+
+
+class SpriteCache:
+    """
+    PNG bytes keyed by a hash of whatever produced them.
+
+    :ivar hits: Lookups served from disk
+    :ivar misses: Lookups that had to render
+    """
+
+    def __init__(self, directory=None, svg_renderer=_svg_to_png, png_resizer=_resize_png):
+        """
+        :param directory: Cache directory (default: :func:`default_cache_dir`)
+        :param svg_renderer: ``(svg_bytes, width, height) -> png_bytes``
+        :param png_resizer: ``(png_bytes, height) -> png_bytes``
+        """
+        self.directory = directory or default_cache_dir()
+        self.svg_renderer = svg_renderer
+        self.png_resizer = png_resizer
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, kind, *parts):
+        digest = hashlib.sha256(f"{kind}:{CACHE_VERSION}".encode())
+        for part in parts:
+            digest.update(b"\0")
+            digest.update(part if isinstance(part, bytes) else str(part).encode())
+        return os.path.join(self.directory, f"{digest.hexdigest()}.png")
+
+    def _get(self, path, render):
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+            self.hits += 1
+            return data
+        except OSError:
+            pass
+        self.misses += 1
+        data = render()
+        self._store(path, data)
+        return data
+
+    def _store(self, path, data):
+        # A read-only or full disk only costs the next launch a re-render
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)  # atomic: readers never see half a file
+        except OSError:
+            pass
+
+    def svg_png(self, svg, width, height):
+        """
+        Rasterize an SVG document to PNG bytes.
+
+        :param svg: SVG source as ``str`` or ``bytes``
+        """
+        if isinstance(svg, str):
+            svg = svg.encode("utf-8")
+        path = self._path("svg", svg, width, height)
+        return self._get(path, lambda: self.svg_renderer(svg, width, height))
+
+    def resized_png(self, image_path, height):
+        """
+        PNG bytes of the image at ``image_path`` scaled to ``height`` pixels.
+
+        The key includes the file contents, so replacing the image on disk
+        invalidates its cached copy.
+        """
+        with open(image_path, "rb") as fh:
+            data = fh.read()
+        path = self._path("resize", data, height)
+        return self._get(path, lambda: self.png_resizer(data, height))
@@ -23,8 +23,15 @@
 
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from robot import Robot
+from board import Board, load_board, viewport
+from sprite_cache import SpriteCache
+from animation import FrameScheduler, Bounce, Replay
+from command_parser import parse_file
+from history import History
+from profiling import from_env as latency_from_env
+import base64
 import time
 import os
 
@@ -34,9 +41,22 @@ import os
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "assets")
 LOGO_PATH  = os.path.join(ASSETS_DIR, "logo.png")
 
+# Sprite rotation (degrees) for each heading
+ROVER_ROTATIONS = {"NORTH": 0, "EAST": 90, "SOUTH": 180, "WEST": -90}
+
+# Canvas layout; boards larger than TK_VIEWPORT cells per side scroll with
+# the rover
+CELL_SIZE = 70
+MARGIN = 25
+TK_VIEWPORT = 5
+CELL_FILL = "#2a3e52"
+HOVER_FILL = "#3a5066"
+BLOCKED_FILL = "#4a2e2e"
+
 class ToyRobotGUI:
     # ====================  REPLACE THE __init__ METHOD  ====================
-    def __init__(self, root):
+    def __init__(self, root, board=None):
+        """:param board: ``board.Board`` to drive on (default: open 5x5)"""
         self.root = root
         self.root.title("")                     # <-- remove native title
         self.root.geometry("800x600")
@@ -45,43 +65,17 @@ class ToyRobotGUI:
         # ----- HIDE NATIVE TITLE BAR -----
         self.root.overrideredirect(True)        # <-- custom title bar
 
+        # Rasterized logo and rover sprites, cached on disk between launches
+        self.sprites = SpriteCache()
+
         # ----- CUSTOM SKYBLUE TITLE BAR -----
         self.title_bar = tk.Frame(self.root, bg="skyblue", height=40)
         self.title_bar.pack(fill=tk.X)
         self.title_bar.pack_propagate(False)
 
-        # ---- LOGO (centered) ----
         # ---- LOGO (centered) ----
         try:
-            # Load the original image
-            logo_raw = tk.PhotoImage(file=LOGO_PATH)
-
-            # Title-bar height = 40 px  → target height
-            TARGET_HEIGHT = 40
-
-            # Compute scale factor so height fits exactly
-            scale = TARGET_HEIGHT / logo_raw.height()
-            new_width  = int(logo_raw.width()  * scale)
-            new_height = int(logo_raw.height() * scale)   # will be ≈40
-
-            # Tkinter scaling: zoom for enlargement, subsample for reduction
-            if scale > 1:
-                # Enlarge
-                logo_resized = logo_raw.zoom(int(scale), int(scale))
-            else:
-                # Reduce (subsample gives integer steps)
-                factor = int(1 / scale)
-                logo_resized = logo_raw.subsample(factor, factor)
-
-            # If the factor wasn't integer, fall back to PIL for perfect fit
-            if abs(logo_resized.height() - TARGET_HEIGHT) > 2:
-                # ----- OPTIONAL: use PIL for pixel-perfect resize -----
-                from PIL import Image, ImageTk
-                pil_img = Image.open(LOGO_PATH)
-                pil_img = pil_img.resize((new_width, new_height), Image.LANCZOS)
-                logo_resized = ImageTk.PhotoImage(pil_img)
-                # -----------------------------------------------------
-
+            logo_resized = self._load_logo(40)    # title-bar height
             self.logo_label = tk.Label(self.title_bar, image=logo_resized, bg="skyblue")
             self.logo_label.image = logo_resized          # keep reference
             self.logo_label.pack(expand=True)             # centered
@@ -106,21 +100,32 @@ class ToyRobotGUI:
         self.main_frame = tk.Frame(self.root, bg="#0f2027")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
 
+        # One frame timer for all canvas animations
+        self.animator = FrameScheduler(self.root)
+
         # ----- robot & UI init (unchanged) -----
-        self.robot = Robot()
+        self.robot = Robot(board=board or Board())
         self.placed = False
+        self.history = History(self.robot)
+
+        # Opt-in latency histograms (ROVER_LATENCY=1); handlers are wrapped
+        # before the buttons bind them, so nothing is timed when it is off
+        self.latency = latency_from_env()
+        if self.latency is not None:
+            for name in ("place_robot", "move", "left", "right", "report",
+                         "undo", "redo", "update_rover"):
+                setattr(self, name, self.latency.timed(name, getattr(self, name)))
 
         # --- SVG Rover (Embedded) ---
-        self.rover_svg = {
-            "NORTH": self._create_svg(0),
-            "EAST":  self._create_svg(90),
-            "SOUTH": self._create_svg(180),
-            "WEST":  self._create_svg(-90),
-        }
+        # Rendered on first use per heading; PNGs are reused across launches
+        self.rover_svg = {}
 
         self.setup_ui()
         self.canvas = None
         self.rover_item = None
+        self.rover_f = None
+        self.bounce = None
+        self.view = (0, 0)      # board cell shown in the bottom-left corner
         self.create_grid()
 
         # drag helpers
@@ -163,11 +168,11 @@ class ToyRobotGUI:
 
         tk.Label(place_frame, text="X:", bg="#1a2a3a", fg="white").grid(row=0, column=0, padx=5, pady=5)
         self.x_var = tk.IntVar(value=0)
-        tk.Spinbox(place_frame, from_=0, to=4, textvariable=self.x_var, width=5).grid(row=0, column=1, padx=5, pady=5)
+        tk.Spinbox(place_frame, from_=0, to=self.robot.board.width - 1, textvariable=self.x_var, width=5).grid(row=0, column=1, padx=5, pady=5)
 
         tk.Label(place_frame, text="Y:", bg="#1a2a3a", fg="white").grid(row=1, column=0, padx=5, pady=5)
         self.y_var = tk.IntVar(value=0)
-        tk.Spinbox(place_frame, from_=0, to=4, textvariable=self.y_var, width=5).grid(row=1, column=1, padx=5, pady=5)
+        tk.Spinbox(place_frame, from_=0, to=self.robot.board.height - 1, textvariable=self.y_var, width=5).grid(row=1, column=1, padx=5, pady=5)
 
         tk.Label(place_frame, text="Facing:", bg="#1a2a3a", fg="white").grid(row=2, column=0, padx=5, pady=5)
         self.f_var = tk.StringVar(value="NORTH")
@@ -183,6 +188,11 @@ class ToyRobotGUI:
         ttk.Button(cmd_frame, text="LEFT", command=self.left).grid(row=0, column=1, padx=5, pady=5)
         ttk.Button(cmd_frame, text="RIGHT", command=self.right).grid(row=1, column=0, padx=5, pady=5)
         ttk.Button(cmd_frame, text="REPORT", command=self.report).grid(row=1, column=1, padx=5, pady=5)
+        ttk.Button(cmd_frame, text="UNDO", command=self.undo).grid(row=2, column=0, padx=5, pady=5)
+        ttk.Button(cmd_frame, text="REDO", command=self.redo).grid(row=2, column=1, padx=5, pady=5)
+        ttk.Button(cmd_frame, text="REPLAY FILE", command=self.replay_file).grid(row=3, column=0, columnspan=2, pady=5)
+        self.root.bind("<Control-z>", lambda e: self.undo())
+        self.root.bind("<Control-y>", lambda e: self.redo())
 
         # Report
         self.report_label = tk.Label(left, text="Status: Not placed", bg="#1a2a3a", fg="#ffcc00", font=('Courier', 11))
@@ -196,27 +206,50 @@ class ToyRobotGUI:
         self.canvas = tk.Canvas(canvas_frame, width=400, height=400, bg="#1a2a3a", highlightthickness=0)
         self.canvas.pack()
 
-        cell_size = 70
-        margin = 25
-        for i in range(6):
-            x = margin + i * cell_size
-            y = margin + i * cell_size
-            self.canvas.create_line(x, margin, x, margin + 5*cell_size, fill="#334455", width=2)
-            self.canvas.create_line(margin, y, margin + 5*cell_size, y, fill="#334455", width=2)
+        board = self.robot.board
+        self.cols, self.rows = min(board.width, TK_VIEWPORT), min(board.height, TK_VIEWPORT)
+        for i in range(self.cols + 1):
+            x = MARGIN + i * CELL_SIZE
+            self.canvas.create_line(x, MARGIN, x, MARGIN + self.rows*CELL_SIZE, fill="#334455", width=2)
+        for i in range(self.rows + 1):
+            y = MARGIN + i * CELL_SIZE
+            self.canvas.create_line(MARGIN, y, MARGIN + self.cols*CELL_SIZE, y, fill="#334455", width=2)
 
+        # Keyed by on-screen column/row (from the bottom-left), not board cell
         self.cells = {}
-        for x in range(5):
-            for y in range(5):
-                cx = margin + x * cell_size + cell_size // 2
-                cy = margin + (4 - y) * cell_size + cell_size // 2
+        for x in range(self.cols):
+            for y in range(self.rows):
+                cx, cy = self.cell_center(x, y)
                 cell = self.canvas.create_rectangle(
                     cx - 30, cy - 30, cx + 30, cy + 30,
-                    fill="#2a3e52", outline="#445566", width=2, tags=f"cell_{x}_{y}"
+                    fill=self.cell_fill(x, y), outline="#445566", width=2, tags=f"cell_{x}_{y}"
                 )
                 self.cells[(x, y)] = cell
                 self.canvas.tag_bind(cell, "<Enter>", lambda e, xx=x, yy=y: self.hover_cell(xx, yy, enter=True))
                 self.canvas.tag_bind(cell, "<Leave>", lambda e, xx=x, yy=y: self.hover_cell(xx, yy, enter=False))
 
+    def cell_center(self, col, row):
+        """Canvas centre of the on-screen cell ``col, row``."""
+        return (MARGIN + col * CELL_SIZE + CELL_SIZE // 2,
+                MARGIN + (self.rows - 1 - row) * CELL_SIZE + CELL_SIZE // 2)
+
+    def cell_fill(self, col, row):
+        board = self.robot.board
+        x0, y0 = self.view
+        if board.blocked_count and board.is_blocked(x0 + col, y0 + row):
+            return BLOCKED_FILL
+        return CELL_FILL
+
+    def follow(self, x, y):
+        """Scroll the view so board cell ``x, y`` is visible, repainting if it moved."""
+        x0, y0 = self.view
+        if x0 <= x < x0 + self.cols and y0 <= y < y0 + self.rows:
+            return
+        board = self.robot.board
+        self.view = (viewport(board.width, x, self.cols), viewport(board.height, y, self.rows))
+        for (col, row), cell in self.cells.items():
+            self.canvas.itemconfig(cell, fill=self.cell_fill(col, row))
+
     # ====================  THE REST OF THE CLASS (unchanged)  ====================
     # (all the methods you already have: _create_svg, _svg_to_png_base64,
     #  hover_cell, place_robot, update_rover, animate_bounce,
@@ -250,18 +283,38 @@ class ToyRobotGUI:
         return tk.PhotoImage(data=self._svg_to_png_base64(svg))
 
     def _svg_to_png_base64(self, svg):
-        import io, base64
-        from cairosvg import svg2png
-        png = svg2png(bytestring=svg.encode('utf-8'), output_width=50, output_height=50)
+        png = self.sprites.svg_png(svg, 50, 50)
         return base64.b64encode(png).decode('utf-8')
 
+    def rover_sprite(self, f):
+        """PhotoImage for heading ``f``, rendered on first use."""
+        image = self.rover_svg.get(f)
+        if image is None:
+            image = self.rover_svg[f] = self._create_svg(ROVER_ROTATIONS[f])
+        return image
+
+    def _load_logo(self, target_height):
+        try:
+            png = self.sprites.resized_png(LOGO_PATH, target_height)
+            return tk.PhotoImage(data=base64.b64encode(png).decode('ascii'))
+        except ImportError:
+            pass
+
+        # No PIL: integer zoom/subsample is the best Tk can do on its own
+        logo_raw = tk.PhotoImage(file=LOGO_PATH)
+        scale = target_height / logo_raw.height()
+        if scale > 1:
+            return logo_raw.zoom(int(scale), int(scale))
+        factor = int(1 / scale)
+        return logo_raw.subsample(factor, factor)
+
     def hover_cell(self, x, y, enter):
-        color = "#3a5066" if enter else "#2a3e52"
+        color = HOVER_FILL if enter else self.cell_fill(x, y)
         self.canvas.itemconfig(self.cells[(x, y)], fill=color)
 
     def place_robot(self):
         x, y, f = self.x_var.get(), self.y_var.get(), self.f_var.get()
-        if self.robot.place(x, y, f):
+        if self.history.run(self.robot.place, x, y, f):
             self.placed = True
             self.update_rover()
             self.report_label.config(text=f"Placed: {x},{y},{f}", fg="#00ff88")
@@ -269,42 +322,78 @@ class ToyRobotGUI:
             messagebox.showerror("Error", "Invalid placement!")
 
     def update_rover(self):
-        if self.rover_item:
-            self.canvas.delete(self.rover_item)
         if not self.placed:
+            if self.rover_item is not None:
+                self.canvas.itemconfig(self.rover_item, state="hidden")
             return
         x, y = self.robot.x, self.robot.y
-        cell_size = 70
-        margin = 25
-        cx = margin + x * cell_size + cell_size // 2
-        cy = margin + (4 - y) * cell_size + cell_size // 2
-        self.rover_item = self.canvas.create_image(cx, cy, image=self.rover_svg[self.robot.f])
-        self.animate_bounce()
+        self.follow(x, y)
+        cx, cy = self.cell_center(x - self.view[0], y - self.view[1])
+        if self.rover_item is None:
+            self.rover_item = self.canvas.create_image(cx, cy, image=self.rover_sprite(self.robot.f))
+            self.rover_f = self.robot.f
+            self.animate_bounce()
+            return
+        # Reuse the one canvas item; keep the bounce phase it is in
+        self.canvas.coords(self.rover_item, cx, cy + self.bounce.offset)
+        self.canvas.itemconfig(self.rover_item, state="normal")
+        if self.rover_f != self.robot.f:
+            self.canvas.itemconfig(self.rover_item, image=self.rover_sprite(self.robot.f))
+            self.rover_f = self.robot.f
 
     def animate_bounce(self):
         if not self.placed or not self.rover_item:
             return
-        self.canvas.move(self.rover_item, 0, -2)
-        self.root.after(600, lambda: self.canvas.move(self.rover_item, 0, 2))
-        self.root.after(1200, self.animate_bounce)
+        # Replaces the bounce of the previous sprite instead of adding a loop
+        self.bounce = Bounce(self.canvas, self.rover_item)
+        self.animator.add(self.bounce, key="bounce")
+
+    def replay_file(self):
+        path = filedialog.askopenfilename(
+            title="Replay command file",
+            filetypes=[("Command scripts", "*.txt"), ("All files", "*")])
+        if not path:
+            return
+        try:
+            program = parse_file(path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Cannot read {path}: {e}")
+            return
+        self.start_replay(program)
+
+    def start_replay(self, program):
+        """Play a parsed program a batch of commands per frame, redrawing once per frame."""
+        self.animator.add(Replay(program, self.robot, on_frame=self._replay_frame), key="replay")
+
+    def _replay_frame(self, replay, finished):
+        self.placed = self.robot.x is not None
+        self.update_rover()
+        if finished:
+            status = f"Replayed {replay.done} commands"
+            self.history.sync()  # the whole replay is one undo step
+        else:
+            status = f"Replay {replay.done}/{replay.total}"
+        if replay.last_report:
+            status += f"\nREPORT: {replay.last_report}"
+        self.report_label.config(text=status, fg="#00ccff")
 
     def move(self):
         if not self.placed: return
         old_x, old_y = self.robot.x, self.robot.y
-        self.robot.move()
+        self.history.run(self.robot.move)
         if (self.robot.x, self.robot.y) != (old_x, old_y):
             self.update_rover()
             self.report_label.config(text=f"Moved to {self.robot.x},{self.robot.y}", fg="#00ccff")
 
     def left(self):
         if not self.placed: return
-        self.robot.left()
+        self.history.run(self.robot.left)
         self.update_rover()
         self.report_label.config(text=f"Facing {self.robot.f}", fg="#ffcc00")
 
     def right(self):
         if not self.placed: return
-        self.robot.right()
+        self.history.run(self.robot.right)
         self.update_rover()
         self.report_label.config(text=f"Facing {self.robot.f}", fg="#ffcc00")
 
@@ -314,10 +403,39 @@ class ToyRobotGUI:
         self.report_label.config(text=f"REPORT: {rep}", fg="#92fe9d")
         self.root.bell()
 
+    def undo(self):
+        if self.history.undo():
+            self._show_history_step("Undo")
+
+    def redo(self):
+        if self.history.redo():
+            self._show_history_step("Redo")
+
+    def _show_history_step(self, action):
+        self.placed = self.robot.x is not None
+        self.update_rover()
+        rep = self.robot.report() or "not placed"
+        self.report_label.config(text=f"{action}: {rep}", fg="#ffcc00")
+
 # --------------------------------------------------------------
 #  <<<  END OF CLASS – keep the if __name__ block unchanged  >>>
 # --------------------------------------------------------------
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rover Simulator desktop GUI")
+    parser.add_argument("--size", metavar="WxH", default="5x5", help="board size (default 5x5)")
+    parser.add_argument("--obstacles", metavar="FILE",
+                        help="board map: one line per row, top row first, '#' = blocked "
+                             "(sets the size)")
+    args = parser.parse_args()
+    try:
+        board = load_board(args.size, args.obstacles)
+    except (OSError, ValueError) as e:
+        parser.error(f"invalid board: {e}")
+
     root = tk.Tk()
-    app = ToyRobotGUI(root)
+    app = ToyRobotGUI(root, board)
     root.mainloop()
+    if app.latency is not None:
+        app.latency.dump()
@@ -0,0 +1,271 @@
+# src/web_grid.py
+"""
+HTML building blocks for the Streamlit UI in ``web_app.py``.
+
+Kept free of Streamlit imports so the grid markup can be built (and
+benchmarked) without a running Streamlit server. The static blocks are module
+constants: Streamlit re-executes ``web_app.py`` on every rerun, but imported
+modules are built only once per process.
+"""
+import base64
+
+try:
+    from .board import viewport as _window
+except ImportError:  # executed as a script from src/
+    from board import viewport as _window
+
+# --- Custom CSS ---
+APP_CSS = """
+<style>
+    .main {
+        background: linear-gradient(135deg, #0f2027, #203a43, #2c5364);
+        color: white;
+        font-family: 'Segoe UI', sans-serif;
+    }
+    .grid-container {
+        display: grid;
+        grid-template-columns: repeat(5, 1fr);
+        gap: 10px;
+        width: 100%;
+        max-width: 420px;
+        box-sizing: border-box;
+        margin: 25px auto;
+        padding: 25px;
+        background: rgba(255, 255, 255, 0.08);
+        border-radius: 20px;
+        box-shadow: 0 10px 40px rgba(0,0,0,0.4);
+        backdrop-filter: blur(12px);
+        border: 1px solid rgba(255,255,255,0.1);
+    }
+    .cell {
+        /* Sized by the grid track, so any number of columns fits */
+        width: 100%;
+        aspect-ratio: 1;
+        min-width: 0;
+        background: linear-gradient(145deg, #1a2a3a, #2a3e52);
+        border-radius: 20%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        box-shadow: 
+            inset 0 2px 6px rgba(0,0,0,0.3),
+            0 4px 12px rgba(0,0,0,0.2);
+        overflow: hidden;
+    }
+    .cell.blocked {
+        background: repeating-linear-gradient(45deg, #3a2a2a, #3a2a2a 8px, #2a1e1e 8px, #2a1e1e 16px);
+        color: #aa6655;
+    }
+    .cell:hover {
+        transform: translateY(-4px) scale(1.03);
+        box-shadow: 0 8px 20px rgba(0,0,0,0.4);
+    }
+    .rover {
+        width: 70%;
+        height: 70%;
+        animation: rover-bounce 1.8s infinite ease-in-out;
+        filter: drop-shadow(0 0 8px #00ff88);
+    }
+    @keyframes rover-bounce {
+        0%, 100% { transform: translateY(0); }
+        50% { transform: translateY(-3px); }
+    }
+    .title {
+        text-align: center;
+        font-size: 3rem;
+        font-weight: 900;
+        background: linear-gradient(90deg, #00c9ff, #92fe9d, #ff7e5f);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        margin: 20px 0 8px;
+        text-shadow: 0 4px 12px rgba(0,0,0,0.3);
+    }
+    .subtitle {
+        text-align: center;
+        color: #a0e7ff;
+        font-size: 1.2rem;
+        margin-bottom: 35px;
+        font-weight: 500;
+    }
+    .control-panel {
+        background: rgba(255, 255, 255, 0.1);
+        padding: 25px;
+        border-radius: 18px;
+        backdrop-filter: blur(14px);
+        box-shadow: 0 10px 35px rgba(0,0,0,0.3);
+        border: 1px solid rgba(255,255,255,0.15);
+    }
+    .report {
+        background: linear-gradient(45deg, #00c9ff, #92fe9d);
+        color: #000;
+        padding: 14px 24px;
+        border-radius: 14px;
+        font-weight: 800;
+        text-align: center;
+        font-size: 1.3rem;
+        margin-top: 18px;
+        box-shadow: 0 6px 20px rgba(0,0,0,0.3);
+        letter-spacing: 1px;
+    }
+    .stButton > button {
+        background: linear-gradient(45deg, #667eea, #764ba2);
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 10px 16px;
+        font-weight: 600;
+        transition: all 0.3s;
+    }
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 16px rgba(0,0,0,0.3);
+    }
+</style>
+"""
+
+# --- SVG Rover (Base + Rotated Versions) ---
+# Define the base rover once, hidden
+ROVER_DEFS = """
+<svg width="0" height="0">
+  <defs>
+    <g id="rover-base">
+      <!-- Body -->
+      <ellipse cx="50" cy="60" rx="36" ry="24" fill="url(#body)" stroke="#00cc66" stroke-width="3"/>
+      <!-- Cabin -->
+      <path d="M 35 45 Q 50 35, 65 45 L 65 55 Q 50 62, 35 55 Z" fill="url(#window)" stroke="#3399ff" stroke-width="2"/>
+      <!-- Wheels -->
+      <circle cx="28" cy="74" r="12" fill="#333" stroke="#111" stroke-width="3"/>
+      <circle cx="72" cy="74" r="12" fill="#333" stroke="#111" stroke-width="3"/>
+      <!-- Antenna -->
+      <line x1="50" y1="35" x2="50" y2="20" stroke="#ffcc00" stroke-width="3" stroke-linecap="round"/>
+      <circle cx="50" cy="16" r="5" fill="#ff6600"/>
+    </g>
+    <linearGradient id="body" x1="0%" y1="0%" x2="100%" y2="100%">
+      <stop offset="0%" stop-color="#00ff88"/>
+      <stop offset="100%" stop-color="#00cc66"/>
+    </linearGradient>
+    <linearGradient id="window" x1="0%" y1="0%" x2="0%" y2="100%">
+      <stop offset="0%" stop-color="#66ccff"/>
+      <stop offset="100%" stop-color="#3399ff"/>
+    </linearGradient>
+  </defs>
+</svg>
+"""
+
+# Emitted with a single st.markdown call per rerun
+STATIC_HEAD_HTML = APP_CSS + ROVER_DEFS
+
+# --- Rover SVGs by Direction (rotation via SVG transform) ---
+ROVER_SVG = {
+    "NORTH": '''
+    <svg class="rover" viewBox="0 0 100 100" xmlns="http://www.w3.org/2000/svg">
+      <g transform="rotate(0 50 50)">
+        <use href="#rover-base"/>
+      </g>
+    </svg>
+    ''',
+    "EAST": '''
+    <svg class="rover" viewBox="0 0 100 100" xmlns="http://www.w3.org/2000/svg">
+      <g transform="rotate(90 50 50)">
+        <use href="#rover-base"/>
+      </g>
+    </svg>
+    ''',
+    "SOUTH": '''
+    <svg class="rover" viewBox="0 0 100 100" xmlns="http://www.w3.org/2000/svg">
+      <g transform="rotate(180 50 50)">
+        <use href="#rover-base"/>
+      </g>
+    </svg>
+    ''',
+    "WEST": '''
+    <svg class="rover" viewBox="0 0 100 100" xmlns="http://www.w3.org/2000/svg">
+      <g transform="rotate(-90 50 50)">
+        <use href="#rover-base"/>
+      </g>
+    </svg>
+    '''
+}
+
+
+def build_title_bar_html(logo_path):
+    """
+    Build the sky-blue title bar with the logo inlined as base64.
+
+    Falls back to a text title if the logo cannot be read.
+    """
+    try:
+        with open(logo_path, "rb") as f:
+            logo_data = base64.b64encode(f.read()).decode()
+        logo_html = f'<img src="data:image/png;base64,{logo_data}" style="height:40px; display:block; margin:0 auto;">'
+    except OSError:
+        logo_html = "<p style='font-weight:900; color:white; text-align:center; margin:0;'>Mars Rover</p>"
+
+    return f"""
+<div style="
+    background: skyblue;
+    padding: 12px 20px;
+    border-radius: 0 0 18px 18px;
+    text-align: center;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.3);
+">
+    {logo_html}
+</div>
+"""
+
+
+# Pre-rendered cells, reused for every grid build
+EMPTY_CELL = '<div class="cell">·</div>'
+BLOCKED_CELL = '<div class="cell blocked">#</div>'
+ROVER_CELL = {f: f'<div class="cell">{svg}</div>' for f, svg in ROVER_SVG.items()}
+
+# Largest number of cells drawn per side; bigger boards show a window that
+# follows the rover
+VIEWPORT = 15
+
+# Grid gap budget in px, shared between columns (10px gaps at 5 columns)
+GRID_GAP = 50
+
+
+def build_grid_html(robot, placed, width=None, height=None, viewport=VIEWPORT):
+    """
+    Build the grid markup with the rover drawn in its cell.
+
+    Rows are assembled from pre-rendered cell strings. Boards larger than
+    ``viewport`` cells per side are cropped to a window around the rover,
+    so the markup size stays bounded.
+
+    :param robot: Robot to draw
+    :param placed: Whether the rover has been placed
+    :param width: Board width in cells (default: ``robot.board``)
+    :param height: Board height in cells (default: ``robot.board``)
+    :param viewport: Maximum cells drawn per side
+    :return: HTML string for ``st.markdown``
+    """
+    board = robot.board
+    width = board.width if width is None else width
+    height = board.height if height is None else height
+    # Rows without obstacles keep using the pre-joined strings
+    blocked = (board.is_blocked if board.blocked_count
+               and (width, height) == (board.width, board.height) else None)
+    cols, rows = min(width, viewport), min(height, viewport)
+    rx, ry = (robot.x, robot.y) if placed else (0, 0)
+    x0, y0 = _window(width, rx, cols), _window(height, ry, rows)
+
+    parts = [f'<div class="grid-container" style="grid-template-columns: repeat({cols}, 1fr); '
+             f'gap: {max(2, GRID_GAP // cols)}px;">']
+    empty_row = EMPTY_CELL * cols
+    for y in range(y0 + rows - 1, y0 - 1, -1):   # top row first
+        if blocked:
+            row = [BLOCKED_CELL if blocked(x, y) else EMPTY_CELL for x in range(x0, x0 + cols)]
+            if placed and y == ry:
+                row[rx - x0] = ROVER_CELL[robot.f]
+            parts.append("".join(row))
+        elif placed and y == ry:
+            parts.append(EMPTY_CELL * (rx - x0) + ROVER_CELL[robot.f]
+                         + EMPTY_CELL * (x0 + cols - 1 - rx))
+        else:
+            parts.append(empty_row)
+    parts.append('</div>')
+    return "".join(parts)
@@ -0,0 +1,131 @@
+# src/world.py
+"""
+Several robots sharing one table.
+
+A MOVE into a cell held by another robot is ignored, just like a MOVE off
+the edge or into a blocked cell of the shared ``Board``. Occupancy is a dict keyed by cell index, so every collision check
+is a single O(1) lookup regardless of how many robots are on the table.
+"""
+try:
+    from .robot import Robot
+    from .board import DEFAULT_BOARD
+except ImportError:  # executed as a script from src/
+    from robot import Robot
+    from board import DEFAULT_BOARD
+
+
+class World:
+    """
+    A shared tabletop and the robots on it, addressed by integer id.
+
+    Robots are stepped in ascending id order within a tick, and each one
+    sees the moves already made by lower ids in the same tick.
+    """
+
+    def __init__(self, board=None):
+        """
+        :param board: ``board.Board`` shared by every robot (default: open 5x5)
+        """
+        self.board = DEFAULT_BOARD if board is None else board
+        self.robots = []
+        self.occupancy = {}  # cell index -> robot id
+
+    def add_robot(self, robot=None):
+        """
+        Add a robot to the world (a new unplaced one by default).
+
+        :return: The new robot's id
+        :raises ValueError: If ``robot`` is already placed on an occupied
+                            cell, or drives on a different board
+        """
+        robot = robot if robot is not None else Robot(board=self.board)
+        if robot.board is not self.board:
+            raise ValueError("robot is on a different board")
+        rid = len(self.robots)
+        if robot.x is not None:
+            if self.robot_at(robot.x, robot.y) is not None:
+                raise ValueError(f"cell {robot.x},{robot.y} is already occupied")
+            self.occupancy[robot.y * self.board.width + robot.x] = rid
+        self.robots.append(robot)
+        return rid
+
+    def robot_at(self, x, y):
+        """Id of the robot at ``x, y``, or None if the cell is free."""
+        return self.occupancy.get(y * self.board.width + x)
+
+    def place(self, rid, x, y, f):
+        """
+        Place robot ``rid``; rejected if another robot holds the cell.
+
+        :return: True if placed successfully, False otherwise
+        """
+        robot = self.robots[rid]
+        on_board = isinstance(x, int) and isinstance(y, int) and self.board.contains(x, y)
+        holder = self.robot_at(x, y) if on_board else None
+        if holder is not None and holder != rid:
+            if robot.sink is not None:
+                robot.sink.emit("place", robot, "cell occupied")
+            return False
+        old = robot.x, robot.y
+        if not robot.place(x, y, f):
+            return False
+        width = self.board.width
+        if old[0] is not None:
+            del self.occupancy[old[1] * width + old[0]]
+        self.occupancy[y * width + x] = rid
+        return True
+
+    def move(self, rid):
+        """
+        Move robot ``rid`` forward unless it would leave the board, enter a
+        blocked cell or collide.
+        """
+        robot = self.robots[rid]
+        ahead = robot.ahead()
+        if ahead is not None:
+            nx, ny = ahead
+            if self.board.is_open(nx, ny):
+                width = self.board.width
+                target = ny * width + nx
+                if target in self.occupancy:
+                    if robot.sink is not None:
+                        robot.sink.emit("move", robot, "cell occupied")
+                    return
+                del self.occupancy[robot.y * width + robot.x]
+                self.occupancy[target] = rid
+        robot.move()
+
+    def left(self, rid):
+        self.robots[rid].left()
+
+    def right(self, rid):
+        self.robots[rid].right()
+
+    def report(self, rid):
+        return self.robots[rid].report()
+
+    def tick(self, commands):
+        """
+        Run one command per robot, in ascending robot id order.
+
+        :param commands: Mapping ``{robot_id: command}`` where a command is
+                         ``"MOVE"``, ``"LEFT"``, ``"RIGHT"``, ``"REPORT"`` or
+                         ``("PLACE", x, y, f)``
+        :return: ``{robot_id: report}`` for every REPORT issued this tick
+        """
+        reports = {}
+        for rid in sorted(commands):
+            cmd = commands[rid]
+            if cmd == "MOVE":
+                self.move(rid)
+            elif cmd == "LEFT":
+                self.left(rid)
+            elif cmd == "RIGHT":
+                self.right(rid)
+            elif cmd == "REPORT":
+                reports[rid] = self.report(rid)
+            elif cmd[0] == "PLACE":
+                self.place(rid, *cmd[1:])
+            else:
+                raise ValueError(f"unknown command for robot {rid}: {cmd!r}")
+        return reports
@@ -0,0 +1,147 @@
+# tests/test_analytics.py
+import os
+import random
+import tempfile
+import unittest
+
+from src.board import Board
+from src.command_parser import parse, run
+from src.engine import TransitionTable
+from src.journal import JournalWriter
+from src.robot import Robot, DIRECTIONS
+from src import fuzz
+
+try:
+    import numpy as np
+    from src.analytics import Coverage, heatmap, trajectory, walk
+except ImportError:  # NumPy is optional
+    np = None
+
+WALK = b"REPORT\nMOVE\nPLACE 0,0,NORTH\n" + b"MOVE\n" * 5 + b"RIGHT\n" + b"MOVE\n" * 5
+
+
+def reference_counts(programs, board):
+    """Visit/heading/blocked-move counts from ``Robot``, one step at a time."""
+    visits, headings, blocked, unplaced = {}, [0] * 4, 0, 0
+
+    class Sink:
+        def emit(self, command, robot, reason=None):
+            nonlocal blocked, unplaced
+            if robot.x is None:
+                unplaced += 1
+                return
+            if command == "move" and reason is not None:
+                blocked += 1
+            visits[robot.x, robot.y] = visits.get((robot.x, robot.y), 0) + 1
+            headings[DIRECTIONS.index(robot.f)] += 1
+
+    for program in programs:
+        run(program, Robot(Sink(), board))
+    return visits, headings, blocked, unplaced
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestCoverage(unittest.TestCase):
+    """Unit tests for coverage analytics."""
+
+    def test_known_walk(self) -> None:
+        """A walk up the left edge and along the top is counted exactly."""
+        cov = Coverage()
+        cov.add_program(parse(WALK))
+        self.assertEqual((cov.steps, cov.unplaced_steps, cov.blocked_moves), (14, 2, 2))
+        self.assertEqual(cov.visits[4].tolist(), [3, 1, 1, 1, 2])     # top row
+        self.assertEqual(cov.visits[:, 0].tolist(), [1, 1, 1, 1, 3])  # left column
+        self.assertEqual(cov.headings.tolist(), [6, 6, 0, 0])
+        self.assertEqual(cov.cells_visited(), 9)
+
+    def test_matches_robot(self) -> None:
+        """Random programs on an obstructed board agree with Robot's own events."""
+        board = Board(6, 4, blocked=[(2, 1), (3, 2)])
+        rng = random.Random(8)
+        programs = [fuzz.generate(rng, 60, board) for _ in range(300)]
+        cov = Coverage(board)
+        for program in programs:
+            cov.add_program(program)
+        visits, headings, blocked, unplaced = reference_counts(programs, board)
+        self.assertEqual({(x, y): int(n) for (y, x), n in np.ndenumerate(cov.visits) if n}, visits)
+        self.assertEqual(cov.headings.tolist(), headings)
+        self.assertEqual((cov.blocked_moves, cov.unplaced_steps), (blocked, unplaced))
+
+    def test_large_board_skips_table(self) -> None:
+        """Boards too big for a transition table are stepped arithmetically."""
+        program = parse(b"PLACE 1998,3,EAST\nMOVE\nMOVE\nLEFT\nMOVE\nPLACE 2000,0,NORTH\nREPORT\n")
+        board = Board(2000, 1500, blocked=[(1999, 4)])
+        cov = Coverage(board)
+        cov.add_program(program)
+        self.assertIsNone(cov.table)
+        self.assertEqual(cov.blocked_moves, 2)
+        self.assertEqual(cov.visits[3, 1998:].tolist(), [1, 6])
+        self.assertEqual(cov.headings.tolist(), [4, 3, 0, 0])
+
+        # Agrees with the table path on random programs
+        board = Board(6, 4, blocked=[(2, 1), (3, 2)])
+        rng = random.Random(5)
+        table = TransitionTable(board=board)
+        for _ in range(200):
+            program = fuzz.generate(rng, 60, board)
+            self.assertEqual(walk(program, board), trajectory(program, table))
+
+    def test_journal_matches_programs(self) -> None:
+        """A recorded journal gives the same counts as the programs behind it."""
+        rng = random.Random(3)
+        programs = [fuzz.generate(rng, 50) for _ in range(100)]
+        fd, path = tempfile.mkstemp(suffix=".rovj")
+        os.close(fd)
+        os.unlink(path)
+        try:
+            with JournalWriter(path) as journal:
+                for program in programs:
+                    run(program, journal.attach(Robot()))
+            from_journal = Coverage()
+            from_journal.add_journal(path)
+            with open(path, "rb") as fh:
+                from_bytes = Coverage()
+                from_bytes.add_journal(fh.read())
+        finally:
+            os.unlink(path)
+        from_programs = Coverage()
+        for program in programs:
+            from_programs.add_program(program)
+        for cov in (from_journal, from_bytes):
+            self.assertEqual(cov.visits.tolist(), from_programs.visits.tolist())
+            self.assertEqual(cov.headings.tolist(), from_programs.headings.tolist())
+            self.assertEqual((cov.blocked_moves, cov.steps), (from_programs.blocked_moves, from_programs.steps))
+        with self.assertRaises(ValueError):
+            Coverage(Board(6, 6)).add_journal(b"ROVJ\x01\x00\x05\x00\x05\x00")
+
+    def test_merge(self) -> None:
+        """Merged coverage equals one coverage over all runs."""
+        a, b, both = Coverage(), Coverage(), Coverage()
+        for cov in (a, both):
+            cov.add_program(parse(WALK))
+        for cov in (b, both):
+            cov.add_program(parse(b"PLACE 2,2,SOUTH\nMOVE\nMOVE\nMOVE\n"))
+        a.merge(b)
+        self.assertEqual(a.visits.tolist(), both.visits.tolist())
+        self.assertEqual((a.steps, a.runs, a.blocked_moves), (both.steps, both.runs, both.blocked_moves))
+
+    def test_heatmap(self) -> None:
+        """The heatmap has one cell per square, or bins large boards."""
+        cov = Coverage(Board(blocked=[(2, 2)]))
+        cov.add_program(parse(WALK))
+        lines = heatmap(cov).splitlines()
+        grid = [line for line in lines if line.startswith("║ ")]
+        self.assertEqual(len(grid), 5)
+        self.assertEqual(grid[0].split(), ["║", "██", "▒▒", "▒▒", "▒▒", "▓▓", "║"])
+        self.assertIn("#", grid[2])
+        self.assertIn("2 blocked MOVEs", lines[-1])
+
+        big = Coverage(Board(100, 60))
+        big.add_program(parse(b"PLACE 99,59,NORTH\nMOVE\n"))
+        text = heatmap(big)
+        self.assertEqual(sum(line.startswith("║ ") for line in text.splitlines()), 15)
+        self.assertIn("7x4 cells per block", text)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
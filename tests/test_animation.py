@@ -0,0 +1,190 @@
+# tests/test_animation.py
+import unittest
+
+from src.animation import FrameScheduler, Bounce, Replay
+from src.command_parser import parse
+from src.robot import Robot
+
+
+class FakeRoot:
+    """Records ``after`` calls; :meth:`run` fires the next pending one."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.pending = {}
+        self._ids = 0
+
+    def after(self, ms, func):
+        self._ids += 1
+        self.pending[self._ids] = (ms, func)
+        return self._ids
+
+    def after_cancel(self, after_id):
+        del self.pending[after_id]
+
+    def run(self):
+        after_id = min(self.pending)
+        ms, func = self.pending.pop(after_id)
+        self.clock.now += ms / 1000
+        func()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeCanvas:
+    def __init__(self):
+        self.dy = 0
+
+    def move(self, item, dx, dy):
+        self.dy += dy
+
+
+class TestFrameScheduler(unittest.TestCase):
+    """Unit tests for the single-timer animation scheduler."""
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.root = FakeRoot(self.clock)
+        self.scheduler = FrameScheduler(self.root, fps=50, clock=self.clock)
+
+    def test_one_timer_for_many_animations(self) -> None:
+        """Any number of animations share a single pending ``after``."""
+        for _ in range(100):
+            self.scheduler.add(lambda ms: True)
+        self.assertEqual(len(self.root.pending), 1)
+        self.root.run()
+        self.assertEqual(len(self.root.pending), 1)
+        self.assertEqual(self.scheduler.frames, 1)
+
+    def test_same_key_replaces(self) -> None:
+        """Re-adding under a key keeps one animation, not a growing pile."""
+        calls = []
+        for i in range(50):
+            self.scheduler.add(lambda ms, i=i: calls.append(i), key="bounce")
+        self.assertEqual(len(self.scheduler), 1)
+        self.root.run()
+        self.assertEqual(calls, [49])
+
+    def test_finished_animation_stops_timer(self) -> None:
+        """Returning False ends an animation; an idle scheduler has no timer."""
+        seen = []
+
+        def step(ms):
+            seen.append(ms)
+            return len(seen) < 3
+
+        self.scheduler.add(step)
+        while self.root.pending:
+            self.root.run()
+        self.assertEqual(seen, [20.0, 40.0, 60.0])
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_cancel(self) -> None:
+        """Cancelling the last animation also cancels the timer."""
+        key = self.scheduler.add(lambda ms: True)
+        self.scheduler.cancel(key)
+        self.scheduler.cancel("missing")
+        self.assertEqual(self.root.pending, {})
+
+    def test_slow_frame_shortens_next_wait(self) -> None:
+        """Time spent inside a tick is taken off the next wait."""
+        def slow(ms):
+            self.clock.now += 0.015
+
+        self.scheduler.add(slow)
+        self.root.run()
+        (ms, _), = self.root.pending.values()
+        self.assertEqual(ms, 5)
+
+    def test_sleeps_until_deadline(self) -> None:
+        """A step returning a deadline is not woken for the frames before it."""
+        seen = []
+
+        def step(ms):
+            seen.append(ms)
+            return ms + 500 if len(seen) < 3 else False
+
+        self.scheduler.add(step)
+        while self.root.pending:
+            self.root.run()
+        self.assertEqual(seen, [20.0, 520.0, 1020.0])
+        self.assertEqual(self.scheduler.frames, 3)
+
+    def test_add_wakes_a_sleeping_timer(self) -> None:
+        """A new animation runs next frame even while the timer sleeps long."""
+        self.scheduler.add(lambda ms: 10_000)
+        self.root.run()
+        (ms, _), = self.root.pending.values()
+        self.assertEqual(ms, 9980)
+        calls = []
+        self.scheduler.add(lambda ms: calls.append(ms) or False)
+        (ms, _), = self.root.pending.values()
+        self.assertEqual(ms, 20)
+        self.root.run()
+        self.assertEqual(calls, [20.0])
+        (ms, _), = self.root.pending.values()
+        self.assertEqual(ms, 9960)
+
+    def test_idle_bounce_ticks_twice_per_period(self) -> None:
+        """An idle rover bounce wakes the timer only when the sprite moves."""
+        canvas = FakeCanvas()
+        self.scheduler.add(Bounce(canvas, 1, height=2, period=1200), key="bounce")
+        moves = []
+        while self.clock.now < 12:
+            self.root.run()
+            moves.append(canvas.dy)
+        self.assertLessEqual(self.scheduler.frames, 21)
+        self.assertEqual(moves[:4], [-2, 0, -2, 0])
+
+    def test_bounce(self) -> None:
+        """Bounce lifts the item for half a period and puts it back."""
+        canvas = FakeCanvas()
+        bounce = Bounce(canvas, 1, height=2, period=1200)
+        bounce(0)
+        self.assertEqual(canvas.dy, -2)
+        bounce(300)
+        self.assertEqual(canvas.dy, -2)
+        bounce(700)
+        self.assertEqual(canvas.dy, 0)
+        self.assertEqual(bounce(1250), 1800)
+        self.assertEqual(canvas.dy, -2)
+
+
+class TestReplay(unittest.TestCase):
+    """Unit tests for frame-batched script replay."""
+
+    def test_runs_in_batches_with_one_callback_per_frame(self) -> None:
+        """Each frame runs ``per_frame`` commands and reports once."""
+        program = parse("PLACE 0,0,NORTH\n" + "MOVE\nRIGHT\nRIGHT\nMOVE\nLEFT\nLEFT\n" * 20 + "REPORT\n")
+        robot = Robot()
+        frames = []
+        replay = Replay(program, robot, per_frame=50,
+                        on_frame=lambda r, finished: frames.append((r.done, finished)))
+        while replay(0):
+            pass
+        self.assertEqual(frames, [(50, False), (100, False), (122, True)])
+        self.assertEqual(replay.last_report, "0,0,NORTH")
+
+    def test_matches_direct_execution(self) -> None:
+        """A replay ends in the same state as running the robot directly."""
+        script = "PLACE 1,2,EAST\nMOVE\nMOVE\nLEFT\nMOVE\nPLACE 9,9,NORTH\nREPORT\nEXIT\nMOVE\n"
+        replay = Replay(parse(script), Robot(), per_frame=3)
+        clock = FakeClock()
+        root = FakeRoot(clock)
+        scheduler = FrameScheduler(root, clock=clock)
+        scheduler.add(replay, key="replay")
+        while root.pending:
+            root.run()
+        self.assertEqual(replay.robot.report(), "3,3,NORTH")
+        self.assertEqual(replay.done, 8)
+        self.assertEqual(scheduler.frames, 3)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,98 @@
+# tests/test_basic.py
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from src.basic import main, run_script, repl
+from src.robot import Robot
+
+
+class TestRunScript(unittest.TestCase):
+    """Unit tests for the non-interactive batch runner in ``basic.py``."""
+
+    def run_lines(self, text):
+        out = io.BytesIO()
+        counts = run_script(io.BytesIO(text.encode()), out)
+        return out.getvalue().decode(), counts
+
+    def test_only_reports_are_written(self) -> None:
+        """PLACE/MOVE produce no output; REPORT writes ``X,Y,F``."""
+        output, (lines, invalid) = self.run_lines(
+            "PLACE 1,2,EAST\nMOVE\nMOVE\nLEFT\nMOVE\nREPORT\n"
+        )
+        self.assertEqual(output, "3,3,NORTH\n")
+        self.assertEqual((lines, invalid), (6, 0))
+
+    def test_lowercase_and_blank_lines(self) -> None:
+        """Commands are case-insensitive and blank lines are skipped."""
+        output, _ = self.run_lines("\nplace 0,0,north\n  move \n\nreport\n")
+        self.assertEqual(output, "0,1,NORTH\n")
+
+    def test_invalid_lines_are_counted(self) -> None:
+        """Malformed PLACEs and unknown commands are skipped and counted."""
+        output, (lines, invalid) = self.run_lines(
+            "PLACE 0,0\nPLACE a,b,NORTH\nJUMP\nREPORT\n"
+        )
+        self.assertEqual(output, "")
+        self.assertEqual((lines, invalid), (4, 3))
+
+    def test_exit_stops_the_run(self) -> None:
+        """Nothing after ``EXIT`` is executed."""
+        output, (lines, _) = self.run_lines("PLACE 0,0,NORTH\nEXIT\nREPORT\n")
+        self.assertEqual(output, "")
+        self.assertEqual(lines, 2)
+
+
+class TestRunBatch(unittest.TestCase):
+    """Unit tests for ``basic.py --script``."""
+
+    def test_missing_script(self) -> None:
+        """An unreadable script exits with a one-line error, not a traceback."""
+        with self.assertRaises(SystemExit) as ctx:
+            main(["--script", "no/such/script.txt"])
+        self.assertIn("cannot open script", str(ctx.exception.code))
+        self.assertIn("no/such/script.txt", str(ctx.exception.code))
+
+
+class TestRepl(unittest.TestCase):
+    """Unit tests for the interactive prompt in ``basic.py``."""
+
+    def repl(self, *lines):
+        """Feed ``lines`` and then EXIT to the REPL; return its output and the robot."""
+        robot = Robot()
+        commands = iter((*lines, "EXIT"))
+        out = io.StringIO()
+        with mock.patch("builtins.input", lambda prompt: next(commands)), \
+                contextlib.redirect_stdout(out):
+            repl(robot)
+        return out.getvalue(), robot
+
+    def test_commands(self) -> None:
+        """Commands are case-insensitive and blank lines are skipped."""
+        output, robot = self.repl(" place 1,2,east ", "", "MOVE", "left", "REPORT")
+        self.assertIn("Placed at 1,2,EAST", output)
+        self.assertIn("Output: 2,2,NORTH", output)
+        self.assertEqual(robot.report(), "2,2,NORTH")
+
+    def test_same_grammar_as_scripts(self) -> None:
+        """Lines rejected by ``--script`` are rejected at the prompt too."""
+        lines = ["PLACE 0,0,NORTH", "MOVE 2", "PLACE 1,2", "PLACE a,b,NORTH", "JUMP", "REPORT"]
+        output, robot = self.repl(*lines)
+        self.assertEqual(output.count("Invalid command:"), 4)
+        self.assertIn("Invalid command: MOVE takes no arguments", output)
+        self.assertEqual(robot.report(), "0,0,NORTH")
+
+        out = io.BytesIO()
+        _, invalid = run_script(io.BytesIO("\n".join(lines).encode() + b"\n"), out)
+        self.assertEqual((out.getvalue(), invalid), (b"0,0,NORTH\n", 4))
+
+    def test_invalid_placement(self) -> None:
+        """A well-formed PLACE off the board or with a bad direction is ignored."""
+        output, robot = self.repl("PLACE 7,7,NORTH", "PLACE 0,0,UP")
+        self.assertEqual(output.count("Invalid placement"), 2)
+        self.assertIsNone(robot.report())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,49 @@
+# tests/test_batch_runner.py
+import os
+import tempfile
+import unittest
+
+from src.batch_runner import run_scripts, run_files, ScriptResult
+
+SCRIPTS = [
+    b"PLACE 0,0,NORTH\nMOVE\nREPORT\n",
+    "PLACE 1,2,EAST\nMOVE\nMOVE\nLEFT\nMOVE\nREPORT\nJUMP\n",
+    b"MOVE\nREPORT\n",
+    b"PLACE 0,0,NORTH\nEXIT\nMOVE\n",
+]
+
+EXPECTED = [
+    ScriptResult("0,1,NORTH", ("0,1,NORTH",), 0),
+    ScriptResult("3,3,NORTH", ("3,3,NORTH",), 1),
+    ScriptResult(None, (), 0),
+    ScriptResult("0,0,NORTH", (), 0),
+]
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Unit tests for process-pool sharded script execution."""
+
+    def test_inline_execution(self) -> None:
+        """``max_workers=0`` runs in-process with the same results."""
+        self.assertEqual(run_scripts(SCRIPTS, max_workers=0), EXPECTED)
+
+    def test_process_pool_keeps_input_order(self) -> None:
+        """Results come back in input order across batches and workers."""
+        scripts = SCRIPTS * 25
+        results = run_scripts(scripts, max_workers=2, batch_size=3)
+        self.assertEqual(results, EXPECTED * 25)
+
+    def test_run_files(self) -> None:
+        """Only paths are sent to workers; files are parsed there."""
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i, script in enumerate(SCRIPTS):
+                path = os.path.join(tmp, f"mission{i}.txt")
+                with open(path, "wb") as fh:
+                    fh.write(script if isinstance(script, bytes) else script.encode())
+                paths.append(path)
+            self.assertEqual(run_files(paths, max_workers=2, batch_size=2), EXPECTED)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
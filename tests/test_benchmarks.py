@@ -0,0 +1,20 @@
+# tests/test_benchmarks.py
+import unittest
+
+from benchmarks.__main__ import BENCHMARKS, run_suite
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Smoke test: every benchmark in ``python -m benchmarks`` still runs."""
+
+    def test_run_suite(self) -> None:
+        """Each registered benchmark yields a positive per-operation time."""
+        results = run_suite(repeat=1, min_time=0)
+        self.assertEqual(set(results), set(BENCHMARKS))
+        for name, stats in results.items():
+            with self.subTest(name=name):
+                self.assertGreater(stats["best_ns"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
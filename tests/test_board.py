@@ -0,0 +1,79 @@
+# tests/test_board.py
+import os
+import tempfile
+import unittest
+
+from src.board import Board, load_board, viewport
+
+
+class TestBoard(unittest.TestCase):
+    """Unit tests for board size and the obstacle bitset."""
+
+    def test_block_and_unblock(self) -> None:
+        """Blocking is per cell and bumps the version only on change."""
+        board = Board(10, 4)
+        board.block(9, 3)
+        board.block(9, 3)
+        self.assertTrue(board.is_blocked(9, 3))
+        self.assertFalse(board.is_open(9, 3))
+        self.assertTrue(board.is_open(8, 3))
+        self.assertEqual((board.blocked_count, board.version), (1, 1))
+        board.unblock(9, 3)
+        self.assertTrue(board.is_open(9, 3))
+        self.assertEqual((board.blocked_count, board.version), (0, 2))
+        with self.assertRaises(ValueError):
+            board.block(10, 0)
+
+    def test_is_open_rejects_off_board(self) -> None:
+        """Cells past any edge are never open."""
+        board = Board(3, 2)
+        for x, y in [(-1, 0), (3, 0), (0, -1), (0, 2)]:
+            self.assertFalse(board.is_open(x, y))
+
+    def test_bitset_is_one_bit_per_cell(self) -> None:
+        """A large board costs width*height/8 bytes."""
+        board = Board(1000, 1000)
+        self.assertEqual(board.nbytes, 125000)
+        board.block(999, 999)
+        board.block(0, 500)
+        self.assertEqual(list(board.blocked_cells()), [(0, 500), (999, 999)])
+
+    def test_from_text(self) -> None:
+        """Maps are read top row first."""
+        board = Board.from_text("..#\n#..\n")
+        self.assertEqual((board.width, board.height), (3, 2))
+        self.assertEqual(sorted(board.blocked_cells()), [(0, 0), (2, 1)])
+        with self.assertRaises(ValueError):
+            Board.from_text("..\n...")
+
+    def test_invalid_size(self) -> None:
+        """Boards need positive integer dimensions."""
+        for size in [(0, 5), (5, -1), (2.5, 2)]:
+            with self.assertRaises(ValueError):
+                Board(*size)
+
+    def test_viewport(self) -> None:
+        """Windows centre on the position but stay on the board."""
+        self.assertEqual(viewport(100, 50, 15), 43)
+        self.assertEqual(viewport(100, 2, 15), 0)
+        self.assertEqual(viewport(100, 99, 15), 85)
+        self.assertEqual(viewport(5, 4, 5), 0)
+
+    def test_load_board(self) -> None:
+        """``--size`` and ``--obstacles`` values become boards; bad ones raise."""
+        self.assertEqual((load_board("12X8").width, load_board("12X8").height), (12, 8))
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as fh:
+            fh.write("..#\n...\n")
+        self.addCleanup(os.unlink, fh.name)
+        board = load_board("5x5", fh.name)
+        self.assertEqual((board.width, board.height, board.blocked_count), (3, 2, 1))
+        self.assertTrue(board.is_blocked(2, 1))
+        for size in ("0x3", "ax2", "7"):
+            with self.subTest(size=size), self.assertRaises(ValueError):
+                load_board(size)
+        with self.assertRaises(OSError):
+            load_board(obstacles=fh.name + ".missing")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,88 @@
+# tests/test_checkpoints.py
+import random
+import unittest
+
+from src.checkpoints import CheckpointIndex
+from src.command_parser import parse, Parser
+from src.engine import TransitionTable, decode
+from src.robot import Robot
+
+
+def random_script(n, seed):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(n):
+        r = rng.random()
+        if r < 0.05:
+            lines.append(f"PLACE {rng.randint(-1, 5)},{rng.randint(-1, 5)},"
+                         f"{rng.choice(['NORTH', 'EAST', 'SOUTH', 'WEST', 'UP'])}")
+        else:
+            lines.append(rng.choice(["MOVE", "MOVE", "LEFT", "RIGHT", "REPORT"]))
+    return "\n".join(lines) + "\n"
+
+
+class TestCheckpointIndex(unittest.TestCase):
+    """Unit tests for step-indexed state queries."""
+
+    def test_every_step_matches_robot(self) -> None:
+        """state_at(k) equals running a Robot over the first k commands."""
+        script = random_script(500, seed=7)
+        expected = [None]
+        robot = Robot()
+        for line in script.splitlines():
+            action, *rest = line.split()
+            if action == "PLACE":
+                x, y, f = rest[0].split(",")
+                robot.place(int(x), int(y), f)
+            elif action != "REPORT":
+                getattr(robot, action.lower())()
+            expected.append(robot.report())
+
+        for interval in (1, 7, 64, 1000):
+            with self.subTest(interval=interval):
+                index = CheckpointIndex(parse(script), interval=interval)
+                self.assertEqual(len(index), 500)
+                self.assertEqual([index.report_at(k) for k in range(501)], expected)
+
+    def test_interval_sets_checkpoint_count(self) -> None:
+        """One checkpoint per ``interval`` steps plus the start."""
+        program = parse("PLACE 0,0,NORTH\n" + "LEFT\n" * 999)
+        self.assertEqual(len(CheckpointIndex(program, interval=100).steps), 11)
+        self.assertEqual(len(CheckpointIndex(program, interval=1).steps), 1001)
+        self.assertLess(CheckpointIndex(program, interval=100).checkpoint_bytes,
+                        CheckpointIndex(program, interval=10).checkpoint_bytes)
+
+    def test_extend_in_chunks(self) -> None:
+        """Indexing a stream chunk by chunk gives the same answers."""
+        script = random_script(300, seed=3).encode()
+        whole = CheckpointIndex(parse(script), interval=16)
+        parser = Parser()
+        chunked = CheckpointIndex(interval=16)
+        for pos in range(0, len(script), 37):
+            chunked.extend(parser.feed(script[pos:pos + 37]))
+        chunked.extend(parser.close())
+        self.assertEqual(list(chunked.steps), list(whole.steps))
+        self.assertEqual([chunked.state_at(k) for k in range(301)],
+                         [whole.state_at(k) for k in range(301)])
+        self.assertEqual(chunked.state, whole.state_at(300))
+
+    def test_custom_table(self) -> None:
+        """Other board sizes are honoured."""
+        table = TransitionTable(20, 3)
+        index = CheckpointIndex(parse("PLACE 10,1,EAST\n" + "MOVE\n" * 30), table, interval=8)
+        self.assertEqual(decode(index.state_at(5), 20), (14, 1, 1))
+        self.assertEqual(index.report_at(30), "19,1,EAST")
+
+    def test_bad_arguments(self) -> None:
+        """Out-of-range steps and intervals are rejected."""
+        index = CheckpointIndex(parse("MOVE\n"))
+        with self.assertRaises(IndexError):
+            index.state_at(2)
+        with self.assertRaises(IndexError):
+            index.state_at(-1)
+        with self.assertRaises(ValueError):
+            CheckpointIndex(interval=0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,114 @@
+# tests/test_command_parser.py
+import os
+import tempfile
+import unittest
+
+from src.robot import Robot
+from src.engine import DEFAULT_TABLE, MOVE, LEFT, REPORT, PLACE, EXIT
+from src.command_parser import (Parser, ParseError, parse, parse_file,
+                                run, run_table)
+
+SCRIPT = b"PLACE 1,2,EAST\nMOVE\nmove\n  Left \nMOVE\nREPORT\n"
+
+
+class TestParse(unittest.TestCase):
+    """Unit tests for tokenizing command buffers into opcode streams."""
+
+    def test_opcode_stream_and_packed_place_args(self) -> None:
+        """Commands become opcodes; PLACE arguments are packed triples."""
+        program = parse(SCRIPT)
+        self.assertEqual(program.ops.tolist(), [PLACE, MOVE, MOVE, LEFT, MOVE, REPORT])
+        self.assertEqual(program.args.tolist(), [1, 2, 1])
+        self.assertEqual(program.errors, [])
+
+    def test_invalid_direction_is_encoded_not_rejected(self) -> None:
+        """``PLACE 0,0,UP`` parses and is ignored at run time like ``Robot.place``."""
+        program = parse(b"PLACE 0,0,UP\nPLACE 99999999999,0,NORTH\nREPORT\n")
+        self.assertEqual(program.args.tolist(), [0, 0, -1, -1, 0, 0])
+        self.assertEqual(run_table(program, DEFAULT_TABLE), 0)
+
+    def test_error_positions(self) -> None:
+        """Errors carry the line, 1-based column and absolute byte offset."""
+        program = parse(b"MOVE\n  JUMP\nPLACE 1,x,NORTH\nPLACE 1,2\nLEFT now\n")
+        self.assertEqual(program.ops.tolist(), [MOVE])
+        got = [(e.line, e.column, e.offset) for e in program.errors]
+        self.assertEqual(got, [(2, 3, 7), (3, 9, 20), (4, 7, 34), (5, 6, 43)])
+        self.assertIn("unknown command 'JUMP'", str(program.errors[0]))
+        self.assertIn("invalid coordinate 'x'", str(program.errors[1]))
+
+    def test_error_op_index(self) -> None:
+        """Errors know how many ops precede them, across chunks too."""
+        data = b"MOVE\nJUMP\n\nLEFT\nPLACE\nREPORT\nHOP\n"
+        for chunk_size in (1, 7, len(data)):
+            program = parse(data, chunk_size=chunk_size)
+            self.assertEqual([e.op_index for e in program.errors], [1, 2, 3])
+
+    def test_max_line(self) -> None:
+        """An unterminated line over ``max_line`` bytes ends the program."""
+        parser = Parser(max_line=8)
+        program = parser.feed(b"MOVE\nREPORT\nPLACE 1,1,NORTH")
+        self.assertTrue(parser.finished)
+        self.assertEqual(program.ops.tolist(), [MOVE, REPORT])
+        self.assertEqual(str(program.errors[0]), "line 3, column 9: line longer than 8 bytes")
+        self.assertEqual(program.errors[0].op_index, 2)
+        self.assertEqual(len(parser.feed(b"\nMOVE\n")), 0)
+        with self.assertRaises(ParseError):
+            Parser(strict=True, max_line=8).feed(b"PLACE 1,1,")
+
+    def test_strict_mode_raises(self) -> None:
+        """``strict=True`` raises the first error."""
+        with self.assertRaises(ParseError) as ctx:
+            parse(b"MOVE\nFLY\n", strict=True)
+        self.assertEqual(ctx.exception.line, 2)
+
+    def test_chunk_boundaries_do_not_matter(self) -> None:
+        """Feeding arbitrary chunks yields the same program as one buffer."""
+        whole = parse(SCRIPT * 3)
+        for size in (1, 2, 7, 64):
+            with self.subTest(chunk_size=size):
+                program = parse(SCRIPT * 3, chunk_size=size)
+                self.assertEqual(program.ops, whole.ops)
+                self.assertEqual(program.args, whole.args)
+
+    def test_missing_final_newline_and_exit(self) -> None:
+        """A last line without newline parses; nothing after EXIT is kept."""
+        self.assertEqual(parse(b"MOVE\nLEFT").ops.tolist(), [MOVE, LEFT])
+        parser = Parser()
+        self.assertEqual(parser.feed(b"MOVE\nEXIT\nJUMP\n").ops.tolist(), [MOVE, EXIT])
+        self.assertTrue(parser.finished)
+        self.assertEqual(parser.line, 2)
+
+    def test_parse_file_uses_mmap(self) -> None:
+        """Files (including empty ones) parse through ``mmap``."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "mission.txt")
+            with open(path, "wb") as fh:
+                fh.write(SCRIPT)
+            self.assertEqual(len(parse_file(path)), 6)
+            open(path, "wb").close()
+            self.assertEqual(len(parse_file(path)), 0)
+
+
+class TestRun(unittest.TestCase):
+    """Pre-parsed programs run on ``Robot`` and on the transition table."""
+
+    def test_run_on_robot(self) -> None:
+        reports = []
+        robot = Robot()
+        run(parse(SCRIPT), robot, reports.append)
+        self.assertEqual(reports, ["3,3,NORTH"])
+
+    def test_run_on_table(self) -> None:
+        reports = []
+        state = run_table(parse(SCRIPT + b"EXIT\nMOVE\n"), DEFAULT_TABLE, on_report=reports.append)
+        self.assertEqual(reports, ["3,3,NORTH"])
+        self.assertEqual(DEFAULT_TABLE.report(state), "3,3,NORTH")
+
+    def test_invalid_place_on_robot_is_ignored(self) -> None:
+        robot = Robot()
+        run(parse(b"PLACE 0,0,NORTH\nPLACE 1,1,UP\n"), robot)
+        self.assertEqual(robot.report(), "0,0,NORTH")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,80 @@
+# tests/test_compiler.py
+import unittest
+
+from src.robot import Robot
+from src.engine import DEFAULT_TABLE, UNPLACED, encode
+from src.compiler import compile_program, compose, repeat, identity
+
+
+def run_robot(commands, start=None):
+    """Step a ``Robot`` through ``commands`` the slow way."""
+    robot = Robot()
+    if start:
+        robot.place(*start)
+    for line in commands:
+        parts = line.split()
+        if parts[0] == "PLACE":
+            x, y, f = parts[1].split(",")
+            robot.place(int(x), int(y), f)
+        else:
+            getattr(robot, parts[0].lower())()
+    return robot.report()
+
+
+class TestCompiler(unittest.TestCase):
+    """Unit tests for program compilation and composition."""
+
+    PATROL = ["MOVE", "MOVE", "RIGHT", "MOVE", "LEFT", "MOVE", "RIGHT", "RIGHT"]
+
+    def test_compiled_program_matches_robot_from_every_state(self) -> None:
+        """The mapping agrees with stepping ``Robot`` from all 100 placed states."""
+        mapping = compile_program(self.PATROL)
+        for x in range(5):
+            for y in range(5):
+                for h, f in enumerate(("NORTH", "EAST", "SOUTH", "WEST")):
+                    with self.subTest(x=x, y=y, f=f):
+                        state = mapping[encode(x, y, h)]
+                        self.assertEqual(DEFAULT_TABLE.report(state),
+                                         run_robot(self.PATROL, (x, y, f)))
+
+    def test_unplaced_commands_are_ignored(self) -> None:
+        """Without PLACE the unplaced state maps to itself."""
+        self.assertEqual(compile_program(["MOVE", "REPORT"])[UNPLACED], UNPLACED)
+
+    def test_place_is_a_constant_mapping(self) -> None:
+        """A valid PLACE resets every state; an invalid one is ignored."""
+        mapping = compile_program(["PLACE 1,2,EAST", "MOVE", "PLACE 9,9,NORTH"])
+        self.assertEqual(set(mapping), {encode(2, 2, 1)})
+
+    def test_compose_is_associative_and_ordered(self) -> None:
+        """compose(a, b) runs ``a`` first, and grouping does not matter."""
+        a, b, c = (compile_program(p) for p in (["MOVE"], ["LEFT"], ["MOVE", "RIGHT"]))
+        self.assertEqual(compose(compose(a, b), c), compose(a, compose(b, c)))
+        self.assertEqual(compose(a, b), compile_program(["MOVE", "LEFT"]))
+
+    def test_repeat_matches_stepwise_execution(self) -> None:
+        """Repeated doubling equals running the block ``n`` times."""
+        block = compile_program(self.PATROL)
+        for n in (0, 1, 2, 7, 64, 1001):
+            with self.subTest(n=n):
+                expected = identity()
+                for _ in range(n):
+                    expected = compose(expected, block)
+                self.assertEqual(repeat(block, n), expected)
+
+    def test_billion_step_patrol(self) -> None:
+        """A 10^9-repetition loop evaluates instantly and stays on the table."""
+        start = encode(0, 0, 0)
+        state = repeat(compile_program(self.PATROL), 10 ** 9)[start]
+        self.assertNotEqual(state, UNPLACED)
+
+    def test_invalid_commands_raise(self) -> None:
+        """Unknown commands and malformed PLACEs report the line number."""
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            compile_program(["MOVE", "JUMP"])
+        with self.assertRaisesRegex(ValueError, "PLACE"):
+            compile_program(["PLACE 1,2"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,76 @@
+# tests/test_engine.py
+import itertools
+import unittest
+
+from src.robot import Robot
+from src.engine import (TransitionTable, TableRobot, DEFAULT_TABLE, DIRECTIONS,
+                        MOVE, LEFT, RIGHT, UNPLACED, encode, decode)
+
+
+class TestTransitionTable(unittest.TestCase):
+    """Unit tests for the compiled transition-table engine."""
+
+    def test_encode_decode_round_trip(self) -> None:
+        """Every placed state decodes back to its position and heading."""
+        self.assertEqual(DEFAULT_TABLE.size, 101)
+        self.assertIsNone(decode(UNPLACED))
+        for x, y, h in itertools.product(range(5), range(5), range(4)):
+            state = encode(x, y, h)
+            self.assertTrue(1 <= state <= 100)
+            self.assertEqual(decode(state), (x, y, h))
+
+    def test_tables_match_robot_for_every_state(self) -> None:
+        """Each table entry agrees with ``Robot`` starting from that state."""
+        for x, y, f in itertools.product(range(5), range(5), DIRECTIONS):
+            for op, method in ((MOVE, "move"), (LEFT, "left"), (RIGHT, "right")):
+                with self.subTest(x=x, y=y, f=f, method=method):
+                    robot = Robot()
+                    robot.place(x, y, f)
+                    getattr(robot, method)()
+                    state = DEFAULT_TABLE.next_state[op][encode(x, y, DIRECTIONS.index(f))]
+                    self.assertEqual(DEFAULT_TABLE.report(state), robot.report())
+
+    def test_unplaced_state_is_absorbing(self) -> None:
+        """MOVE/LEFT/RIGHT keep the unplaced state unplaced."""
+        self.assertEqual(DEFAULT_TABLE.run([MOVE, LEFT, RIGHT]), UNPLACED)
+
+    def test_place_rejects_invalid_input(self) -> None:
+        """Invalid placements leave the previous state unchanged."""
+        start = encode(1, 1, 0)
+        for args in [(5, 0, "NORTH"), (0, -1, "EAST"), (2, 2, "UP"), ("1", 1, "NORTH")]:
+            with self.subTest(args=args):
+                self.assertEqual(DEFAULT_TABLE.place(start, *args), start)
+
+    def test_custom_table_size(self) -> None:
+        """Tables can be built for other rectangular tables."""
+        table = TransitionTable(width=3, height=2)
+        state = table.place(UNPLACED, 2, 1, "EAST")
+        self.assertEqual(table.report(table.run([MOVE, LEFT, MOVE], state)), "2,1,NORTH")
+        self.assertEqual(table.report(table.run([RIGHT, MOVE], state)), "2,0,SOUTH")
+
+
+class TestTableRobot(unittest.TestCase):
+    """``TableRobot`` behaves like ``Robot`` through the same API."""
+
+    def test_example_sequence(self) -> None:
+        """PLACE 1,2,EAST → MOVE → MOVE → LEFT → MOVE → REPORT → 3,3,NORTH"""
+        robot = TableRobot()
+        self.assertIsNone(robot.report())
+        self.assertTrue(robot.place(1, 2, "EAST"))
+        robot.move()
+        robot.move()
+        robot.left()
+        robot.move()
+        self.assertEqual((robot.x, robot.y, robot.f), (3, 3, "NORTH"))
+        self.assertEqual(robot.report(), "3,3,NORTH")
+
+    def test_invalid_place_keeps_state(self) -> None:
+        """A rejected PLACE returns False and keeps the rover where it was."""
+        robot = TableRobot()
+        robot.place(0, 0, "NORTH")
+        self.assertFalse(robot.place(0, 7, "NORTH"))
+        self.assertEqual(robot.report(), "0,0,NORTH")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,67 @@
+# tests/test_events.py
+import subprocess
+import sys
+import unittest
+
+from src.robot import Robot
+from src.events import CountingSink, TracingSink, LoggingSink, MultiSink
+
+
+class TestEventSinks(unittest.TestCase):
+    """Unit tests for the pluggable robot event sinks."""
+
+    def test_default_robot_has_no_sink(self) -> None:
+        """Robots are silent unless a sink is attached."""
+        self.assertIsNone(Robot().sink)
+
+    def test_tracing_sink_records_state_and_reasons(self) -> None:
+        """Every command is traced with its post-command state."""
+        sink = TracingSink()
+        robot = Robot(sink)
+        robot.move()
+        robot.place(0, 0, "SOUTH")
+        robot.move()
+        robot.left()
+        robot.report()
+        self.assertEqual(sink.events, [
+            ("move", None, None, None, "robot not placed"),
+            ("place", 0, 0, "SOUTH", None),
+            ("move", 0, 0, "SOUTH", "would fall off table"),
+            ("left", 0, 0, "EAST", None),
+            ("report", 0, 0, "EAST", None),
+        ])
+
+    def test_counting_sink(self) -> None:
+        """Applied and ignored commands are counted separately."""
+        sink = CountingSink()
+        robot = Robot(sink)
+        robot.place(9, 9, "NORTH")
+        robot.place(0, 0, "NORTH")
+        robot.move()
+        robot.move()
+        self.assertEqual(sink.counts[("place", False)], 1)
+        self.assertEqual(sink.counts[("place", True)], 1)
+        self.assertEqual(sink.counts[("move", True)], 2)
+
+    def test_logging_sink_is_opt_in(self) -> None:
+        """``LoggingSink`` writes to the ``rover`` logger, via ``MultiSink`` too."""
+        counter = CountingSink()
+        robot = Robot(MultiSink(LoggingSink(), counter))
+        with self.assertLogs("rover", level="INFO") as logs:
+            robot.place(1, 1, "EAST")
+            robot.right()
+        self.assertEqual([r.getMessage() for r in logs.records],
+                         ["Placed at 1,1,EAST", "Turned right to SOUTH"])
+        self.assertEqual(sum(counter.counts.values()), 2)
+
+    def test_import_does_not_configure_logging(self) -> None:
+        """Importing ``robot`` leaves the root logger untouched."""
+        code = ("import logging, src.robot; "
+                "print(len(logging.getLogger().handlers))")
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                             text=True, check=True).stdout
+        self.assertEqual(out.strip(), "0")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,89 @@
+# tests/test_fleet.py
+import io
+import random
+import unittest
+
+from src.robot import Robot
+
+try:
+    import numpy as np
+    from src.fleet import RobotFleet, DIRECTIONS
+except ImportError:  # NumPy is optional
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestRobotFleet(unittest.TestCase):
+    """Unit tests for the vectorized ``RobotFleet`` engine."""
+
+    def test_unplaced_robots_ignore_commands(self) -> None:
+        """MOVE/LEFT/RIGHT leave unplaced robots untouched."""
+        fleet = RobotFleet(3)
+        fleet.move()
+        fleet.left()
+        fleet.right()
+        self.assertTrue((fleet.report() == -1).all())
+
+    def test_invalid_placement_is_ignored(self) -> None:
+        """Out-of-range coordinates and unknown directions are rejected."""
+        fleet = RobotFleet(4)
+        ok = fleet.place([0, 5, 2, 4], [0, 0, -1, 4], "NORTH")
+        self.assertEqual(ok.tolist(), [True, False, False, True])
+        self.assertFalse(fleet.place(1, 1, "UP").any())
+        self.assertEqual(fleet.report().tolist(),
+                         [[0, 0, 0], [-1, -1, -1], [-1, -1, -1], [4, 4, 0]])
+
+    def test_move_clamps_at_edges(self) -> None:
+        """Robots facing the edge stay put; the others advance."""
+        fleet = RobotFleet(2)
+        fleet.place([0, 4], [0, 4], [2, 0])   # SOUTH at bottom, NORTH at top
+        self.assertFalse(fleet.move().any())
+        fleet.right()                         # WEST, EAST
+        fleet.right()                         # NORTH, SOUTH
+        self.assertTrue(fleet.move().all())
+        self.assertEqual(fleet.report().tolist(), [[0, 1, 0], [4, 3, 2]])
+
+    def test_mask_limits_the_command(self) -> None:
+        """Only robots selected by the mask execute the command."""
+        fleet = RobotFleet(2)
+        fleet.place(1, 1, "EAST")
+        fleet.move(mask=[True, False])
+        fleet.left(mask=[False, True])
+        self.assertEqual(fleet.report().tolist(), [[2, 1, 1], [1, 1, 0]])
+
+    def test_matches_single_robot_semantics(self) -> None:
+        """Random command streams agree with ``Robot`` for every rover."""
+        rng = random.Random(7)
+        size = 50
+        fleet = RobotFleet(size)
+        robots = [Robot() for _ in range(size)]
+        for _ in range(300):
+            mask = [rng.random() < 0.7 for _ in range(size)]
+            cmd = rng.choice(["PLACE", "MOVE", "MOVE", "LEFT", "RIGHT"])
+            if cmd == "PLACE":
+                x, y, f = rng.randint(-1, 5), rng.randint(-1, 5), rng.choice(DIRECTIONS)
+                fleet.place(x, y, f, mask=mask)
+                for robot, sel in zip(robots, mask):
+                    if sel:
+                        robot.place(x, y, f)
+            else:
+                getattr(fleet, cmd.lower())(mask=mask)
+                for robot, sel in zip(robots, mask):
+                    if sel:
+                        getattr(robot, cmd.lower())()
+        expected = [robot.report() for robot in robots]
+        actual = [None if h < 0 else f"{x},{y},{DIRECTIONS[h]}"
+                  for x, y, h in fleet.report().tolist()]
+        self.assertEqual(actual, expected)
+
+    def test_write_csv(self) -> None:
+        """CSV output lists only placed robots."""
+        fleet = RobotFleet(3)
+        fleet.place(2, 3, "WEST", mask=[True, False, True])
+        out = io.StringIO()
+        self.assertEqual(fleet.write_csv(out, chunk=2), 2)
+        self.assertEqual(out.getvalue(), "robot,x,y,f\n0,2,3,WEST\n2,2,3,WEST\n")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
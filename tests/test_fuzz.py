@@ -0,0 +1,85 @@
+# tests/test_fuzz.py
+import gc
+import random
+import unittest
+import weakref
+
+from src.board import Board
+from src.engine import MOVE, LEFT, REPORT, PLACE
+from src import fuzz
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+def wraps_east(programs, board):
+    """A broken engine: MOVE EAST off the right edge wraps to x = 0."""
+    results = fuzz.table_engine(programs, board)
+    return [[r.replace(f"{board.width - 1},", "0,", 1) if r and r.endswith("EAST") else r
+             for r in out] for out in results]
+
+
+class TestFuzz(unittest.TestCase):
+    """Unit tests for the differential fuzzer."""
+
+    def test_generation_is_seeded(self) -> None:
+        """The same seed gives the same programs."""
+        a = [fuzz.program_lines(fuzz.generate(random.Random(5), 50)) for _ in range(3)]
+        b = [fuzz.program_lines(fuzz.generate(random.Random(5), 50)) for _ in range(3)]
+        self.assertEqual(a, b)
+
+    def test_programs_cover_awkward_cases(self) -> None:
+        """Invalid PLACEs, commands before any PLACE and edge walks all occur."""
+        rng = random.Random(1)
+        lines = [fuzz.program_lines(fuzz.generate(rng, 100)) for _ in range(200)]
+        flat = [line for program in lines for line in program]
+        self.assertTrue(any(",UP" in line or "-1," in line for line in flat))
+        self.assertTrue(any(not program[0].startswith("PLACE") for program in lines))
+        self.assertTrue(any("MOVE\n" * 7 in "\n".join(program) for program in lines))
+        self.assertTrue(all(len(program) == 100 for program in lines))
+
+    def test_engines_agree_with_robot(self) -> None:
+        """Every engine matches Robot, on open and obstructed boards."""
+        obstructed = Board(6, 4, blocked=[(1, 1), (4, 2), (5, 0)])
+        for name, engine in fuzz.ENGINES.items():
+            if name == "fleet" and np is None:
+                continue
+            for board in (Board(), obstructed):
+                with self.subTest(engine=name, board=board):
+                    self.assertIsNone(fuzz.fuzz(engine, seed=2, programs=300, length=40,
+                                                board=board, batch=100))
+
+    def test_boards_are_not_retained(self) -> None:
+        """A run's transition table (and board) are freed when it returns."""
+        class WeakBoard(Board):
+            __slots__ = ("__weakref__",)
+
+        board = WeakBoard(7, 3)
+        self.assertIsNone(fuzz.fuzz(fuzz.table_engine, programs=50, board=board))
+        ref = weakref.ref(board)
+        del board
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_divergence_is_shrunk(self) -> None:
+        """A planted bug is found and reduced to a 1-minimal program."""
+        found = fuzz.fuzz(wraps_east, seed=0, programs=2000, length=40)
+        self.assertIsNotNone(found)
+        self.assertNotEqual(found.expected, found.actual)
+        self.assertLessEqual(len(found.program), 4)
+        self.assertTrue(found.program[0].startswith("PLACE"))
+
+    def test_shrink_is_one_minimal(self) -> None:
+        """No single command can be dropped from a shrunk program."""
+        commands = [(LEFT, None)] * 5 + [(PLACE, (1, 1, 0)), (MOVE, None)] + [(REPORT, None)] * 5
+
+        def diverges(cmds):
+            return (PLACE, (1, 1, 0)) in cmds and (MOVE, None) in cmds
+
+        self.assertEqual(fuzz.shrink(commands, diverges), [(PLACE, (1, 1, 0)), (MOVE, None)])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,115 @@
+# tests/test_history.py
+import random
+import unittest
+
+from src.history import History
+from src.robot import Robot
+
+
+class TestHistory(unittest.TestCase):
+    """Unit tests for bounded undo/redo."""
+
+    def setUp(self) -> None:
+        self.robot = Robot()
+        self.history = History(self.robot, capacity=50, snapshot_every=4)
+
+    def test_undo_redo(self) -> None:
+        """Undo walks back through state changes and redo replays them."""
+        h = self.history
+        h.run(self.robot.place, 1, 1, "NORTH")
+        h.run(self.robot.move)
+        h.run(self.robot.right)
+        self.assertTrue(h.undo())
+        self.assertEqual(self.robot.report(), "1,2,NORTH")
+        self.assertTrue(h.undo())
+        self.assertTrue(h.undo())
+        self.assertIsNone(self.robot.report())
+        self.assertFalse(h.undo())
+        self.assertTrue(h.redo())
+        self.assertTrue(h.redo())
+        self.assertEqual(self.robot.report(), "1,2,NORTH")
+        self.assertEqual((h.position, h.newest), (2, 3))
+
+    def test_no_op_commands_are_not_recorded(self) -> None:
+        """REPORT and ignored commands leave nothing to undo."""
+        h = self.history
+        h.run(self.robot.move)
+        h.run(self.robot.place, 0, 0, "SOUTH")
+        self.assertEqual(h.run(self.robot.report), "0,0,SOUTH")
+        h.run(self.robot.move)
+        self.assertEqual(h.position, 1)
+
+    def test_new_command_discards_redo(self) -> None:
+        """Recording after an undo drops the undone branch."""
+        h = self.history
+        h.run(self.robot.place, 0, 0, "NORTH")
+        h.run(self.robot.move)
+        h.undo()
+        h.run(self.robot.right)
+        self.assertFalse(h.redo())
+        self.assertEqual(self.robot.report(), "0,0,EAST")
+        self.assertEqual(h.newest, 2)
+
+    def test_memory_is_bounded(self) -> None:
+        """Only ``capacity`` steps are kept; memory does not grow."""
+        h = self.history
+        h.run(self.robot.place, 0, 0, "NORTH")
+        before = h.nbytes
+        for _ in range(10000):
+            h.run(self.robot.right)
+        self.assertLessEqual(h.nbytes, before + 16 * 50)
+        self.assertEqual(h.newest - h.oldest, 50)
+        undone = 0
+        while h.undo():
+            undone += 1
+        self.assertEqual(undone, 50)
+        self.assertEqual(h.position, h.oldest)
+
+    def test_matches_reference_model(self) -> None:
+        """Random commands, undos, redos and seeks agree with a plain list."""
+        rng = random.Random(11)
+        h = History(self.robot, capacity=40, snapshot_every=8)
+        states = [None]  # reports at steps 0..newest
+        pos = 0
+        for _ in range(3000):
+            r = rng.random()
+            if r < 0.5:
+                before = self.robot.report()
+                cmd = rng.choice(["move", "left", "right", "place"])
+                if cmd == "place":
+                    h.run(self.robot.place, rng.randint(0, 4), rng.randint(0, 4),
+                          rng.choice(["NORTH", "EAST", "SOUTH", "WEST"]))
+                else:
+                    h.run(getattr(self.robot, cmd))
+                if self.robot.report() != before:
+                    del states[pos + 1:]
+                    states.append(self.robot.report())
+                    pos += 1
+            elif r < 0.7:
+                if h.undo():
+                    pos -= 1
+            elif r < 0.9:
+                if h.redo():
+                    pos += 1
+            else:
+                target = rng.randint(h.oldest, h.newest)
+                h.seek(target)
+                pos = len(states) - 1 - (h.newest - target)
+            self.assertEqual(self.robot.report(), states[pos])
+            self.assertEqual(h.newest - h.position, len(states) - 1 - pos)
+        with self.assertRaises(IndexError):
+            h.seek(h.oldest - 1)
+
+    def test_external_changes_become_steps(self) -> None:
+        """Changes made outside the history are still undoable."""
+        h = self.history
+        self.robot.place(2, 2, "WEST")
+        h.run(self.robot.move)
+        h.undo()
+        self.assertEqual(self.robot.report(), "2,2,WEST")
+        h.undo()
+        self.assertIsNone(self.robot.report())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,120 @@
+# tests/test_journal.py
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.journal import (Journal, JournalWriter, JournalError, Event, HEADER, RECORD,
+                         replay)
+from src.basic import run_script
+from src.events import TracingSink
+from src.robot import Robot
+
+
+class TestJournal(unittest.TestCase):
+    """Unit tests for the binary event journal."""
+
+    def setUp(self) -> None:
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.path = os.path.join(self.dir, "session.rovj")
+
+    def record(self, script, **kwargs) -> None:
+        with JournalWriter(self.path, **kwargs) as journal:
+            run_script(io.BytesIO(script), io.BytesIO(), journal)
+
+    def test_fixed_width_records(self) -> None:
+        """Every event costs exactly one 6-byte record."""
+        self.record(b"MOVE\nPLACE 0,0,NORTH\nMOVE\nLEFT\nREPORT\n")
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 5 * RECORD.size)
+        self.assertEqual(RECORD.size, 6)
+
+    def test_events_round_trip(self) -> None:
+        """Reading back yields the command, outcome and resulting state."""
+        self.record(b"MOVE\nPLACE 0,0,SOUTH\nMOVE\nLEFT\nMOVE\nREPORT\n")
+        with Journal(self.path) as journal:
+            self.assertEqual(len(journal), 6)
+            self.assertEqual(list(journal), [
+                Event("move", False, None, None, None),
+                Event("place", True, 0, 0, "SOUTH"),
+                Event("move", False, 0, 0, "SOUTH"),
+                Event("left", True, 0, 0, "EAST"),
+                Event("move", True, 1, 0, "EAST"),
+                Event("report", True, 1, 0, "EAST"),
+            ])
+            self.assertEqual(journal[-1], journal[5])
+            with self.assertRaises(IndexError):
+                journal[6]
+
+    def test_matches_tracing_sink(self) -> None:
+        """The journal sees exactly what any other sink sees."""
+        script = b"PLACE 9,9,NORTH\nPLACE 2,2,WEST\n" + b"MOVE\nRIGHT\nMOVE\nMOVE\nLEFT\n" * 30
+        tracer = TracingSink()
+        run_script(io.BytesIO(script), io.BytesIO(), tracer)
+        self.record(script, buffer_events=7)
+        with Journal(self.path) as journal:
+            got = [(e.command, e.x, e.y, e.f, e.applied) for e in journal]
+        want = [(c, x, y, f, reason is None) for c, x, y, f, reason in tracer.events]
+        self.assertEqual(got, want)
+
+    def test_appends_and_replays(self) -> None:
+        """A second session appends; replay reproduces the final state."""
+        self.record(b"PLACE 1,1,NORTH\nMOVE\n")
+        self.record(b"PLACE 1,2,NORTH\nRIGHT\nMOVE\nMOVE\nMOVE\nMOVE\n")
+        with Journal(self.path) as journal:
+            self.assertEqual(len(journal), 8)
+            robot = replay(journal, Robot())
+            self.assertEqual(robot.report(), "4,2,EAST")
+            self.assertEqual(replay(journal, Robot(), stop=2).report(), "1,2,NORTH")
+
+    def test_torn_tail_is_ignored(self) -> None:
+        """A partial final record (crash mid-write) is not an event."""
+        self.record(b"PLACE 1,1,NORTH\nMOVE\n")
+        with open(self.path, "ab") as fh:
+            fh.write(b"\x00\x01\x02")
+        with Journal(self.path) as journal:
+            self.assertEqual(len(journal), 2)
+
+    def test_append_after_torn_tail(self) -> None:
+        """A new session cuts off the torn record instead of writing misaligned."""
+        self.record(b"PLACE 1,1,NORTH\nMOVE\n")
+        with open(self.path, "ab") as fh:
+            fh.write(b"\x00\x01\x02")
+        self.record(b"PLACE 3,3,EAST\nMOVE\n")
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 4 * RECORD.size)
+        with Journal(self.path) as journal:
+            self.assertEqual(list(journal)[2:], [Event("place", True, 3, 3, "EAST"),
+                                                 Event("move", True, 4, 3, "EAST")])
+
+    def test_rejects_foreign_files(self) -> None:
+        """Wrong magic or board size raise JournalError."""
+        with open(self.path, "wb") as fh:
+            fh.write(b"PLACE 0,0,NORTH\n")
+        with self.assertRaises(JournalError):
+            Journal(self.path)
+        os.remove(self.path)
+        self.record(b"MOVE\n")
+        with self.assertRaises(JournalError):
+            JournalWriter(self.path, width=10, height=10)
+        with open(self.path, "wb") as fh:
+            fh.write(b"ROVJ")
+        with self.assertRaises(JournalError):
+            JournalWriter(self.path)
+        with self.assertRaises(JournalError):
+            JournalWriter(os.path.join(self.dir, "big.rovj"), width=70000, height=5)
+
+    def test_attach_keeps_existing_sink(self) -> None:
+        """Attaching a journal does not displace a robot's sink."""
+        tracer = TracingSink()
+        with JournalWriter(self.path) as journal:
+            robot = journal.attach(Robot(tracer))
+            robot.place(0, 0, "EAST")
+            robot.move()
+        self.assertEqual(len(tracer.events), 2)
+        with Journal(self.path) as journal:
+            self.assertEqual(journal[1], Event("move", True, 1, 0, "EAST"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
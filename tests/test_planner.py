@@ -0,0 +1,109 @@
+# tests/test_planner.py
+import gc
+import itertools
+import random
+import unittest
+import weakref
+
+from src.planner import Planner, plan
+from src.board import Board
+from src.robot import Robot, DIRECTIONS
+
+
+def follow(start, commands, blocked=()):
+    """Run commands on a Robot, refusing MOVEs into blocked cells."""
+    robot = Robot()
+    robot.place(*start)
+    for cmd in commands:
+        if cmd == "MOVE" and robot.ahead() in blocked:
+            raise AssertionError(f"path enters blocked cell {robot.ahead()}")
+        getattr(robot, cmd.lower())()
+    return robot.x, robot.y, robot.f
+
+
+class TestPlanner(unittest.TestCase):
+    """Unit tests for the shortest-path command planner."""
+
+    def test_example(self) -> None:
+        """0,0,NORTH to 3,4,WEST: 7 moves and 3 turns."""
+        path = plan((0, 0, "NORTH"), (3, 4, "WEST"))
+        self.assertEqual(len(path), 10)
+        self.assertEqual(follow((0, 0, "NORTH"), path), (3, 4, "WEST"))
+        self.assertEqual(plan((2, 2, "EAST"), (2, 2, "EAST")), [])
+        self.assertEqual(plan((2, 2, "EAST"), (2, 2, "WEST")), ["LEFT", "LEFT"])
+
+    def test_table_and_astar_agree_on_all_pairs(self) -> None:
+        """Every table path is valid and as short as A*'s."""
+        table = Planner()
+        astar = Planner(max_table_states=0)
+        self.assertIsNotNone(table.table)
+        self.assertIsNone(astar.table)
+        poses = [(x, y, f) for x in range(5) for y in range(5) for f in DIRECTIONS]
+        for start, goal in itertools.product(poses, repeat=2):
+            path = table.plan(start, goal)
+            self.assertEqual(follow(start, path), goal)
+            self.assertEqual(len(path), len(astar.plan(start, goal)))
+
+    def test_obstacles_use_astar(self) -> None:
+        """Blocked cells are avoided, or reported as unreachable."""
+        wall = {(2, y) for y in range(5)}
+        planner = Planner(blocked=wall)
+        self.assertIsNone(planner.plan((0, 0, "EAST"), (4, 0, "EAST")))
+        gap = wall - {(2, 4)}
+        path = Planner(blocked=gap).plan((0, 0, "EAST"), (4, 0, "EAST"))
+        self.assertEqual(follow((0, 0, "EAST"), path, gap), (4, 0, "EAST"))
+        self.assertEqual(len(path), 12 + 4)  # up, across, down; four turns
+
+    def test_board_changes_invalidate_plans(self) -> None:
+        """Blocking a cell on a shared Board changes later answers."""
+        board = Board(5, 5)
+        planner = Planner(board=board)
+        self.assertEqual(planner.plan((0, 0, "EAST"), (2, 0, "EAST")), ["MOVE", "MOVE"])
+        board.block(1, 0)
+        path = planner.plan((0, 0, "EAST"), (2, 0, "EAST"))
+        self.assertEqual(len(path), 8)
+        self.assertEqual(follow((0, 0, "EAST"), path, {(1, 0)}), (2, 0, "EAST"))
+        board.unblock(1, 0)
+        self.assertEqual(len(planner.plan((0, 0, "EAST"), (2, 0, "EAST"))), 2)
+
+    def test_cache_is_per_planner(self) -> None:
+        """Board changes drop cached A* answers; a dropped planner frees its board."""
+        class WeakBoard(Board):
+            __slots__ = ("__weakref__",)
+
+        board = WeakBoard(40, 40)
+        planner = Planner(board=board)
+        planner.plan((0, 0, "EAST"), (5, 0, "EAST"))
+        planner.plan((0, 0, "EAST"), (6, 0, "EAST"))
+        board.block(3, 0)
+        self.assertEqual(len(planner.plan((0, 0, "EAST"), (5, 0, "EAST"))), 11)
+        self.assertEqual(planner._search.cache_info().currsize, 1)
+
+        ref = weakref.ref(board)
+        del planner, board
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_large_board(self) -> None:
+        """Boards above the table limit are planned with A*."""
+        planner = Planner(40, 40)
+        self.assertIsNone(planner.table)
+        rng = random.Random(5)
+        for _ in range(20):
+            start = (rng.randrange(40), rng.randrange(40), rng.choice(DIRECTIONS))
+            goal = (rng.randrange(40), rng.randrange(40), rng.choice(DIRECTIONS))
+            path = planner.plan(start, goal)
+            self.assertGreaterEqual(len(path), abs(start[0] - goal[0]) + abs(start[1] - goal[1]))
+
+    def test_invalid_pose(self) -> None:
+        """Off-board, unknown heading or blocked poses raise ValueError."""
+        with self.assertRaises(ValueError):
+            plan((5, 0, "NORTH"), (0, 0, "NORTH"))
+        with self.assertRaises(ValueError):
+            plan((0, 0, "UP"), (0, 0, "NORTH"))
+        with self.assertRaises(ValueError):
+            Planner(blocked={(1, 1)}).plan((0, 0, "NORTH"), (1, 1, "NORTH"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,107 @@
+# tests/test_profiling.py
+import contextlib
+import io
+import random
+import unittest
+from unittest import mock
+
+from src import basic
+from src.profiling import (LatencyHistogram, LatencyRecorder, TimingSink,
+                           bucket_index, bucket_bounds, from_env)
+from src.robot import Robot
+
+
+class FakeClock:
+    """Nanosecond clock that advances by a scripted step on every read."""
+
+    def __init__(self, steps):
+        self.now = 0
+        self.steps = iter(steps)
+
+    def __call__(self):
+        self.now += next(self.steps, 0)
+        return self.now
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Unit tests for the fixed-bucket histogram."""
+
+    def test_buckets_cover_every_value(self) -> None:
+        """Each value falls inside its bucket, and buckets are ordered."""
+        for ns in list(range(200)) + [10**k + d for k in range(3, 13) for d in (-1, 0, 1)]:
+            low, high = bucket_bounds(bucket_index(ns))
+            self.assertLessEqual(low, ns)
+            self.assertLess(ns, high)
+            self.assertLessEqual(high - low, max(1, ns // 4))
+        self.assertLess(bucket_index(2**63 - 1), LatencyHistogram().counts.buffer_info()[1])
+
+    def test_percentiles_are_within_a_bucket(self) -> None:
+        """p50/p95/p99 are within 25% of the exact order statistics."""
+        rng = random.Random(4)
+        samples = sorted(int(rng.lognormvariate(10, 1.5)) for _ in range(20000))
+        hist = LatencyHistogram()
+        for ns in samples:
+            hist.add(ns)
+        for p in (50, 95, 99):
+            exact = samples[-(-len(samples) * p // 100) - 1]
+            self.assertLessEqual(exact, hist.percentile(p))
+            self.assertLessEqual(hist.percentile(p), exact * 1.25)
+        self.assertEqual(hist.percentile(100), samples[-1])
+        self.assertIsNone(LatencyHistogram().percentile(50))
+
+    def test_merge(self) -> None:
+        """Merging equals recording both sample sets in one histogram."""
+        a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for i, ns in enumerate(range(0, 100000, 37)):
+            (a if i % 2 else b).add(ns)
+            both.add(ns)
+        a.merge(b)
+        self.assertEqual(list(a.counts), list(both.counts))
+        self.assertEqual((a.count, a.total, a.max), (both.count, both.total, both.max))
+
+
+class TestLatencyRecorder(unittest.TestCase):
+    """Unit tests for named recording, wrappers and the CLI hook."""
+
+    def test_laps_and_summary(self) -> None:
+        """``lap`` records the time since the previous reading."""
+        rec = LatencyRecorder(FakeClock([0, 1000, 3000, 1000]))
+        start = rec.clock()
+        start = rec.lap("parse", start)
+        start = rec.lap("move", start)
+        rec.lap("parse", start)
+        rows = {row[0]: row[1:] for row in rec.summary()}
+        self.assertEqual(rows["parse"][0], 2)
+        self.assertEqual(rows["move"], (1, 3000, 3000, 3000, 3000))
+        self.assertIn("move", rec.format())
+
+    def test_timed_and_timing_sink(self) -> None:
+        """Wrapped functions and sinks record one sample per call."""
+        rec = LatencyRecorder()
+        robot = Robot(TimingSink(mock.Mock(), rec, "logging"))
+        place = rec.timed("place", robot.place)
+        self.assertTrue(place(1, 1, "NORTH"))
+        robot.move()
+        self.assertEqual(rec.histograms["place"].count, 1)
+        self.assertEqual(rec.histograms["logging"].count, 2)
+
+    def test_from_env(self) -> None:
+        """Recording is off unless the environment variable is set."""
+        self.assertIsNone(from_env({}))
+        self.assertIsNone(from_env({"ROVER_LATENCY": "0"}))
+        self.assertIsInstance(from_env({"ROVER_LATENCY": "1"}), LatencyRecorder)
+
+    def test_repl_records_each_stage(self) -> None:
+        """The CLI times parsing, each command type and the table redraw."""
+        rec = LatencyRecorder()
+        commands = iter(["PLACE 0,0,NORTH", "MOVE", "REPORT", "EXIT"])
+        with mock.patch("builtins.input", lambda prompt: next(commands)), \
+                contextlib.redirect_stdout(io.StringIO()):
+            basic.repl(Robot(), rec)
+        counts = {name: h.count for name, h in rec.histograms.items()}
+        self.assertEqual(counts, {"parse": 4, "place": 1, "move": 1, "report": 1,
+                                  "print_table": 3})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
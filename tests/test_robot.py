@@ -1,6 +1,7 @@
 # tests/test_robot.py
 import unittest
 from src.robot import Robot
+from src.board import Board
 
 
 class TestRobot(unittest.TestCase):
@@ -163,5 +164,48 @@ class TestRobot(unittest.TestCase):
         self.assertEqual(self.robot.report(), "3,3,NORTH")
 
 
+    # ------------------------------------------------------------------ #
+    #   COMPACT REPRESENTATION
+    # ------------------------------------------------------------------ #
+    def test_compact_representation(self) -> None:
+        """Robots use ``__slots__`` and share one direction table."""
+        self.assertFalse(hasattr(self.robot, "__dict__"))
+        self.assertIs(self.robot.directions, Robot().directions)
+
+    def test_f_attribute_is_read_write(self) -> None:
+        """``f`` still reads and writes direction names."""
+        self.robot.place(2, 2, "NORTH")
+        self.robot.f = "WEST"
+        self.robot.move()
+        self.assertEqual(self.robot.report(), "1,2,WEST")
+
+    # ------------------------------------------------------------------ #
+    #   BOARDS
+    # ------------------------------------------------------------------ #
+    def test_custom_board_size(self) -> None:
+        """Edges follow the robot's board, not a fixed 5×5 table."""
+        robot = Robot(board=Board(8, 3))
+        self.assertFalse(robot.place(0, 4, "NORTH"))
+        self.assertTrue(robot.place(6, 2, "EAST"))
+        robot.move()
+        robot.move()
+        self.assertEqual(robot.report(), "7,2,EAST")
+
+    def test_blocked_cells_are_avoided(self) -> None:
+        """The robot neither lands on nor drives into a blocked cell."""
+        events = []
+
+        class Sink:
+            def emit(self, command, robot, reason=None):
+                events.append(reason)
+
+        robot = Robot(Sink(), Board(blocked=[(2, 2)]))
+        self.assertFalse(robot.place(2, 2, "NORTH"))
+        robot.place(2, 1, "NORTH")
+        robot.move()
+        self.assertEqual(robot.report(), "2,1,NORTH")
+        self.assertIn("cell blocked", events)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
\ No newline at end of file
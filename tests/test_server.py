@@ -0,0 +1,88 @@
+# tests/test_server.py
+import asyncio
+import unittest
+
+from src.server import RoverServer, MAX_LINE
+
+
+class TestRoverServer(unittest.TestCase):
+    """End-to-end tests for the asyncio line-protocol server."""
+
+    def exchange(self, *payloads, lines):
+        """Start a server, send ``payloads`` on one connection, read ``lines`` replies."""
+        async def scenario():
+            server = RoverServer()
+            host, port = await server.start(port=0)
+            try:
+                reader, writer = await asyncio.open_connection(host, port)
+                for payload in payloads:
+                    writer.write(payload)
+                    await writer.drain()
+                replies = [await reader.readline() for _ in range(lines)]
+                writer.close()
+                return [r.decode().rstrip("\n") for r in replies], server.commands
+            finally:
+                await server.close()
+        return asyncio.run(asyncio.wait_for(scenario(), 10))
+
+    def test_pipelined_commands(self) -> None:
+        """Many commands in one write yield one reply per REPORT."""
+        replies, commands = self.exchange(
+            b"REPORT\nPLACE 1,2,EAST\nMOVE\nMOVE\nLEFT\nMOVE\nREPORT\n", lines=2)
+        self.assertEqual(replies, ["NOT PLACED", "3,3,NORTH"])
+        self.assertEqual(commands, 7)
+
+    def test_commands_split_across_packets(self) -> None:
+        """A command split over two writes is still parsed as one line."""
+        replies, _ = self.exchange(b"PLACE 0,0,NO", b"RTH\nMOVE\nREP", b"ORT\n", lines=1)
+        self.assertEqual(replies, ["0,1,NORTH"])
+
+    def test_errors_and_exit(self) -> None:
+        """Bad lines get an ERROR reply; EXIT answers BYE."""
+        replies, _ = self.exchange(b"JUMP\nEXIT\nMOVE\n", lines=3)
+        self.assertEqual(replies[0], "ERROR line 1, column 1: unknown command 'JUMP'")
+        self.assertEqual(replies[1:], ["BYE", ""])
+
+    def test_errors_are_in_command_order(self) -> None:
+        """ERROR replies are interleaved with REPORTs by line, even in one chunk."""
+        replies, _ = self.exchange(
+            b"PLACE 1,1,NORTH\nREPORT\nBOGUS\nMOVE\nREPORT\n\nPLACE x,1,NORTH\nREPORT\nEXIT\n",
+            lines=5)
+        self.assertEqual(replies, [
+            "1,1,NORTH",
+            "ERROR line 3, column 1: unknown command 'BOGUS'",
+            "1,2,NORTH",
+            "ERROR line 7, column 7: invalid coordinate 'x'",
+            "1,2,NORTH",
+        ])
+
+    def test_overlong_line_ends_session(self) -> None:
+        """A line without a newline cannot grow past MAX_LINE."""
+        replies, _ = self.exchange(b"PLACE 0,0,NORTH\nREPORT\n", b"M" * (MAX_LINE + 1), lines=4)
+        self.assertEqual(replies[0], "0,0,NORTH")
+        self.assertEqual(replies[1], f"ERROR line 3, column {MAX_LINE + 1}: "
+                                     f"line longer than {MAX_LINE} bytes")
+        self.assertEqual(replies[2:], ["BYE", ""])
+
+    def test_sessions_are_independent(self) -> None:
+        """Each connection drives its own robot."""
+        async def scenario():
+            server = RoverServer()
+            host, port = await server.start(port=0)
+            try:
+                r1, w1 = await asyncio.open_connection(host, port)
+                r2, w2 = await asyncio.open_connection(host, port)
+                w1.write(b"PLACE 4,4,SOUTH\nREPORT\n")
+                w2.write(b"REPORT\n")
+                replies = (await r1.readline(), await r2.readline())
+                w1.close()
+                w2.close()
+                return replies
+            finally:
+                await server.close()
+        replies = asyncio.run(asyncio.wait_for(scenario(), 10))
+        self.assertEqual(replies, (b"4,4,SOUTH\n", b"NOT PLACED\n"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
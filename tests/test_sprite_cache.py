@@ -0,0 +1,86 @@
+# tests/test_sprite_cache.py
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.sprite_cache import SpriteCache, default_cache_dir
+
+
+class TestSpriteCache(unittest.TestCase):
+    """Unit tests for the content-hashed PNG cache."""
+
+    def setUp(self) -> None:
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.calls = []
+
+        def render(svg, width, height):
+            self.calls.append((svg, width, height))
+            return b"PNG:" + svg + f":{width}x{height}".encode()
+
+        def resize(data, height):
+            self.calls.append((data, height))
+            return b"PNG:" + data[:8] + f":{height}".encode()
+
+        self.render, self.resize = render, resize
+
+    def cache(self) -> SpriteCache:
+        return SpriteCache(self.dir, svg_renderer=self.render, png_resizer=self.resize)
+
+    def test_second_launch_reads_from_disk(self) -> None:
+        """A fresh cache over the same directory does not render again."""
+        first = self.cache().svg_png("<svg/>", 50, 50)
+        second = self.cache()
+        self.assertEqual(second.svg_png("<svg/>", 50, 50), first)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual((second.hits, second.misses), (1, 0))
+
+    def test_key_covers_content_and_size(self) -> None:
+        """Different SVG source or output size are separate entries."""
+        cache = self.cache()
+        cache.svg_png("<svg/>", 50, 50)
+        cache.svg_png(b"<svg/>", 50, 50)
+        cache.svg_png("<svg/>", 60, 60)
+        cache.svg_png("<svg id='x'/>", 50, 50)
+        self.assertEqual(cache.misses, 3)
+        self.assertEqual(cache.hits, 1)
+
+    def test_resized_image_invalidated_when_file_changes(self) -> None:
+        """Replacing the source image on disk forces a re-render."""
+        path = os.path.join(self.dir, "logo.png")
+        with open(path, "wb") as fh:
+            fh.write(b"version-1")
+        cache = self.cache()
+        self.assertEqual(cache.resized_png(path, 40), b"PNG:version-:40")
+        cache.resized_png(path, 40)
+        with open(path, "wb") as fh:
+            fh.write(b"version-2")
+        cache.resized_png(path, 40)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_unwritable_directory_still_renders(self) -> None:
+        """A cache that cannot be written degrades to rendering every time."""
+        blocker = os.path.join(self.dir, "file")
+        open(blocker, "w").close()
+        cache = SpriteCache(os.path.join(blocker, "sprites"), svg_renderer=self.render)
+        self.assertEqual(cache.svg_png("<svg/>", 1, 1), b"PNG:<svg/>:1x1")
+        cache.svg_png("<svg/>", 1, 1)
+        self.assertEqual(cache.misses, 2)
+
+    def test_default_dir_honours_xdg_cache_home(self) -> None:
+        """XDG_CACHE_HOME decides where sprites are stored."""
+        old = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = self.dir
+        try:
+            self.assertEqual(default_cache_dir(),
+                             os.path.join(self.dir, "rover-simulator", "sprites"))
+        finally:
+            if old is None:
+                del os.environ["XDG_CACHE_HOME"]
+            else:
+                os.environ["XDG_CACHE_HOME"] = old
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
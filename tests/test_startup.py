@@ -0,0 +1,65 @@
+# tests/test_startup.py
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+
+# Cumulative ``import basic`` time allowed by the cold-start check, in
+# microseconds. Measured at ~4.5 ms with ``-S``; importing ``re`` or
+# ``logging`` again would add 8-20 ms.
+STARTUP_BUDGET_US = 15_000
+
+# Modules the CLI must not load unless a flag asks for them
+HEAVY_MODULES = {"logging", "re", "argparse", "numpy", "tkinter", "streamlit"}
+
+
+def import_times(*args):
+    """
+    Run ``python -S -E -X importtime *args`` in ``src/`` (``-S`` keeps
+    site-packages hooks out of the measurement).
+
+    :return: Dict of module name -> cumulative import time in microseconds
+    """
+    proc = subprocess.run([sys.executable, "-S", "-E", "-X", "importtime", *args],
+                          cwd=SRC_DIR, capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup(unittest.TestCase):
+    """Cold-start regression checks for the CLI."""
+
+    def test_import_stays_lean(self) -> None:
+        """Importing ``basic`` loads no heavy modules and fits the budget."""
+        best = min(import_times("-c", "import basic")["basic"] for _ in range(3))
+        modules = import_times("-c", "import basic")
+        self.assertFalse(HEAVY_MODULES & modules.keys(), sorted(HEAVY_MODULES & modules.keys()))
+        self.assertLess(best, STARTUP_BUDGET_US)
+
+    def test_batch_run_skips_argparse(self) -> None:
+        """``basic.py --script FILE`` runs without argparse or logging."""
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as fh:
+            fh.write("PLACE 0,0,NORTH\nMOVE\nREPORT\n")
+        try:
+            modules = import_times("basic.py", "--script", fh.name)
+        finally:
+            os.unlink(fh.name)
+        self.assertFalse(HEAVY_MODULES & modules.keys(), sorted(HEAVY_MODULES & modules.keys()))
+
+    def test_logging_is_loaded_only_when_asked(self) -> None:
+        """``--verbose`` is what brings in ``logging``."""
+        proc = subprocess.run([sys.executable, "-S", "-E", "-X", "importtime", "basic.py", "--verbose"],
+                              cwd=SRC_DIR, input="EXIT\n", capture_output=True, text=True, check=True)
+        self.assertIn("| logging", proc.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,53 @@
+# tests/test_web_grid.py
+import unittest
+
+from src.robot import Robot
+from src.web_grid import build_grid_html, EMPTY_CELL, BLOCKED_CELL, ROVER_CELL
+from src.board import Board
+
+
+def cells(html):
+    """Split grid markup into its cell strings (top row first)."""
+    inner = html[html.index(">") + 1:-len("</div>")]
+    return ['<div class="cell' + c for c in inner.split('<div class="cell')[1:]]
+
+
+class TestBuildGridHtml(unittest.TestCase):
+    """Unit tests for the Streamlit grid markup builder."""
+
+    def test_empty_board(self) -> None:
+        """An unplaced rover gives 25 empty cells in five columns."""
+        html = build_grid_html(Robot(), placed=False)
+        self.assertIn("repeat(5, 1fr); gap: 10px;", html)
+        self.assertEqual(cells(html), [EMPTY_CELL] * 25)
+
+    def test_rover_cell_position(self) -> None:
+        """Row 0 is the top of the board (y = 4)."""
+        robot = Robot()
+        robot.place(3, 1, "WEST")
+        grid = cells(build_grid_html(robot, placed=True))
+        self.assertEqual(grid.index(ROVER_CELL["WEST"]), (4 - 1) * 5 + 3)
+        self.assertEqual(grid.count(EMPTY_CELL), 24)
+
+    def test_large_board_is_windowed_around_rover(self) -> None:
+        """Boards bigger than the viewport draw a bounded window."""
+        robot = Robot()
+        robot.place(2, 2, "NORTH")
+        robot.x, robot.y = 500, 9999          # pretend we are on a huge board
+        html = build_grid_html(robot, True, width=1000, height=10000, viewport=9)
+        grid = cells(html)
+        self.assertIn("repeat(9, 1fr); gap: 5px;", html)
+        self.assertEqual(len(grid), 81)
+        # x centred in the window, y clamped to the top edge
+        self.assertEqual(grid.index(ROVER_CELL["NORTH"]), 4)
+
+    def test_blocked_cells_are_drawn(self) -> None:
+        """Obstacles on the robot's board are drawn; its size sets the grid."""
+        robot = Robot(board=Board(3, 2, blocked=[(0, 0)]))
+        robot.place(2, 0, "WEST")
+        grid = cells(build_grid_html(robot, True))
+        self.assertEqual(grid, [EMPTY_CELL] * 3 + [BLOCKED_CELL, EMPTY_CELL, ROVER_CELL["WEST"]])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
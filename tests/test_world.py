@@ -0,0 +1,69 @@
+# tests/test_world.py
+import unittest
+
+from src.world import World
+from src.events import TracingSink
+from src.robot import Robot
+
+
+class TestWorld(unittest.TestCase):
+    """Unit tests for multi-robot simulation with collision detection."""
+
+    def setUp(self) -> None:
+        self.world = World()
+        self.a = self.world.add_robot()
+        self.b = self.world.add_robot()
+
+    def test_place_on_occupied_cell_is_rejected(self) -> None:
+        """Two robots cannot share a cell."""
+        self.assertTrue(self.world.place(self.a, 1, 1, "NORTH"))
+        self.assertFalse(self.world.place(self.b, 1, 1, "SOUTH"))
+        self.assertIsNone(self.world.report(self.b))
+        self.assertEqual(self.world.robot_at(1, 1), self.a)
+
+    def test_move_into_occupied_cell_is_ignored(self) -> None:
+        """A MOVE into another robot is ignored like a MOVE off the edge."""
+        self.world.place(self.a, 0, 0, "NORTH")
+        self.world.place(self.b, 0, 1, "EAST")
+        self.world.move(self.a)
+        self.assertEqual(self.world.report(self.a), "0,0,NORTH")
+        self.world.move(self.b)
+        self.world.move(self.a)
+        self.assertEqual(self.world.report(self.a), "0,1,NORTH")
+        self.assertEqual(self.world.occupancy, {5: self.a, 6: self.b})
+
+    def test_edges_still_apply(self) -> None:
+        """``Robot.move`` edge clamping is kept."""
+        self.world.place(self.a, 4, 4, "EAST")
+        self.world.move(self.a)
+        self.assertEqual(self.world.report(self.a), "4,4,EAST")
+
+    def test_replace_frees_old_cell(self) -> None:
+        """Re-placing a robot releases the cell it left."""
+        self.world.place(self.a, 2, 2, "NORTH")
+        self.world.place(self.a, 3, 3, "NORTH")
+        self.assertIsNone(self.world.robot_at(2, 2))
+        self.assertTrue(self.world.place(self.b, 2, 2, "NORTH"))
+
+    def test_tick_runs_in_id_order(self) -> None:
+        """Lower ids move first, so a follower can step into the freed cell."""
+        self.world.place(self.a, 0, 1, "NORTH")
+        self.world.place(self.b, 0, 0, "NORTH")
+        reports = self.world.tick({self.b: "MOVE", self.a: "MOVE"})
+        self.assertEqual(reports, {})
+        reports = self.world.tick({self.a: "REPORT", self.b: "REPORT"})
+        self.assertEqual(reports, {self.a: "0,2,NORTH", self.b: "0,1,NORTH"})
+
+    def test_collision_is_reported_to_sink(self) -> None:
+        """Blocked moves are emitted with reason ``cell occupied``."""
+        sink = TracingSink()
+        world = World()
+        rid = world.add_robot(Robot(sink))
+        other = world.add_robot()
+        world.tick({rid: ("PLACE", 0, 0, "EAST"), other: ("PLACE", 1, 0, "WEST")})
+        world.tick({rid: "MOVE"})
+        self.assertEqual(sink.events[-1], ("move", 0, 0, "EAST", "cell occupied"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)